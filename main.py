@@ -1,7 +1,11 @@
+from src.enrich import DETAIL_CACHE_DIRECTORY, DETAIL_CACHE_TTL
 from src.hh_api import HeadHunterAPI
-from src.vacancy import Vacancy
 from src.json_storage import JSONStorage
-from src.utils import (filter_vacancies, get_vacancies_by_salary, sort_vacancies, get_top_vacancies, print_vacancies)
+from src.pipeline import ingest_pipeline
+from src.response_cache import ResponseCache
+from src.sync import sync_vacancies
+from src.utils import print_vacancies
+from src.vacancy_query import VacancyQuery
 
 def user_interaction():
     """Функция для взаимодействия с пользователем"""
@@ -25,25 +29,36 @@ def user_interaction():
 
     filter_words = input("Введите ключевые слова для фильтрации вакансий (через пробел): ").strip().split()
     salary_range = input("Введите диапазон зарплат (например: 100000-150000): ").strip()
+    enrich_details = input("Загрузить полные описания вакансий? (да/нет): ").strip().lower() == 'да'
+    incremental = input("Загрузить только вакансии, опубликованные после прошлого запуска? (да/нет): ").strip().lower()
 
     print("\nЗагружаю вакансии...")
 
+    detail_cache = ResponseCache(DETAIL_CACHE_DIRECTORY, ttl=DETAIL_CACHE_TTL) if enrich_details else None
+
     try:
-        hh_vacancies_data = hh_api.get_vacancies(search_query, per_page)
-        vacancies_list = Vacancy.cast_to_object_list(hh_vacancies_data)
+        if incremental == 'да':
+            # Топ строится по вакансиям этого запроса, а не по всей базе с результатами прошлых запросов
+            vacancies_list = []
+            result = sync_vacancies(hh_api, storage, search_query, per_page, enrich_details, detail_cache,
+                                    on_batch=vacancies_list.extend)
+            print(f"Синхронизировано: новых и обновлённых {result.affected}, без изменений {result.skipped}")
+        else:
+            # Страницы сохраняются пакетами по мере загрузки, не дожидаясь всей выдачи
+            vacancies_list = []
+            result = ingest_pipeline(hh_api, storage, search_query, per_page, on_batch=vacancies_list.extend,
+                                     enrich_details=enrich_details, detail_cache=detail_cache)
 
-        for vacancy in vacancies_list:
-            storage.add_vacancy(vacancy)
+            print(f"Загружено {len(vacancies_list)} вакансий (новых: {result.affected}, дубликатов: {result.skipped})")
 
-        print(f"Загружено {len(vacancies_list)} вакансий")
+        if result.invalid:
+            print(f"Пропущено некорректных записей API: {result.invalid}")
 
-        filtered_vacancies = filter_vacancies(vacancies_list, filter_words)
-        ranged_vacancies = get_vacancies_by_salary(filtered_vacancies, salary_range)
-        sorted_vacancies = sort_vacancies(ranged_vacancies)
-        top_vacancies = get_top_vacancies(sorted_vacancies, top_n)
+        # Фильтры по словам и зарплате и выбор топа выполняются за один проход без промежуточных списков
+        top_list = VacancyQuery(vacancies_list).keywords(filter_words).salary(salary_range).top(top_n)
 
-        print(f"\nНайдено {len(top_vacancies)} вакансий из запрошенных {top_n}:")
-        print_vacancies(top_vacancies)
+        print(f"\nНайдено {len(top_list)} вакансий из запрошенных {top_n}:")
+        print_vacancies(top_list)
 
         while True:
             print("\nДополнительные возможности:")
@@ -56,8 +71,8 @@ def user_interaction():
             if choice == '1':
                 search_criteria = input("Введите ключевое слово для поиска в сохраненных вакансиях: ").strip()
                 if search_criteria:
-                    criteria = {'title': search_criteria.lower()}
-                    found_vacancies = storage.get_vacancies(criteria)
+                    # Слова ищутся по началу, как и прежний поиск по подстроке; каждое следующее слово сужает выдачу
+                    found_vacancies = storage.search(search_criteria.split(), match_all=True)
                     print(f"\nНайдено {len(found_vacancies)} вакансий:")
                     print_vacancies(found_vacancies)
 
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import math
+import urllib.parse
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Iterable, NamedTuple
+from src.base_api import AsyncBaseAPI
+from src.hh_api import MAX_PER_PAGE, MAX_RESULTS
+
+
+class TransportResponse(NamedTuple):
+    """Ответ транспорта: код статуса, заголовки (в нижнем регистре) и тело"""
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+Transport = Callable[[str, dict[str, Any], dict[str, str]], Awaitable[TransportResponse]]
+
+
+def _decode_chunked(body: bytes) -> bytes:
+    """Сборка тела ответа, переданного с Transfer-Encoding: chunked"""
+    result = bytearray()
+    position = 0
+    while True:
+        line_end = body.index(b'\r\n', position)
+        size = int(body[position:line_end].split(b';')[0], 16)
+        if size == 0:
+            return bytes(result)
+        start = line_end + 2
+        result += body[start:start + size]
+        position = start + size + 2
+
+
+async def http_transport(url: str, params: dict[str, Any], headers: dict[str, str],
+                         timeout: float = 10.0) -> TransportResponse:
+    """Транспорт по умолчанию: HTTP/1.1 GET на неблокирующих сокетах asyncio"""
+    parts = urllib.parse.urlsplit(url)
+    query = '&'.join(filter(None, [parts.query, urllib.parse.urlencode(params or {})]))
+    target = (parts.path or '/') + (f'?{query}' if query else '')
+    secure = parts.scheme == 'https'
+
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(parts.hostname, parts.port or (443 if secure else 80), ssl=secure or None), timeout
+    )
+    try:
+        request_lines = [f"GET {target} HTTP/1.1", f"Host: {parts.netloc}", "Accept: application/json",
+                         "Connection: close"]
+        request_lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(('\r\n'.join(request_lines) + '\r\n\r\n').encode('utf-8'))
+        await writer.drain()
+        raw = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+        with suppress(Exception):
+            await writer.wait_closed()
+
+    head, _, body = raw.partition(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('iso-8859-1').split('\r\n')
+    response_headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(':')
+        response_headers[name.strip().lower()] = value.strip()
+    if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+        body = _decode_chunked(body)
+    return TransportResponse(int(status_line.split()[1]), response_headers, body)
+
+
+class AsyncHeadHunterAPI(AsyncBaseAPI):
+    """Асинхронный клиент API HeadHunter
+
+    Число одновременных запросов ограничено семафором. Транспорт можно
+    подменить, например, на обращение к локальному тестовому серверу.
+    """
+
+    def __init__(self, base_url: str = "https://api.hh.ru/vacancies", max_concurrency: int = 10,
+                 transport: Transport | None = None):
+        self._base_url = base_url
+        self._headers = {'User-Agent': 'HH-User-Agent'}
+        self._max_concurrency = max_concurrency
+        self._transport = transport or http_transport
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Семафор, привязанный к текущему циклу событий"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _request(self, params: dict[str, Any]) -> TransportResponse:
+        """Запрос к API с ограничением числа одновременных запросов"""
+        async with self._get_semaphore():
+            try:
+                return await self._transport(self._base_url, params, self._headers)
+            except (OSError, asyncio.TimeoutError) as e:
+                raise ConnectionError(f"Ошибка при запросе к API: {e}")
+            except (ValueError, IndexError) as e:
+                # Оборванный или пустой ответ не разбирается транспортом
+                raise ConnectionError(f"Ошибка при запросе к API: некорректный ответ ({e})")
+
+    async def _connect(self) -> bool:
+        """Проверка подключения к API HH"""
+        try:
+            response = await self._request({})
+        except ConnectionError:
+            return False
+        return response.status == 200
+
+    async def _fetch_page(self, search_query: str, page: int, per_page: int) -> dict[str, Any]:
+        """Получение одной страницы результатов поиска"""
+        params = {
+            'text': search_query,
+            'area': 113,
+            'per_page': per_page,
+            'page': page
+        }
+        response = await self._request(params)
+        if response.status != 200:
+            raise ConnectionError(f"Ошибка при запросе к API: HTTP {response.status}")
+        try:
+            data = json.loads(response.body)
+        except ValueError as e:
+            raise ConnectionError(f"Ошибка при запросе к API: некорректный ответ ({e})")
+        if not isinstance(data, dict):
+            raise ConnectionError(f"Ошибка при запросе к API: некорректный ответ ({type(data).__name__})")
+        return data
+
+    async def get_vacancies(self, search_query: str, per_page: int = 100) -> list[dict[str, Any]]:
+        """Получение вакансий с hh.ru по поисковому запросу
+
+        per_page — общее количество вакансий; страницы после первой загружаются конкурентно.
+        """
+        total = min(per_page, MAX_RESULTS)
+        if total < 1:
+            return []
+        page_size = min(total, MAX_PER_PAGE)
+        first_page = await self._fetch_page(search_query, 0, page_size)
+        vacancies = list(first_page.get('items', []))
+
+        found = first_page.get('found', len(vacancies))
+        page_count = min(first_page.get('pages', 1), math.ceil(min(total, found) / page_size))
+        pages = await asyncio.gather(*(self._fetch_page(search_query, page, page_size)
+                                       for page in range(1, page_count)))
+        for page_data in pages:
+            vacancies.extend(page_data.get('items', []))
+
+        return vacancies[:total]
+
+    async def search_many(self, search_queries: Iterable[str], per_page: int = 100) -> dict[str, list[dict[str, Any]]]:
+        """Конкурентное выполнение нескольких поисковых запросов"""
+        search_queries = list(dict.fromkeys(search_queries))
+        results = await asyncio.gather(*(self.get_vacancies(query, per_page) for query in search_queries))
+        return dict(zip(search_queries, results))
@@ -1,6 +1,19 @@
 from abc import ABC, abstractmethod
 from src.vacancy import Vacancy
-from typing import Any
+from typing import Any, Iterable, Iterator, NamedTuple
+
+
+class BatchResult(NamedTuple):
+    """Результат пакетной операции: сколько записей обработано и сколько пропущено"""
+    affected: int
+    skipped: int
+
+
+class IngestResult(NamedTuple):
+    """Результат загрузки из API: сохранено, пропущено хранилищем и отброшено как некорректные записи"""
+    affected: int
+    skipped: int
+    invalid: int
 
 
 class BaseStorage(ABC):
@@ -16,12 +29,41 @@ class BaseStorage(ABC):
         """Получение вакансий по критериям"""
         pass
 
+    def iter_vacancies(self, criteria: dict[str, Any] = None) -> Iterator[Vacancy]:
+        """Потоковое получение вакансий по критериям"""
+        yield from self.get_vacancies(criteria)
+
+    @abstractmethod
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Пакетное добавление вакансий в хранилище"""
+        pass
+
+    @abstractmethod
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Добавление новых и обновление изменившихся вакансий; пропускаются не изменившиеся"""
+        pass
+
+    @abstractmethod
+    def get_watermark(self, search_query: str) -> str | None:
+        """Отметка последней синхронизации поискового запроса"""
+        pass
+
+    @abstractmethod
+    def set_watermark(self, search_query: str, watermark: str) -> None:
+        """Сохранение отметки последней синхронизации поискового запроса"""
+        pass
+
     @abstractmethod
     def delete_vacancy(self, vacancy: Vacancy) -> None:
         """Удаление вакансии из хранилища"""
         pass
 
+    @abstractmethod
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Пакетное удаление вакансий из хранилища"""
+        pass
+
     @abstractmethod
     def clear(self) -> None:
         """Очистка хранилища"""
-        pass
\ No newline at end of file
+        pass
@@ -0,0 +1,112 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, Iterator, overload
+from src.string_pool import StringPool
+from src.vacancy import Vacancy
+
+
+class CompactVacancyList(Sequence[Vacancy]):
+    """Компактное хранение большого набора вакансий в памяти
+
+    Вместо отдельного объекта на вакансию поля хранятся по столбцам:
+    зарплаты — в массивах array, работодатели, валюты и требования — номерами
+    в таблицах строк, остальные строки — в списках. Объект Vacancy создаётся
+    при обращении к элементу, поэтому набор можно передавать везде, где
+    ожидается последовательность вакансий, например в VacancyQuery.
+    """
+
+    __slots__ = ('_titles', '_urls', '_salary_from', '_salary_to', '_currency_codes', '_descriptions',
+                 '_requirement_codes', '_employer_codes', '_vacancy_ids', '_currencies', '_requirements',
+                 '_employers')
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()):
+        self._titles: list[str] = []
+        self._urls: list[str] = []
+        self._salary_from = array('q')
+        self._salary_to = array('q')
+        self._currency_codes = array('I')
+        self._descriptions: list[str] = []
+        self._requirement_codes = array('I')
+        self._employer_codes = array('I')
+        self._vacancy_ids: list[str] = []
+        self._currencies = StringPool()
+        self._requirements = StringPool()
+        self._employers = StringPool()
+        self.extend(vacancies)
+
+    def append(self, vacancy: Vacancy) -> None:
+        """Добавление вакансии в конец набора"""
+        self._titles.append(vacancy.title)
+        self._urls.append(vacancy.url)
+        self._salary_from.append(vacancy.salary_from)
+        self._salary_to.append(vacancy.salary_to)
+        self._currency_codes.append(self._currencies.code(vacancy.currency))
+        self._descriptions.append(vacancy.description)
+        self._requirement_codes.append(self._requirements.code(vacancy.requirements))
+        self._employer_codes.append(self._employers.code(vacancy.employer))
+        self._vacancy_ids.append(vacancy.vacancy_id)
+
+    def extend(self, vacancies: Iterable[Vacancy]) -> None:
+        """Добавление вакансий в конец набора"""
+        for vacancy in vacancies:
+            self.append(vacancy)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _row(self, position: int) -> Vacancy:
+        """Вакансия по неотрицательной позиции"""
+        return Vacancy.from_trusted(
+            self._titles[position],
+            self._urls[position],
+            self._salary_from[position],
+            self._salary_to[position],
+            self._currencies.value(self._currency_codes[position]),
+            self._descriptions[position],
+            self._requirements.value(self._requirement_codes[position]),
+            self._employers.value(self._employer_codes[position]),
+            self._vacancy_ids[position]
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> Vacancy:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Vacancy]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Vacancy | list[Vacancy]:
+        if isinstance(index, slice):
+            return [self._row(position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс вакансии вне диапазона")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        return map(self._row, range(len(self)))
+
+    def to_list(self) -> list[Vacancy]:
+        """Преобразование в список объектов Vacancy"""
+        return list(self)
+
+    @property
+    def salary_from(self) -> array:
+        return self._salary_from
+
+    @property
+    def salary_to(self) -> array:
+        return self._salary_to
+
+    @property
+    def employers(self) -> list[str]:
+        """Различные работодатели набора"""
+        return self._employers.values
+
+    @property
+    def currencies(self) -> list[str]:
+        """Различные валюты набора"""
+        return self._currencies.values
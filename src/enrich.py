@@ -0,0 +1,58 @@
+import html
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from src.hh_api import HeadHunterAPI
+from src.response_cache import ResponseCache
+
+DETAIL_CACHE_DIRECTORY = '.hh_cache/details'
+# Запись кэша описаний не устаревает по времени: новая версия вакансии получает новый ключ
+DETAIL_CACHE_TTL = float('inf')
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def html_to_text(value: str) -> str:
+    """Преобразование HTML-описания вакансии в простой текст"""
+    return ' '.join(html.unescape(TAG_PATTERN.sub(' ', value or '')).split())
+
+
+def detail_cache_key(vacancy_data: dict[str, Any]) -> str:
+    """Ключ кэша описания: идентификатор вакансии и время её последнего изменения"""
+    version = vacancy_data.get('updated_at') or vacancy_data.get('published_at') or ''
+    return ResponseCache.make_key(f"vacancy/{vacancy_data['id']}", {'updated_at': version})
+
+
+def enrich_vacancies(api: HeadHunterAPI, vacancies_data: list[dict[str, Any]], cache: ResponseCache | None = None,
+                     max_workers: int = 8) -> list[dict[str, Any]]:
+    """Дополнение результатов поиска полными описаниями из /vacancies/{id}
+
+    Описания загружаются пулом из max_workers потоков и кэшируются по
+    идентификатору и времени изменения вакансии, поэтому повторно
+    загружаются только новые и изменившиеся вакансии. Если описание
+    получить не удалось, вакансия остаётся с фрагментом из поиска.
+    """
+    def enrich(vacancy_data: dict[str, Any]) -> dict[str, Any]:
+        if not vacancy_data.get('id'):
+            return vacancy_data
+
+        detail = None
+        if cache is not None:
+            key = detail_cache_key(vacancy_data)
+            entry, fresh = cache.lookup(key)
+            if entry is not None and fresh:
+                detail = entry['body']
+        if detail is None:
+            try:
+                detail = api.get_vacancy(vacancy_data['id'])
+            except ConnectionError:
+                return vacancy_data
+            if cache is not None:
+                cache.store(key, {'description': detail.get('description', '')})
+
+        description = html_to_text(detail.get('description', ''))
+        return {**vacancy_data, 'description': description} if description else vacancy_data
+
+    if not vacancies_data:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(vacancies_data))) as executor:
+        return list(executor.map(enrich, vacancies_data))
@@ -0,0 +1,82 @@
+from __future__ import annotations
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager, suppress
+from types import ModuleType
+from typing import Any, Iterator, TextIO
+
+fcntl: ModuleType | None
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: блокировка действует только между потоками процесса
+    fcntl = None
+
+# Отметка состояния файла: время изменения, размер и inode. Атомарная замена всегда создаёт новый inode,
+# поэтому перезапись того же размера в пределах точности времени изменения тоже меняет отметку
+FileStamp = tuple[int, int, int]
+
+
+def stat_stamp(file_stat: os.stat_result) -> FileStamp:
+    """Отметка состояния файла по результату os.stat или os.fstat"""
+    return file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino
+
+
+class FileLock:
+    """Межпроцессная рекомендательная блокировка (fcntl.flock) с повторным входом в пределах процесса"""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file: TextIO | None = None
+
+    def __enter__(self) -> FileLock:
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._file = open(self._path, 'a', encoding='utf-8')
+                if fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            except BaseException:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._file is not None:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+
+@contextmanager
+def atomic_write(filename: str) -> Iterator[TextIO]:
+    """Запись во временный файл с последующей атомарной заменой целевого файла
+
+    Читатели видят либо старое, либо новое содержимое целиком, но никогда не
+    видят наполовину записанный файл.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temp_filename = tempfile.mkstemp(dir=directory, prefix=os.path.basename(filename) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp создаёт файл с правами 0600 — сохраняем права заменяемого файла
+        with suppress(OSError):
+            os.chmod(temp_filename, stat.S_IMODE(os.stat(filename).st_mode))
+        os.replace(temp_filename, filename)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(temp_filename)
+        raise
@@ -1,39 +1,214 @@
+import math
+import threading
+import time
 import requests
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Iterator
 from src.base_api import BaseAPI
+from src.rate_limiter import RateLimiter, parse_retry_after
+from src.response_cache import ResponseCache
+
+MAX_PER_PAGE = 100
+# hh.ru отдаёт не более 2000 вакансий на один поисковый запрос
+MAX_RESULTS = 2000
+RETRY_STATUSES = frozenset({429, 503})
+# Регион поиска по умолчанию — вся Россия
+DEFAULT_AREA = 113
+# Сортировка выдачи по дате публикации, от новых к старым
+ORDER_BY_PUBLICATION_TIME = 'publication_time'
+
 
 class HeadHunterAPI(BaseAPI):
     """Класс для работы с API HeadHunter"""
 
-    def __init__(self):
-        self._base_url = "https://api.hh.ru/vacancies"
+    def __init__(self, base_url: str = "https://api.hh.ru/vacancies", max_workers: int = 8,
+                 health_check_ttl: float = 300.0, cache: ResponseCache | None = None,
+                 rate_limiter: RateLimiter | None = None, max_retries: int = 5):
+        self._base_url = base_url.rstrip('/')
         self._headers = {'User-Agent': 'HH-User-Agent'}
+        self._max_workers = max_workers
+        # Одна сессия с пулом keep-alive соединений на всё время жизни клиента
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        # Одновременных запросов не больше, чем соединений в пуле, сколько бы поисков ни шло параллельно
+        self._connection_slots = threading.BoundedSemaphore(max_workers)
+        # Общий пул потоков для страниц всех поисков этого клиента, создаётся при первой необходимости
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._health_check_ttl = health_check_ttl
+        self._last_success: float | None = None
+        self._cache = cache
+        # Общий для всех потоков клиента планировщик запросов
+        self._rate_limiter = rate_limiter or RateLimiter()
+        self._max_retries = max_retries
+
+    def close(self) -> None:
+        """Остановка пула потоков и закрытие соединений пула"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._session.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Общий пул потоков для загрузки страниц"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            return self._executor
 
     def _connect(self) -> bool:
         """Проверка подключения к API HH"""
 
         try:
-            response = requests.get(self._base_url, headers=self._headers, timeout=5)
+            with self._connection_slots:
+                response = self._session.get(self._base_url, headers=self._headers, timeout=5)
             return response.status_code == 200
         except requests.RequestException:
             return False
 
-    def get_vacancies(self, search_query: str, per_page: int = 100) -> list[dict[str, Any]]:
-        """Получение вакансий с hh.ru по поисковому запросу"""
+    def _is_available(self) -> bool:
+        """Проверка доступности API с кэшированием результата на health_check_ttl секунд"""
+        if self._last_success is not None and time.monotonic() - self._last_success < self._health_check_ttl:
+            return True
         if not self._connect():
+            return False
+        self._last_success = time.monotonic()
+        return True
+
+    def _get_json(self, url: str, params: dict[str, Any], check_available: bool = False) -> Any:
+        """GET-запрос к API с использованием кэша ответов, если он подключён"""
+        cache = self._cache
+        entry = None
+        headers = self._headers
+        if cache is not None:
+            key = cache.make_key(url, params)
+            entry, fresh = cache.lookup(key)
+            if entry is not None and fresh:
+                return entry['body']
+            if entry is not None:
+                headers = {**self._headers, **cache.conditional_headers(entry)}
+
+        if check_available and not self._is_available():
             raise ConnectionError("Не удалось подключиться к API HH.ru")
 
+        try:
+            response = self._send(url, params, headers)
+            if cache is not None and entry is not None and response.status_code == 304:
+                data = entry['body']
+                cache.revalidated(key, entry)
+            else:
+                response.raise_for_status()
+                data = response.json()
+                if cache is not None:
+                    cache.store(key, data, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        except requests.RequestException as e:
+            self._last_success = None
+            raise ConnectionError(f"Ошибка при запросе к API: {e}")
+        # Успешный запрос подтверждает доступность API не хуже отдельной проверки
+        self._last_success = time.monotonic()
+        return data
+
+    def _get_object(self, url: str, params: dict[str, Any], check_available: bool = False) -> dict[str, Any]:
+        """GET-запрос к API, ответом на который должен быть JSON-объект"""
+        data = self._get_json(url, params, check_available)
+        if not isinstance(data, dict):
+            raise ConnectionError(f"Ошибка при запросе к API: некорректный ответ ({type(data).__name__})")
+        return data
+
+    def _send(self, url: str, params: dict[str, Any], headers: dict[str, str]) -> requests.Response:
+        """Отправка запроса через планировщик с повторами при 429/503 и сетевых ошибках"""
+        attempt = 0
+        while True:
+            self._rate_limiter.acquire()
+            try:
+                with self._connection_slots:
+                    response = self._session.get(url, params=params, headers=headers)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self._max_retries:
+                    raise
+                self._rate_limiter.backoff(attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    self._rate_limiter.on_success()
+                    return response
+                if attempt >= self._max_retries:
+                    return response
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                self._rate_limiter.on_throttle(retry_after)
+                self._rate_limiter.backoff(attempt, retry_after)
+            attempt += 1
+
+    def _fetch_page(self, search_query: str, page: int, per_page: int, check_available: bool = False,
+                    date_from: str | None = None, area: int = DEFAULT_AREA, date_to: str | None = None,
+                    order_by: str | None = None) -> dict[str, Any]:
+        """Получение одной страницы результатов поиска"""
         params = {
             'text': search_query,
-            'area': 113,
+            'area': area,
             'per_page': per_page,
-            'page': 0
+            'page': page
         }
+        if date_from:
+            params['date_from'] = date_from
+        if date_to:
+            params['date_to'] = date_to
+        if order_by:
+            params['order_by'] = order_by
+        return self._get_object(self._base_url, params, check_available)
 
-        try:
-            response = requests.get(self._base_url, params=params, headers=self._headers)
-            response.raise_for_status()
-            data = response.json()
-            return data.get('items', [])
-        except requests.RequestException as e:
-            raise ConnectionError(f"Ошибка при запросе к API: {e}")
\ No newline at end of file
+    def get_vacancy(self, vacancy_id: str) -> dict[str, Any]:
+        """Получение полного описания вакансии по её идентификатору"""
+        return self._get_object(f"{self._base_url}/{vacancy_id}", {})
+
+    def iter_pages(self, search_query: str, per_page: int = 100, date_from: str | None = None,
+                   area: int = DEFAULT_AREA, date_to: str | None = None,
+                   order_by: str | None = None) -> Iterator[list[dict[str, Any]]]:
+        """Постраничная выдача вакансий по мере загрузки
+
+        Первая страница показывает, сколько найдено, остальные загружаются
+        параллельно и выдаются по порядку номеров, как только готовы.
+        Параметры те же, что у get_vacancies.
+        """
+        total = min(per_page, MAX_RESULTS)
+        if total < 1:
+            return
+        page_size = min(total, MAX_PER_PAGE)
+        filters: dict[str, Any] = {'date_from': date_from, 'area': area, 'date_to': date_to, 'order_by': order_by}
+        # Доступность API проверяется, только если первую страницу придётся загружать из сети
+        first_page = self._fetch_page(search_query, 0, page_size, check_available=True, **filters)
+        items = first_page.get('items', [])[:total]
+        remaining = total - len(items)
+        yield items
+
+        found = first_page.get('found', len(items))
+        page_count = min(first_page.get('pages', 1), math.ceil(min(total, found) / page_size))
+        if page_count > 1:
+            # map возвращает страницы в порядке номеров, независимо от порядка завершения запросов;
+            # при досрочном завершении выдачи ещё не начатые запросы отменяются
+            pages = self._get_executor().map(
+                lambda page: self._fetch_page(search_query, page, page_size, **filters),
+                range(1, page_count)
+            )
+            for page_data in pages:
+                if remaining <= 0:
+                    break
+                items = page_data.get('items', [])[:remaining]
+                remaining -= len(items)
+                yield items
+
+    def get_vacancies(self, search_query: str, per_page: int = 100, date_from: str | None = None,
+                      area: int = DEFAULT_AREA, date_to: str | None = None,
+                      order_by: str | None = None) -> list[dict[str, Any]]:
+        """Получение вакансий с hh.ru по поисковому запросу
+
+        per_page — общее количество вакансий. Первая страница показывает,
+        сколько найдено, остальные загружаются параллельно. date_from
+        и date_to (ISO 8601) ограничивают выдачу вакансиями, опубликованными
+        в этом промежутке, area — идентификатор региона hh.ru, order_by —
+        сортировка выдачи, например ORDER_BY_PUBLICATION_TIME.
+        """
+        pages = self.iter_pages(search_query, per_page, date_from, area, date_to, order_by)
+        return [item for page in pages for item in page]
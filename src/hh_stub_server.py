@@ -0,0 +1,260 @@
+from __future__ import annotations
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable
+from urllib.parse import parse_qs, urlsplit
+from src.hh_api import MAX_RESULTS, ORDER_BY_PUBLICATION_TIME
+from src.sync import PUBLISHED_AT_FORMAT
+
+DEFAULT_PER_PAGE = 20
+TITLES = ('Python разработчик', 'Java разработчик', 'Backend разработчик', 'Data Scientist', 'DevOps инженер',
+          'Frontend разработчик', 'Аналитик данных', 'QA инженер', 'Golang разработчик', 'Тимлид')
+EMPLOYERS = ('Яндекс', 'Сбер', 'Тинькофф', 'VK', 'Ozon', 'Авито', 'Лаборатория Касперского', 'МТС', 'Selectel')
+SKILLS = ('Python', 'Django', 'SQL', 'PostgreSQL', 'Docker', 'Kubernetes', 'Linux', 'Git', 'Kafka', 'Java', 'Go')
+CURRENCIES = ('RUR', 'RUR', 'RUR', 'USD', 'EUR')
+MIN_DATE = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def generate_vacancies(count: int = 1000, seed: int = 0) -> list[dict[str, Any]]:
+    """Синтетические вакансии в формате выдачи hh.ru, от новых к старым"""
+    rng = random.Random(seed)
+    newest = datetime(2024, 5, 20, 12, 0, tzinfo=timezone(timedelta(hours=3)))
+    vacancies = []
+    for number in range(count):
+        salary_from = rng.choice((None, rng.randrange(50, 300) * 1000))
+        salary_to = rng.choice((None, (salary_from or 100000) + rng.randrange(0, 150) * 1000))
+        skills = rng.sample(SKILLS, 3)
+        employer = rng.choice(EMPLOYERS)
+        vacancy_id = str(90000000 + number)
+        vacancies.append({
+            'id': vacancy_id,
+            'name': rng.choice(TITLES),
+            'alternate_url': f"https://hh.ru/vacancy/{vacancy_id}",
+            'salary': None if salary_from is None and salary_to is None else {
+                'from': salary_from, 'to': salary_to, 'currency': rng.choice(CURRENCIES), 'gross': False
+            },
+            'snippet': {
+                'requirement': f"Опыт работы с {skills[0]} и {skills[1]}.",
+                'responsibility': f"Разработка и поддержка сервисов на {skills[2]}."
+            },
+            'employer': {'id': str(EMPLOYERS.index(employer) + 1), 'name': employer},
+            'area': {'id': '113', 'name': 'Россия'},
+            'published_at': (newest - timedelta(minutes=7 * number)).strftime(PUBLISHED_AT_FORMAT),
+        })
+    return vacancies
+
+
+def load_fixtures(filename: str) -> list[dict[str, Any]]:
+    """Загрузка записанных ответов hh.ru: список вакансий или страница с ключом items"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    items = data.get('items', []) if isinstance(data, dict) else data
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError(f"Файл {filename} не содержит списка вакансий hh.ru")
+    return items
+
+
+def _parse_date(value: str) -> datetime | None:
+    """Разбор даты в формате ISO 8601; дата без часового пояса считается датой в UTC"""
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов к /vacancies и /vacancies/{id}"""
+
+    server: StubHTTPServer
+
+    def do_GET(self) -> None:
+        stub = self.server.stub
+        throttled = stub.before_request()
+        if throttled:
+            self._send_json(429, {'errors': [{'type': 'too_many_requests'}]},
+                            {'Retry-After': str(stub.retry_after)})
+            return
+
+        parts = urlsplit(self.path)
+        params = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+        path = parts.path.rstrip('/')
+        if path == '/vacancies':
+            self._send_json(*stub.search(params))
+        elif path.startswith('/vacancies/'):
+            self._send_json(*stub.detail(path.rsplit('/', 1)[1]))
+        else:
+            self._send_json(404, {'errors': [{'type': 'not_found'}]})
+
+    def _send_json(self, status: int, body: Any, headers: dict[str, str] | None = None) -> None:
+        """Отправка ответа в формате JSON"""
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args: Any) -> None:
+        """Журнал запросов отключён, чтобы не мешать замерам"""
+        pass
+
+
+class StubHTTPServer(ThreadingHTTPServer):
+    """HTTP-сервер со ссылкой на состояние заглушки"""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], stub: HHStubServer):
+        super().__init__(address, StubRequestHandler)
+        self.stub = stub
+
+
+class HHStubServer:
+    """Локальная заглушка API hh.ru для тестов и замеров без сети
+
+    Поддерживает поиск с постраничной выдачей, found/pages, фильтры date_from
+    и date_to, сортировку order_by=publication_time и получение вакансии
+    по идентификатору. latency задаёт задержку каждого ответа,
+    throttle_every — каждый какой запрос получает ответ 429.
+    """
+
+    def __init__(self, vacancies: Iterable[dict[str, Any]] | None = None, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, throttle_every: int = 0, retry_after: int = 0):
+        self.vacancies = list(vacancies) if vacancies is not None else generate_vacancies()
+        self._by_id = {str(vacancy['id']): vacancy for vacancy in self.vacancies if 'id' in vacancy}
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.request_count = 0
+        self.throttled_count = 0
+        self._lock = threading.Lock()
+        self._server = StubHTTPServer((host, port), self)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Адрес поиска вакансий, который передаётся в HeadHunterAPI"""
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode('ascii')
+        return f"http://{host}:{port}/vacancies"
+
+    def start(self) -> HHStubServer:
+        """Запуск сервера в фоновом потоке"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Обслуживание запросов в текущем потоке до прерывания"""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        """Остановка сервера"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> HHStubServer:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def before_request(self) -> bool:
+        """Учёт запроса и задержка ответа; True, если запрос нужно отклонить с кодом 429"""
+        with self._lock:
+            self.request_count += 1
+            throttled = bool(self.throttle_every) and self.request_count % self.throttle_every == 0
+            self.throttled_count += throttled
+        if self.latency:
+            time.sleep(self.latency)
+        return throttled
+
+    def search(self, params: dict[str, str]) -> tuple[int, dict[str, Any]]:
+        """Ответ на поиск вакансий с постраничной выдачей"""
+        try:
+            per_page = int(params.get('per_page', DEFAULT_PER_PAGE))
+            page = int(params.get('page', 0))
+        except ValueError:
+            return 400, {'errors': [{'type': 'bad_argument'}]}
+        # Как и hh.ru, заглушка отдаёт не более MAX_RESULTS вакансий на запрос
+        if per_page < 1 or page < 0 or (page + 1) * per_page > MAX_RESULTS:
+            return 400, {'errors': [{'type': 'bad_argument', 'value': 'page'}]}
+
+        words = params.get('text', '').lower().split()
+        date_from = _parse_date(params['date_from']) if params.get('date_from') else None
+        date_to = _parse_date(params['date_to']) if params.get('date_to') else None
+        found = []
+        for vacancy in self.vacancies:
+            snippet = vacancy.get('snippet') or {}
+            text = ' '.join([vacancy.get('name', ''), snippet.get('requirement') or '',
+                             snippet.get('responsibility') or '']).lower()
+            if not all(word in text for word in words):
+                continue
+            if date_from is not None or date_to is not None:
+                published_at = _parse_date(vacancy.get('published_at', ''))
+                if (published_at is None or (date_from is not None and published_at < date_from)
+                        or (date_to is not None and published_at > date_to)):
+                    continue
+            found.append(vacancy)
+        if params.get('order_by') == ORDER_BY_PUBLICATION_TIME:
+            found.sort(key=lambda vacancy: _parse_date(vacancy.get('published_at', '')) or MIN_DATE, reverse=True)
+
+        return 200, {
+            'items': found[page * per_page:(page + 1) * per_page],
+            'found': len(found),
+            'pages': math.ceil(min(len(found), MAX_RESULTS) / per_page),
+            'page': page,
+            'per_page': per_page,
+        }
+
+    def detail(self, vacancy_id: str) -> tuple[int, dict[str, Any]]:
+        """Ответ с полным описанием вакансии"""
+        vacancy = self._by_id.get(vacancy_id)
+        if vacancy is None:
+            return 404, {'errors': [{'type': 'not_found'}]}
+        snippet = vacancy.get('snippet') or {}
+        description = vacancy.get('description') or (
+            f"<p>{snippet.get('responsibility') or ''}</p><p><strong>Требования:</strong> "
+            f"{snippet.get('requirement') or ''}</p>"
+        )
+        return 200, {**vacancy, 'description': description}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Запуск заглушки API hh.ru из командной строки"""
+    parser = argparse.ArgumentParser(description="Локальная заглушка API hh.ru")
+    parser.add_argument('--host', default='127.0.0.1', help="адрес сервера")
+    parser.add_argument('--port', type=int, default=8000, help="порт сервера")
+    parser.add_argument('--count', type=int, default=1000, help="количество синтетических вакансий")
+    parser.add_argument('--seed', type=int, default=0, help="зерно генератора синтетических вакансий")
+    parser.add_argument('--fixtures', help="файл с записанными ответами hh.ru вместо синтетических вакансий")
+    parser.add_argument('--latency', type=float, default=0.0, help="задержка ответа, секунд")
+    parser.add_argument('--throttle-every', type=int, default=0, help="отвечать 429 на каждый N-й запрос")
+    parser.add_argument('--retry-after', type=int, default=1, help="значение Retry-After для ответов 429")
+    args = parser.parse_args(argv)
+
+    vacancies = load_fixtures(args.fixtures) if args.fixtures else generate_vacancies(args.count, args.seed)
+    stub = HHStubServer(vacancies, args.host, args.port, args.latency, args.throttle_every, args.retry_after)
+    print(f"Заглушка API hh.ru: {stub.base_url} ({len(stub.vacancies)} вакансий)")
+    stub.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from typing import Any, Iterable
+from src.base_storage import BaseStorage, IngestResult
+from src.hh_api import DEFAULT_AREA, HeadHunterAPI
+from src.json_storage import JSONStorage
+from src.vacancy import Vacancy
+
+
+def vacancy_key(vacancy_data: dict[str, Any]) -> str:
+    """Ключ вакансии hh.ru для устранения дубликатов: id, а при его отсутствии — ссылка"""
+    return str(vacancy_data.get('id') or vacancy_data.get('alternate_url', ''))
+
+
+def fetch_many(api: HeadHunterAPI, search_queries: Iterable[str], areas: Iterable[int] = (DEFAULT_AREA,),
+               per_page: int = 100, max_workers: int = 4) -> list[dict[str, Any]]:
+    """Конкурентная загрузка вакансий по всем сочетаниям запросов и регионов без дубликатов
+
+    Вакансия, найденная несколькими запросами, остаётся в результате один раз,
+    в порядке первого появления.
+    """
+    searches = list(dict.fromkeys(product(search_queries, areas)))
+    if not searches:
+        return []
+
+    unique: dict[str, dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(searches))) as executor:
+        results = executor.map(lambda search: api.get_vacancies(search[0], per_page, area=search[1]), searches)
+        for vacancies_data in results:
+            for vacancy_data in vacancies_data:
+                unique.setdefault(vacancy_key(vacancy_data), vacancy_data)
+    return list(unique.values())
+
+
+def ingest_vacancies(api: HeadHunterAPI, storage: BaseStorage, search_queries: Iterable[str],
+                     areas: Iterable[int] = (DEFAULT_AREA,), per_page: int = 100,
+                     max_workers: int = 4) -> IngestResult:
+    """Загрузка вакансий по нескольким запросам и сохранение одной пакетной операцией"""
+    vacancies_data = fetch_many(api, search_queries, areas, per_page, max_workers)
+    report = Vacancy.cast_with_report(vacancies_data)
+    result = storage.add_vacancies(report.vacancies)
+    return IngestResult(result.affected, result.skipped, len(report.errors))
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Пакетная загрузка вакансий из командной строки"""
+    parser = argparse.ArgumentParser(description="Пакетная загрузка вакансий с hh.ru по нескольким запросам")
+    parser.add_argument('queries', nargs='+', help="поисковые запросы")
+    parser.add_argument('--area', type=int, action='append', dest='areas', help="идентификатор региона hh.ru")
+    parser.add_argument('--per-page', type=int, default=100, help="количество вакансий на запрос")
+    parser.add_argument('--workers', type=int, default=4, help="количество одновременных запросов")
+    parser.add_argument('--storage', default='vacancies.json', help="файл хранилища")
+    args = parser.parse_args(argv)
+
+    api = HeadHunterAPI()
+    try:
+        result = ingest_vacancies(api, JSONStorage(args.storage), args.queries, args.areas or [DEFAULT_AREA],
+                                  args.per_page, args.workers)
+    finally:
+        api.close()
+    print(f"Сохранено новых вакансий: {result.affected}, дубликатов: {result.skipped}, "
+          f"некорректных: {result.invalid}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,91 +1,394 @@
 import json
 import os
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
 from src.vacancy import Vacancy
-from src.base_storage import BaseStorage
+from src.base_storage import BaseStorage, BatchResult
+from src.file_utils import FileLock, FileStamp, atomic_write, stat_stamp
+from src.query import compile_criteria
+from src.text_index import InvertedIndex
+
+INDEX_SUFFIX = '.idx'
+TEXT_INDEX_SUFFIX = '.fts'
+LOCK_SUFFIX = '.lock'
+META_SUFFIX = '.meta'
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def iter_json_array(f: TextIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Any]:
+    """Потоковый разбор JSON-массива: элементы читаются из файла по частям"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    started = False
+
+    while True:
+        chunk = f.read(chunk_size)
+        buffer = buffer[position:] + chunk
+        position = 0
+
+        while True:
+            # Пропуск пробелов, открывающей скобки и разделителей между элементами
+            while position < len(buffer):
+                char = buffer[position]
+                if char.isspace() or (started and char == ','):
+                    position += 1
+                elif not started and char == '[':
+                    started = True
+                    position += 1
+                else:
+                    break
+            if position >= len(buffer):
+                break
+            if not started or buffer[position] == ']':
+                return
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Элемент прочитан не полностью — нужна следующая часть файла
+                break
+            yield item
+
+        if not chunk:
+            return
+
 
 class JSONStorage(BaseStorage):
-    """Класс для работы с JSON-файлом как хранилищем вакансий"""
+    """Класс для работы с JSON-файлом как хранилищем вакансий
+
+    Изменения выполняются под межпроцессной блокировкой и записываются через
+    временный файл с атомарной заменой, поэтому чтение обходится без блокировки.
+    """
 
     def __init__(self, filename: str = 'vacancies.json'):
         self._filename = filename
+        self._lock = FileLock(filename + LOCK_SUFFIX)
+        self._index_filename = filename + INDEX_SUFFIX
+        self._index: dict[str, int] | None = None
+        self._index_stamp: FileStamp | None = None
+        self._text_index_filename = filename + TEXT_INDEX_SUFFIX
+        self._text_index: InvertedIndex | None = None
+        self._text_index_stamp: FileStamp | None = None
+        self._meta_filename = filename + META_SUFFIX
+        # Кэш прочитанных записей и построенных вакансий, сбрасывается по отметке файла и счётчику записей
+        self._generation = 0
+        self._records_cache: tuple[tuple[int, int, int, int], list[dict[str, Any]]] | None = None
+        self._snapshot_cache: tuple[tuple[int, int, int, int], dict[str, int], list[Vacancy]] | None = None
         self._ensure_file_exists()
 
     def _ensure_file_exists(self) -> None:
         """Создание файла, если он не существует"""
-        if not os.path.exists(self._filename):
-            with open(self._filename, 'w', encoding='utf-8') as f:
-                json.dump([], f)
+        with self._lock:
+            if not os.path.exists(self._filename):
+                with atomic_write(self._filename) as f:
+                    json.dump([], f)
 
     def _read_vacancies(self) -> list[dict[str, Any]]:
-        """Чтение вакансий из файла"""
+        """Чтение вакансий из файла
+
+        Повреждённый файл не считается пустым: иначе следующая запись под
+        блокировкой заменила бы его одними новыми вакансиями.
+        """
+        if self._records_cache is not None and self._records_cache[0] == self._cache_stamp():
+            return list(self._records_cache[1])
+
         try:
+            # Файл заменяется атомарно, поэтому открытый дескриптор — целостный снимок
             with open(self._filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+                stamp = *self._stamp_of(f), self._generation
+                vacancies_data = json.load(f)
+        except FileNotFoundError:
             return []
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Файл вакансий {self._filename} повреждён: {e}") from e
+        self._records_cache = stamp, vacancies_data
+        return list(vacancies_data)
 
     def _write_vacancies(self, vacancies_data: list[dict[str, Any]]) -> None:
         """Запись вакансий в файл"""
-        with open(self._filename, 'w', encoding='utf-8') as f:
+        with atomic_write(self._filename) as f:
             json.dump(vacancies_data, f, ensure_ascii=False, indent=2)
+        self._generation += 1
+        self._records_cache = self._cache_stamp(), list(vacancies_data)
+        self._store_index(self._build_index(vacancies_data), self._file_stamp())
+
+    def _iter_records(self) -> Iterator[dict[str, Any]]:
+        """Потоковое чтение вакансий из файла без загрузки его целиком"""
+        if self._records_cache is not None and self._records_cache[0] == self._cache_stamp():
+            yield from self._records_cache[1]
+            return
+
+        try:
+            with open(self._filename, 'r', encoding='utf-8') as f:
+                yield from iter_json_array(f)
+        except FileNotFoundError:
+            return
+
+    def _cache_stamp(self) -> tuple[int, int, int, int]:
+        """Отметка для проверки актуальности кэша: отметка файла и счётчик записей"""
+        return *self._file_stamp(), self._generation
+
+    def _load_snapshot(self) -> tuple[dict[str, int], list[Vacancy]]:
+        """Позиции ключей и объекты вакансий, построенные из одного прочтения файла
+
+        Чтение идёт без блокировки, поэтому позиции и вакансии из разных прочтений
+        могли бы относиться к разным версиям файла, заменённого другим процессом.
+        """
+        stamp = self._cache_stamp()
+        if self._snapshot_cache is None or self._snapshot_cache[0] != stamp:
+            try:
+                records = self._read_vacancies()
+            except ValueError:
+                # Чтение повреждённого файла даёт пустой набор, изменения же его отклоняются
+                records = []
+            self._snapshot_cache = stamp, self._build_index(records), Vacancy.from_dicts(records)
+        return self._snapshot_cache[1], self._snapshot_cache[2]
+
+    def _load_vacancies(self) -> list[Vacancy]:
+        """Получение объектов вакансий из кэша или из файла"""
+        return self._load_snapshot()[1]
+
+    @staticmethod
+    def _record_key(vacancy_dict: dict[str, Any]) -> str:
+        """Ключ вакансии для поиска дубликатов"""
+        return str(vacancy_dict['url'])
+
+    def _file_stamp(self) -> FileStamp:
+        """Отметка состояния файла данных: время изменения, размер и inode"""
+        try:
+            return stat_stamp(os.stat(self._filename))
+        except OSError:
+            return 0, 0, 0
+
+    @staticmethod
+    def _stamp_of(f: TextIO) -> FileStamp:
+        """Отметка состояния уже открытого файла"""
+        return stat_stamp(os.fstat(f.fileno()))
+
+    def _build_index(self, vacancies_data: list[dict[str, Any]]) -> dict[str, int]:
+        """Построение индекса: ключ вакансии -> позиция в файле"""
+        return {self._record_key(v): position for position, v in enumerate(vacancies_data)}
+
+    def _load_index(self, stamp: FileStamp) -> dict[str, int] | None:
+        """Загрузка индекса из файла, если он соответствует файлу данных"""
+        try:
+            with open(self._index_filename, 'r', encoding='utf-8') as f:
+                index_data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None
+        if not isinstance(index_data, dict) or index_data.get('stamp') != list(stamp):
+            return None
+        return index_data.get('keys')
+
+    def _store_index(self, index: dict[str, int], stamp: FileStamp) -> None:
+        """Сохранение индекса в памяти и рядом с файлом данных"""
+        self._index, self._index_stamp = index, stamp
+        try:
+            with atomic_write(self._index_filename) as f:
+                json.dump({'stamp': list(stamp), 'keys': index}, f, ensure_ascii=False)
+        except OSError:
+            pass
+
+    def _get_index(self) -> dict[str, int]:
+        """Получение индекса ключей с перестроением при рассинхронизации"""
+        stamp = self._file_stamp()
+        if self._index is not None and self._index_stamp == stamp:
+            return self._index
 
-    def _vacancy_exists(self, vacancy: Vacancy, vacancies_data: list[dict[str, Any]]) -> bool:
-        """Проверка существования вакансии"""
-        vacancy_dict = vacancy.to_dict()
-        for existing_vacancy in vacancies_data:
-            if (existing_vacancy['title'] == vacancy_dict['title'] and
-                    existing_vacancy['employer'] == vacancy_dict['employer'] and
-                    existing_vacancy['url'] == vacancy_dict['url']):
-                return True
-        return False  # ← ИСПРАВЛЕНИЕ: возвращаем False после проверки ВСЕХ вакансий
+        index = self._load_index(stamp)
+        if index is None:
+            index = self._build_index(self._read_vacancies())
+            self._store_index(index, stamp)
+        else:
+            self._index, self._index_stamp = index, stamp
+        return index
+
+    @staticmethod
+    def _record_text(vacancy_dict: dict[str, Any]) -> str:
+        """Текст вакансии для полнотекстового поиска"""
+        return ' '.join(vacancy_dict.get(field) or '' for field in ('title', 'description', 'requirements'))
+
+    def _load_text_index(self, stamp: FileStamp) -> InvertedIndex | None:
+        """Полнотекстовый индекс из памяти или из файла, если он соответствует отметке"""
+        if self._text_index is not None and self._text_index_stamp == stamp:
+            return self._text_index
+
+        text_index = InvertedIndex.load(self._text_index_filename, stamp)
+        if text_index is not None:
+            self._text_index, self._text_index_stamp = text_index, stamp
+        return text_index
+
+    def _store_text_index(self, text_index: InvertedIndex, stamp: FileStamp) -> None:
+        """Сохранение полнотекстового индекса в памяти и рядом с файлом данных"""
+        self._text_index, self._text_index_stamp = text_index, stamp
+        try:
+            text_index.save(self._text_index_filename, stamp)
+        except OSError:
+            pass
+
+    def _get_text_index(self) -> InvertedIndex:
+        """Получение полнотекстового индекса с перестроением при рассинхронизации"""
+        stamp = self._file_stamp()
+        text_index = self._load_text_index(stamp)
+        if text_index is None:
+            text_index = InvertedIndex()
+            for record in self._iter_records():
+                text_index.add(self._record_key(record), self._record_text(record))
+            self._store_text_index(text_index, stamp)
+        return text_index
+
+    def _update_text_index(self, stamp_before: FileStamp, added: Iterable[dict[str, Any]] = (),
+                           removed: Iterable[str] = (), cleared: bool = False) -> None:
+        """Инкрементальное обновление полнотекстового индекса после изменения файла данных"""
+        text_index = self._load_text_index(stamp_before)
+        if text_index is None:
+            # Индекс ещё не строился или уже устарел — он будет перестроен при первом поиске
+            return
+
+        if cleared:
+            text_index.clear()
+        for key in removed:
+            text_index.remove(key)
+        for record in added:
+            text_index.add(self._record_key(record), self._record_text(record))
+        self._keep_text_index(text_index, self._file_stamp())
+
+    def _keep_text_index(self, text_index: InvertedIndex, stamp: FileStamp) -> None:
+        """Сохранение обновлённого индекса: файл данных и так переписывается целиком, индекс — вместе с ним"""
+        self._store_text_index(text_index, stamp)
+
+    def search(self, words: list[str], match_all: bool = False) -> list[Vacancy]:
+        """Полнотекстовый поиск по названию, описанию и требованиям через инвертированный индекс"""
+        keys = self._get_text_index().search(words, match_all)
+        if not keys:
+            return []
+
+        index, vacancies = self._load_snapshot()
+        return [vacancies[position] for position in sorted(index[key] for key in keys if key in index)]
 
     def add_vacancy(self, vacancy: Vacancy) -> None:
         """Добавление вакансии в JSON-файл"""
-        vacancies_data = self._read_vacancies()
-        vacancy_dict = vacancy.to_dict()
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Пакетное добавление вакансий: одно чтение и одна запись файла"""
+        vacancies_dicts = [vacancy.to_dict() for vacancy in vacancies]
+        new_records: dict[str, dict[str, Any]] = {}
+        skipped = 0
+
+        with self._lock:
+            index = self._get_index()
+            for vacancy_dict in vacancies_dicts:
+                key = self._record_key(vacancy_dict)
+                if key in index or key in new_records:
+                    skipped += 1
+                    continue
+                new_records[key] = vacancy_dict
+
+            if new_records:
+                stamp_before = self._file_stamp()
+                self._write_vacancies(self._read_vacancies() + list(new_records.values()))
+                self._update_text_index(stamp_before, added=new_records.values())
+        return BatchResult(len(new_records), skipped)
 
-        if not self._vacancy_exists(vacancy, vacancies_data):
-            vacancies_data.append(vacancy_dict)
-            self._write_vacancies(vacancies_data)
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Добавление новых и замена изменившихся вакансий на месте за одну запись файла"""
+        # При повторе ключа во входных данных побеждает последняя версия вакансии
+        incoming = {self._record_key(record): record for record in (vacancy.to_dict() for vacancy in vacancies)}
+        changed: list[dict[str, Any]] = []
+
+        with self._lock:
+            index = self._get_index()
+            vacancies_data = self._read_vacancies()
+            for key, record in incoming.items():
+                position = index.get(key)
+                if position is None:
+                    vacancies_data.append(record)
+                elif vacancies_data[position] != record:
+                    vacancies_data[position] = record
+                else:
+                    continue
+                changed.append(record)
+
+            if changed:
+                stamp_before = self._file_stamp()
+                self._write_vacancies(vacancies_data)
+                # Добавление в инвертированный индекс заменяет прежний текст вакансии
+                self._update_text_index(stamp_before, added=changed)
+        return BatchResult(len(changed), len(incoming) - len(changed))
+
+    def _read_meta(self) -> dict[str, Any]:
+        """Чтение служебных данных хранилища (отметок синхронизации)"""
+        try:
+            with open(self._meta_filename, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+        return meta if isinstance(meta, dict) else {}
+
+    def _write_meta(self, meta: dict[str, Any]) -> None:
+        """Запись служебных данных хранилища (вызывается под блокировкой)"""
+        with atomic_write(self._meta_filename) as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    def get_watermark(self, search_query: str) -> str | None:
+        """Отметка последней синхронизации поискового запроса"""
+        watermark = self._read_meta().get('watermarks', {}).get(search_query)
+        return watermark if isinstance(watermark, str) else None
+
+    def set_watermark(self, search_query: str, watermark: str) -> None:
+        """Сохранение отметки последней синхронизации поискового запроса"""
+        with self._lock:
+            meta = self._read_meta()
+            meta.setdefault('watermarks', {})[search_query] = watermark
+            self._write_meta(meta)
+
+    def _reset_watermarks(self) -> None:
+        """Сброс отметок синхронизации: после очистки запросы снова загружаются целиком"""
+        meta = self._read_meta()
+        if meta.pop('watermarks', None) is not None:
+            self._write_meta(meta)
 
     def get_vacancies(self, criteria: dict[str, Any] = None) -> list[Vacancy]:
         """Получение вакансий по критериям"""
-        vacancies_data = self._read_vacancies()
-        vacancies = [Vacancy.from_dict(data) for data in vacancies_data]
+        vacancies = self._load_vacancies()
 
         if not criteria:
-            return vacancies
-
-        filtered_vacancies = []
-        for vacancy in vacancies:
-            matches = True
-            for key, value in criteria.items():
-                if hasattr(vacancy, key):
-                    attr_value = getattr(vacancy, key)
-                    if value not in str(attr_value).lower():
-                        matches = False
-                        break
-                else:
-                    matches = False
-                    break
+            return list(vacancies)
 
-            if matches:
-                filtered_vacancies.append(vacancy)
+        return list(filter(compile_criteria(criteria), vacancies))
 
-        return filtered_vacancies
+    def iter_vacancies(self, criteria: dict[str, Any] = None) -> Iterator[Vacancy]:
+        """Потоковое получение вакансий по критериям"""
+        if self._snapshot_cache is not None and self._snapshot_cache[0] == self._cache_stamp():
+            vacancies: Iterable[Vacancy] = self._snapshot_cache[2]
+        else:
+            vacancies = (Vacancy.from_dict(data, trusted=True) for data in self._iter_records())
+
+        yield from filter(compile_criteria(criteria), vacancies)
 
     def delete_vacancy(self, vacancy: Vacancy) -> None:
         """Удаление вакансии из JSON-файла"""
-        vacancies_data = self._read_vacancies()
-        vacancy_dict = vacancy.to_dict()
+        self.delete_vacancies([vacancy])
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Пакетное удаление вакансий: одно чтение и одна запись файла"""
+        keys = {self._record_key(vacancy.to_dict()) for vacancy in vacancies}
+
+        with self._lock:
+            index = self._get_index()
+            keys_to_delete = {key for key in keys if key in index}
 
-        vacancies_data = [v for v in vacancies_data
-                          if not (v['title'] == vacancy_dict['title'] and
-                                  v['employer'] == vacancy_dict['employer'] and
-                                  v['url'] == vacancy_dict['url'])]
-        self._write_vacancies(vacancies_data)
+            if keys_to_delete:
+                stamp_before = self._file_stamp()
+                vacancies_data = self._read_vacancies()
+                self._write_vacancies([v for v in vacancies_data if self._record_key(v) not in keys_to_delete])
+                self._update_text_index(stamp_before, removed=keys_to_delete)
+        return BatchResult(len(keys_to_delete), len(keys) - len(keys_to_delete))
 
     def clear(self) -> None:
         """Очистка JSON-файла"""
-        self._write_vacancies([])
\ No newline at end of file
+        with self._lock:
+            stamp_before = self._file_stamp()
+            self._write_vacancies([])
+            self._update_text_index(stamp_before, cleared=True)
+            self._reset_watermarks()
\ No newline at end of file
@@ -0,0 +1,264 @@
+import json
+import os
+from typing import Any, Iterable, Iterator, TextIO
+from src.base_storage import BatchResult
+from src.file_utils import FileStamp, atomic_write
+from src.vacancy import Vacancy
+from src.json_storage import JSONStorage
+from src.text_index import InvertedIndex
+
+CLEAR_MARKER = '_clear'
+DELETED_MARKER = '_deleted'
+# Размер блока, которым журнал читается с конца при поиске начала недописанной строки
+TAIL_CHUNK_SIZE = 4096
+
+
+class JSONLinesStorage(JSONStorage):
+    """Класс для работы с журналом JSON Lines как хранилищем вакансий
+
+    Добавление дописывает одну строку в конец файла, удаление и очистка
+    записывают надгробия. Уплотнение переписывает файл, оставляя только
+    актуальные записи, и запускается явно или по порогу мёртвых строк.
+    Дозапись и уплотнение выполняются под межпроцессной блокировкой,
+    уплотнённый журнал атомарно заменяет прежний. Изменения полнотекстового
+    индекса после дозаписи хранятся в памяти и записываются в файл при
+    уплотнении и в close.
+    """
+
+    def __init__(self, filename: str = 'vacancies.jsonl', compact_threshold: int = 1000):
+        self._compact_threshold = compact_threshold
+        # Ключ актуальной вакансии -> номер строки журнала, в которой она записана
+        self._live: dict[str, int] = {}
+        self._line_count = 0
+        self._synced_stamp: FileStamp | None = None
+        # Полнотекстовый индекс изменён в памяти, но ещё не записан в файл
+        self._text_index_dirty = False
+        super().__init__(filename)
+
+    def _ensure_file_exists(self) -> None:
+        """Создание пустого журнала, если он не существует"""
+        open(self._filename, 'a', encoding='utf-8').close()
+
+    @staticmethod
+    def _iter_log(f: TextIO) -> Iterator[tuple[int, dict[str, Any] | None]]:
+        """Построчное чтение журнала: номер строки и запись (None для повреждённой строки)"""
+        for line_number, line in enumerate(f):
+            # Недописанная последняя строка не считается записью
+            if not line.endswith('\n'):
+                return
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError:
+                yield line_number, None
+
+    def _replay(self) -> None:
+        """Воспроизведение журнала с учётом надгробий"""
+        try:
+            with open(self._filename, 'r', encoding='utf-8') as f:
+                self._replay_from(f)
+        except FileNotFoundError:
+            self._live, self._line_count, self._synced_stamp = {}, 0, None
+
+    def _replay_from(self, f: TextIO) -> None:
+        """Воспроизведение журнала из открытого файла"""
+        # Отметка снимается до чтения: строки, дописанные во время чтения, приведут к повторной синхронизации
+        stamp = self._stamp_of(f)
+        live: dict[str, int] = {}
+        line_count = 0
+        for line_number, record in self._iter_log(f):
+            line_count = line_number + 1
+            if record is None:
+                continue
+            if CLEAR_MARKER in record:
+                live.clear()
+            elif DELETED_MARKER in record:
+                live.pop(record[DELETED_MARKER], None)
+            else:
+                live[self._record_key(record)] = line_number
+
+        self._live = live
+        self._line_count = line_count
+        self._synced_stamp = stamp
+
+    @property
+    def _dead_lines(self) -> int:
+        """Количество строк журнала, не содержащих актуальных вакансий"""
+        return self._line_count - len(self._live)
+
+    def _sync(self) -> None:
+        """Обновление карты ключей, если журнал изменён извне"""
+        if self._file_stamp() != self._synced_stamp:
+            self._replay()
+
+    def _discard_torn_tail(self) -> None:
+        """Отбрасывание недописанной последней строки, чтобы новая запись не склеилась с ней"""
+        with open(self._filename, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b'\n':
+                return
+            position = end
+            while position > 0:
+                start = max(position - TAIL_CHUNK_SIZE, 0)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            f.truncate(position)
+
+    def _append(self, records: list[dict[str, Any]]) -> None:
+        """Дописывание строк в конец журнала (вызывается под блокировкой)"""
+        self._discard_torn_tail()
+        with open(self._filename, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records))
+        self._line_count += len(records)
+        self._generation += 1
+        self._synced_stamp = self._file_stamp()
+
+    def _maybe_compact(self) -> None:
+        """Уплотнение журнала при превышении порога мёртвых строк"""
+        if self._dead_lines >= self._compact_threshold and self._dead_lines > len(self._live):
+            self.compact()
+
+    def _iter_records(self) -> Iterator[dict[str, Any]]:
+        """Потоковое чтение актуальных вакансий из журнала"""
+        try:
+            # Карта ключей и чтение строк опираются на один и тот же открытый файл,
+            # поэтому одновременное уплотнение другим процессом не смешивает версии журнала
+            with open(self._filename, 'r', encoding='utf-8') as f:
+                if self._stamp_of(f) != self._synced_stamp:
+                    self._replay_from(f)
+                    f.seek(0)
+                live_lines = set(self._live.values())
+                for line_number, record in self._iter_log(f):
+                    if line_number in live_lines and record is not None:
+                        yield record
+        except FileNotFoundError:
+            return
+
+    def _read_vacancies(self) -> list[dict[str, Any]]:
+        """Чтение актуальных вакансий из журнала"""
+        return list(self._iter_records())
+
+    def _write_vacancies(self, vacancies_data: list[dict[str, Any]]) -> None:
+        """Перезапись журнала заданными вакансиями"""
+        with atomic_write(self._filename) as f:
+            f.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in vacancies_data))
+        self._generation += 1
+        self._live = {self._record_key(record): line_number for line_number, record in enumerate(vacancies_data)}
+        self._line_count = len(vacancies_data)
+        self._synced_stamp = self._file_stamp()
+
+    def _keep_text_index(self, text_index: InvertedIndex, stamp: FileStamp) -> None:
+        """Обновлённый индекс остаётся в памяти, чтобы дозапись не переписывала файл индекса целиком"""
+        self._text_index, self._text_index_stamp = text_index, stamp
+        self._text_index_dirty = True
+
+    def flush_text_index(self) -> None:
+        """Запись полнотекстового индекса, изменённого в памяти, если он соответствует журналу"""
+        if self._text_index_dirty and self._text_index is not None and self._text_index_stamp == self._file_stamp():
+            self._store_text_index(self._text_index, self._text_index_stamp)
+        self._text_index_dirty = False
+
+    def compact(self) -> None:
+        """Уплотнение журнала: удаление надгробий и перекрытых записей"""
+        with self._lock:
+            stamp_before = self._file_stamp()
+            self._write_vacancies(self._read_vacancies())
+            # Содержимое не изменилось — полнотекстовому индексу нужна только новая отметка
+            self._update_text_index(stamp_before)
+            self.flush_text_index()
+
+    def close(self) -> None:
+        """Запись отложенных изменений полнотекстового индекса"""
+        with self._lock:
+            self.flush_text_index()
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """Добавление вакансии одной строкой в конец журнала"""
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Пакетное добавление вакансий одной дозаписью в журнал"""
+        vacancies_dicts = [vacancy.to_dict() for vacancy in vacancies]
+        records: dict[str, dict[str, Any]] = {}
+        skipped = 0
+
+        with self._lock:
+            self._sync()
+            for vacancy_dict in vacancies_dicts:
+                key = self._record_key(vacancy_dict)
+                if key in self._live or key in records:
+                    skipped += 1
+                    continue
+                records[key] = vacancy_dict
+
+            if records:
+                first_line = self._line_count
+                stamp_before = self._file_stamp()
+                self._append(list(records.values()))
+                for line_number, key in enumerate(records, first_line):
+                    self._live[key] = line_number
+                self._update_text_index(stamp_before, added=records.values())
+        return BatchResult(len(records), skipped)
+
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Дозапись новых и изменившихся вакансий: при воспроизведении последняя строка с ключом перекрывает прежние"""
+        incoming = {self._record_key(record): record for record in (vacancy.to_dict() for vacancy in vacancies)}
+        changed: dict[str, dict[str, Any]] = {}
+
+        with self._lock:
+            self._sync()
+            stored = {}
+            if any(key in self._live for key in incoming):
+                stored = {self._record_key(record): record for record in self._iter_records()
+                          if self._record_key(record) in incoming}
+            for key, record in incoming.items():
+                if stored.get(key) != record:
+                    changed[key] = record
+
+            if changed:
+                first_line = self._line_count
+                stamp_before = self._file_stamp()
+                self._append(list(changed.values()))
+                for line_number, key in enumerate(changed, first_line):
+                    self._live[key] = line_number
+                self._update_text_index(stamp_before, added=changed.values())
+                self._maybe_compact()
+        return BatchResult(len(changed), len(incoming) - len(changed))
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """Удаление вакансии записью надгробия"""
+        self.delete_vacancies([vacancy])
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Пакетное удаление вакансий одной дозаписью надгробий"""
+        keys = {self._record_key(vacancy.to_dict()) for vacancy in vacancies}
+
+        with self._lock:
+            self._sync()
+            keys_to_delete = [key for key in keys if key in self._live]
+
+            if keys_to_delete:
+                stamp_before = self._file_stamp()
+                self._append([{DELETED_MARKER: key} for key in keys_to_delete])
+                for key in keys_to_delete:
+                    del self._live[key]
+                self._update_text_index(stamp_before, removed=keys_to_delete)
+                self._maybe_compact()
+        return BatchResult(len(keys_to_delete), len(keys) - len(keys_to_delete))
+
+    def clear(self) -> None:
+        """Очистка журнала записью маркера очистки"""
+        with self._lock:
+            self._sync()
+            stamp_before = self._file_stamp()
+            self._append([{CLEAR_MARKER: True}])
+            self._live.clear()
+            self._update_text_index(stamp_before, cleared=True)
+            self._reset_watermarks()
+            self._maybe_compact()
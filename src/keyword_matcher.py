@@ -0,0 +1,92 @@
+from typing import Iterable
+from src.text_index import WORD_PATTERN, normalize_word
+from src.vacancy import Vacancy
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Нормализация ключевого слова так же, как текста вакансии"""
+    return ' '.join(keyword.lower().replace('ё', 'е').split())
+
+
+class KeywordMatcher:
+    """Проверка вакансий сразу на набор ключевых слов, построенная один раз на запрос
+
+    Текст вакансии разбивается на слова один раз (Vacancy.search_tokens).
+    Каждое различное слово текста сверяется с ключевыми словами один раз
+    за время жизни проверки, дальше вакансия проверяется операциями над
+    множествами, поэтому её стоимость почти не зависит от количества ключевых слов.
+    Ключевые фразы из нескольких слов ищутся в тексте целиком.
+    """
+
+    def __init__(self, keywords: Iterable[str], match_all: bool = False, whole_word: bool = False,
+                 stem: bool = False):
+        keywords = list(dict.fromkeys(filter(None, map(normalize_keyword, keywords))))
+        self._match_all = match_all
+        self._whole_word = whole_word and not stem
+        self._stem = stem
+        # Ключевые слова из одного слова проверяются по словам текста, остальные — поиском в тексте
+        self._words = [keyword for keyword in keywords if WORD_PATTERN.fullmatch(keyword)]
+        self._phrases = [keyword for keyword in keywords if not WORD_PATTERN.fullmatch(keyword)]
+        self._word_set = frozenset(self._words)
+        self._patterns = [normalize_word(word) for word in self._words] if stem else self._words
+        # Уже проверенные слова текста и слова, подходящие под каждое ключевое слово
+        self._known: set[str] = set()
+        self._hits: list[set[str]] = [set() for _ in self._words]
+        self._any_hits: set[str] = set()
+
+    def __bool__(self) -> bool:
+        return bool(self._words or self._phrases)
+
+    def _learn(self, tokens: set[str] | frozenset[str]) -> None:
+        """Проверка новых слов текста по всем ключевым словам; результат запоминается"""
+        for token in tokens:
+            for hits, pattern in zip(self._hits, self._patterns):
+                if (token.startswith(pattern) if self._stem else pattern in token):
+                    hits.add(token)
+                    self._any_hits.add(token)
+        self._known.update(tokens)
+
+    def _words_match(self, tokens: frozenset[str]) -> bool:
+        """Проверка слов текста по ключевым словам из одного слова"""
+        if self._whole_word:
+            return self._word_set <= tokens if self._match_all else not self._word_set.isdisjoint(tokens)
+
+        unknown = tokens.difference(self._known)
+        if unknown:
+            self._learn(unknown)
+        if self._match_all:
+            return all(not hits.isdisjoint(tokens) for hits in self._hits)
+        return not self._any_hits.isdisjoint(tokens)
+
+    def _phrase_found(self, phrase: str, text: str) -> bool:
+        """Поиск ключевой фразы в тексте; для целых слов фраза не должна быть частью другого слова"""
+        if not self._whole_word and not self._stem:
+            return phrase in text
+        start = text.find(phrase)
+        while start != -1:
+            before = text[start - 1] if start else ' '
+            end = start + len(phrase)
+            after = text[end] if end < len(text) else ' '
+            if not (before.isalnum() or before == '_') and (self._stem or not (after.isalnum() or after == '_')):
+                return True
+            start = text.find(phrase, start + 1)
+        return False
+
+    def match(self, vacancy: Vacancy) -> bool:
+        """Проверка вакансии: хотя бы одно или все ключевые слова, в зависимости от match_all"""
+        if not self:
+            return True
+
+        if self._match_all:
+            return ((not self._words or self._words_match(vacancy.search_tokens))
+                    and all(self._phrase_found(phrase, vacancy.search_text) for phrase in self._phrases))
+        return ((bool(self._words) and self._words_match(vacancy.search_tokens))
+                or any(self._phrase_found(phrase, vacancy.search_text) for phrase in self._phrases))
+
+    __call__ = match
+
+    def filter(self, vacancies: Iterable[Vacancy]) -> list[Vacancy]:
+        """Вакансии, прошедшие проверку"""
+        if not self:
+            return list(vacancies)
+        return list(filter(self.match, vacancies))
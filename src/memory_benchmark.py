@@ -0,0 +1,77 @@
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable
+from src.compact_vacancies import CompactVacancyList
+from src.hh_stub_server import generate_vacancies
+from src.vacancy import Vacancy
+
+
+def separate_strings(records: list[dict[str, Any]]) -> list[Vacancy]:
+    """Вакансии через конструктор с валидацией: у каждой свои копии строк, как до интернирования"""
+    return [Vacancy(**record) for record in records]
+
+
+def interned_strings(records: list[dict[str, Any]]) -> list[Vacancy]:
+    """Вакансии, загруженные как из хранилища: работодатель и валюта интернированы"""
+    return Vacancy.from_dicts(records)
+
+
+def compact_list(records: list[dict[str, Any]]) -> CompactVacancyList:
+    """Компактный набор вакансий с полями по столбцам"""
+    return CompactVacancyList(Vacancy.from_dicts(records))
+
+
+REPRESENTATIONS: dict[str, Callable[[list[dict[str, Any]]], Any]] = {
+    'отдельные строки': separate_strings,
+    'интернированные строки': interned_strings,
+    'CompactVacancyList': compact_list,
+}
+
+
+def measure_bytes_per_vacancy(build: Callable[[list[dict[str, Any]]], Any], payload: str) -> float:
+    """Память, которую занимает набор вакансий после загрузки из JSON, в байтах на вакансию
+
+    Записи разбираются из JSON при включённом tracemalloc, поэтому в замер
+    попадают все строки, которые набор удерживает после удаления записей.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        records = json.loads(payload)
+        count = len(records)
+        vacancies = build(records)
+        del records
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del vacancies
+    return current / count if count else 0.0
+
+
+def run_benchmark(count: int = 100000, seed: int = 0) -> dict[str, float]:
+    """Байт на вакансию для каждого представления на синтетических вакансиях"""
+    vacancies = Vacancy.cast_with_report(generate_vacancies(count, seed)).vacancies
+    payload = json.dumps([vacancy.to_dict() for vacancy in vacancies], ensure_ascii=False)
+    del vacancies
+    return {name: measure_bytes_per_vacancy(build, payload) for name, build in REPRESENTATIONS.items()}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Замер памяти на вакансию из командной строки"""
+    parser = argparse.ArgumentParser(description="Замер памяти, занимаемой вакансиями")
+    parser.add_argument('--count', type=int, default=100000, help="количество синтетических вакансий")
+    parser.add_argument('--seed', type=int, default=0, help="зерно генератора синтетических вакансий")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.count, args.seed)
+    baseline = results['отдельные строки']
+    print(f"Вакансий: {args.count}")
+    for name, bytes_per_vacancy in results.items():
+        print(f"{name:<24} {bytes_per_vacancy:8.0f} байт на вакансию ({bytes_per_vacancy / baseline:.0%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator
+from src.base_storage import BaseStorage, IngestResult
+from src.enrich import enrich_vacancies
+from src.hh_api import DEFAULT_AREA, HeadHunterAPI
+from src.response_cache import ResponseCache
+from src.vacancy import CastReport, Vacancy
+
+BATCH_SIZE = 200
+# Между стадиями лежит не больше QUEUE_SIZE страниц, поэтому память не растёт с размером выдачи
+QUEUE_SIZE = 4
+POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+def _put(output: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Передача элемента следующей стадии; False, если конвейер остановлен"""
+    while not stop.is_set():
+        try:
+            output.put(item, timeout=POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _drain(source: queue.Queue, stop: threading.Event) -> Iterator[Any]:
+    """Чтение элементов предыдущей стадии до маркера завершения или остановки конвейера"""
+    while not stop.is_set():
+        try:
+            item = source.get(timeout=POLL_INTERVAL)
+        except queue.Empty:
+            continue
+        if item is _DONE:
+            return
+        yield item
+
+
+def _run_stage(produce: Callable[[], Iterable[Any]], output: queue.Queue, stop: threading.Event,
+               errors: list[BaseException]) -> None:
+    """Выполнение стадии в отдельном потоке с передачей ошибки в поток записи"""
+    try:
+        for item in produce():
+            if not _put(output, item, stop):
+                return
+    except BaseException as e:
+        errors.append(e)
+    _put(output, _DONE, stop)
+
+
+def ingest_pipeline(api: HeadHunterAPI, storage: BaseStorage, search_query: str, per_page: int = 100,
+                    area: int = DEFAULT_AREA, batch_size: int = BATCH_SIZE, queue_size: int = QUEUE_SIZE,
+                    on_batch: Callable[[list[Vacancy]], Any] | None = None, enrich_details: bool = False,
+                    detail_cache: ResponseCache | None = None) -> IngestResult:
+    """Потоковая загрузка: страницы загружаются, разбираются и сохраняются одновременно
+
+    Загрузка страниц и разбор выполняются в отдельных потоках и связаны
+    с записью очередями ограниченного размера. Хранилище получает вакансии
+    пакетами по batch_size, on_batch вызывается для каждого записанного пакета.
+    С enrich_details стадия разбора дополняет страницу полными описаниями.
+    Некорректные записи API не сохраняются и учитываются в поле invalid результата.
+    """
+    def parse(page: list[dict[str, Any]]) -> CastReport:
+        if enrich_details:
+            page = enrich_vacancies(api, page, detail_cache)
+        return Vacancy.cast_with_report(page)
+
+    pages: queue.Queue = queue.Queue(queue_size)
+    parsed: queue.Queue = queue.Queue(queue_size)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    stages = [
+        threading.Thread(target=_run_stage, daemon=True,
+                         args=(lambda: api.iter_pages(search_query, per_page, area=area), pages, stop, errors)),
+        threading.Thread(target=_run_stage, daemon=True,
+                         args=(lambda: map(parse, _drain(pages, stop)), parsed, stop, errors)),
+    ]
+    for stage in stages:
+        stage.start()
+
+    affected = skipped = invalid = 0
+    batch: list[Vacancy] = []
+
+    def flush() -> None:
+        nonlocal affected, skipped
+        result = storage.add_vacancies(batch)
+        affected += result.affected
+        skipped += result.skipped
+        if on_batch is not None:
+            on_batch(list(batch))
+        batch.clear()
+
+    try:
+        for report in _drain(parsed, stop):
+            batch.extend(report.vacancies)
+            invalid += len(report.errors)
+            if len(batch) >= batch_size:
+                flush()
+        if errors:
+            raise errors[0]
+        if batch:
+            flush()
+    finally:
+        # Остановка стадий, если запись прервалась ошибкой
+        stop.set()
+        for stage in stages:
+            stage.join()
+    return IngestResult(affected, skipped, invalid)
@@ -0,0 +1,68 @@
+import operator
+from typing import Any, Callable, NamedTuple
+from src.vacancy import Vacancy
+
+# Оператор -> функция сравнения значения поля вакансии с аргументом условия
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'lt': operator.lt,
+    'lte': operator.le,
+    'in': lambda field_value, values: field_value in values,
+    'contains': lambda field_value, substring: substring in str(field_value).lower(),
+}
+
+
+class Condition(NamedTuple):
+    """Условие запроса: поле вакансии, оператор и аргумент"""
+    field: str
+    operator: str
+    value: Any
+
+
+def is_vacancy_field(field: str) -> bool:
+    """Проверка, что поле является свойством вакансии"""
+    return isinstance(getattr(Vacancy, field, None), property)
+
+
+def parse_criteria(criteria: dict[str, Any]) -> list[Condition]:
+    """Разбор критериев в список условий
+
+    Значение-словарь задаёт операторы: {'salary_from': {'gte': 150000}}.
+    Любое другое значение означает поиск подстроки без учёта регистра.
+    """
+    conditions = []
+    for field, spec in criteria.items():
+        if not isinstance(spec, dict):
+            spec = {'contains': spec}
+        for operator_name, value in spec.items():
+            if operator_name not in OPERATORS:
+                raise ValueError(f"Неизвестный оператор запроса: {operator_name}")
+            if operator_name == 'contains':
+                value = str(value).lower()
+            elif operator_name == 'in':
+                value = frozenset(value)
+            conditions.append(Condition(field, operator_name, value))
+    return conditions
+
+
+def compile_criteria(criteria: dict[str, Any] | None) -> Callable[[Vacancy], bool]:
+    """Компиляция критериев в предикат, проверяющий вакансию за один проход"""
+    conditions = parse_criteria(criteria or {})
+    if not conditions:
+        return lambda vacancy: True
+    # Условие на несуществующее поле не выполняется ни для одной вакансии
+    if not all(is_vacancy_field(condition.field) for condition in conditions):
+        return lambda vacancy: False
+
+    checks = [
+        (operator.attrgetter(condition.field), OPERATORS[condition.operator], condition.value)
+        for condition in conditions
+    ]
+
+    def predicate(vacancy: Vacancy) -> bool:
+        return all(compare(get_value(vacancy), value) for get_value, compare, value in checks)
+
+    return predicate
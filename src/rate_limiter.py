@@ -0,0 +1,95 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+# Допуск на погрешность вычислений с плавающей точкой при сравнении времени и количества токенов
+EPSILON = 1e-9
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Разбор заголовка Retry-After: число секунд или HTTP-дата"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Потокобезопасный token bucket с адаптивной скоростью
+
+    Скорость растёт аддитивно, пока запросы проходят успешно, и
+    мультипликативно снижается при ответах 429/503, поэтому держится
+    чуть ниже лимита сервера. Retry-After приостанавливает выдачу
+    токенов всем потокам клиента.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 10, min_rate: float = 0.5, max_rate: float = 50.0,
+                 increase: float = 1.0, decrease: float = 0.5, base_delay: float = 0.5, max_delay: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self._rate = rate
+        self._burst = burst
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._increase = increase
+        self._decrease = decrease
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Текущая скорость выдачи токенов, запросов в секунду"""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        """Пополнение корзины за прошедшее время"""
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def acquire(self) -> None:
+        """Ожидание токена на выполнение одного запроса"""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= EPSILON:
+                    if self._tokens >= 1 - EPSILON:
+                        self._tokens = max(self._tokens - 1, 0.0)
+                        return
+                    wait = (1 - self._tokens) / self._rate
+            self._sleep(wait)
+
+    def on_success(self) -> None:
+        """Учёт успешного ответа: скорость растёт примерно на increase запросов/с за секунду"""
+        with self._lock:
+            self._rate = min(self._max_rate, self._rate + self._increase / self._rate)
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """Учёт ответа 429/503: снижение скорости и пауза на Retry-After"""
+        with self._lock:
+            self._rate = max(self._min_rate, self._rate * self._decrease)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, self._clock() + retry_after)
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> None:
+        """Ожидание перед повторной попыткой: Retry-After либо экспоненциальная задержка со случайным разбросом"""
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, self._base_delay)
+        else:
+            delay = random.uniform(0, min(self._max_delay, self._base_delay * 2 ** attempt))
+        self._sleep(delay)
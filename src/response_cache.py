@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import suppress
+from typing import Any
+from src.file_utils import atomic_write
+
+ENTRY_SUFFIX = '.json'
+
+
+class ResponseCache:
+    """Дисковый кэш ответов API с TTL, условной перепроверкой и вытеснением давно не использованных записей
+
+    Каждая запись хранится в отдельном файле. Время последнего обращения
+    к записи — это время изменения её файла, по нему выбираются записи
+    для вытеснения при превышении max_bytes. Общий размер кэша считается
+    один раз и дальше учитывается в памяти, каталог просматривается
+    целиком только при вытеснении. Кэшем пользуются потоки параллельной
+    загрузки страниц, поэтому счётчики, учёт размера и вытеснение
+    выполняются под блокировкой.
+    """
+
+    def __init__(self, directory: str = '.hh_cache', ttl: float = 3600.0, max_bytes: int = 50 * 1024 * 1024):
+        self._directory = directory
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._stats: Counter[str] = Counter()
+        # Общий размер файлов записей; None — ещё не подсчитан
+        self._total_bytes: int | None = None
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(url: str, params: dict[str, Any]) -> str:
+        """Ключ записи по URL и нормализованным параметрам запроса"""
+        normalized = sorted((str(name), ' '.join(str(value).lower().split())) for name, value in params.items())
+        payload = json.dumps([url, normalized], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Путь к файлу записи"""
+        return os.path.join(self._directory, key + ENTRY_SUFFIX)
+
+    def lookup(self, key: str) -> tuple[dict[str, Any] | None, bool]:
+        """Поиск записи: сама запись (или None) и признак того, что TTL ещё не истёк"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None, False
+
+        # Обновление времени обращения для вытеснения давно не использованных записей
+        with suppress(OSError):
+            os.utime(path)
+        fresh = time.time() - entry.get('stored_at', 0) < self._ttl
+        if fresh:
+            with self._lock:
+                self._stats['hits'] += 1
+        return entry, fresh
+
+    def store(self, key: str, body: Any, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Сохранение ответа, полученного из сети"""
+        with self._lock:
+            self._stats['misses'] += 1
+            self._write(key, {'stored_at': time.time(), 'etag': etag, 'last_modified': last_modified, 'body': body})
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+            if self._total_bytes > self._max_bytes:
+                self._evict()
+
+    def revalidated(self, key: str, entry: dict[str, Any]) -> None:
+        """Продление записи после ответа 304 Not Modified"""
+        with self._lock:
+            self._stats['revalidations'] += 1
+            self._write(key, {**entry, 'stored_at': time.time()})
+
+    @staticmethod
+    def conditional_headers(entry: dict[str, Any]) -> dict[str, str]:
+        """Заголовки условного запроса для перепроверки устаревшей записи"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    @staticmethod
+    def _file_size(path: str) -> int:
+        """Размер файла записи; 0, если файла нет"""
+        try:
+            return os.stat(path).st_size
+        except OSError:
+            return 0
+
+    def _write(self, key: str, entry: dict[str, Any]) -> None:
+        """Запись файла кэша с учётом изменения общего размера (вызывается под блокировкой)"""
+        path = self._path(key)
+        size_before = self._file_size(path)
+        with suppress(OSError):
+            with atomic_write(path) as f:
+                json.dump(entry, f, ensure_ascii=False)
+        if self._total_bytes is not None:
+            self._total_bytes += self._file_size(path) - size_before
+
+    def _scan(self) -> list[tuple[float, int, str]]:
+        """Время обращения, размер и путь каждой записи кэша"""
+        entries = []
+        with os.scandir(self._directory) as scan:
+            for item in scan:
+                if item.name.endswith(ENTRY_SUFFIX):
+                    with suppress(OSError):
+                        stat = item.stat()
+                        entries.append((stat.st_mtime, stat.st_size, item.path))
+        return entries
+
+    def _evict(self) -> None:
+        """Удаление давно не использованных записей при превышении размера кэша (вызывается под блокировкой)"""
+        # Каталог просматривается заново: записи могли добавить или удалить другие процессы
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            with suppress(OSError):
+                os.remove(path)
+            total -= size
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        """Удаление всех записей кэша"""
+        with self._lock:
+            for name in os.listdir(self._directory):
+                if name.endswith(ENTRY_SUFFIX):
+                    with suppress(OSError):
+                        os.remove(os.path.join(self._directory, name))
+            self._total_bytes = 0
+
+    def stats(self) -> dict[str, float]:
+        """Статистика обращений: попадания, промахи, перепроверки и доля ответов без загрузки тела"""
+        with self._lock:
+            hits, misses, revalidations = self._stats['hits'], self._stats['misses'], self._stats['revalidations']
+        total = hits + misses + revalidations
+        return {
+            'hits': hits,
+            'misses': misses,
+            'revalidations': revalidations,
+            'hit_rate': (hits + revalidations) / total if total else 0.0,
+        }
@@ -0,0 +1,233 @@
+import sqlite3
+from typing import Any, Iterable, Iterator
+from src.vacancy import Vacancy
+from src.base_storage import BaseStorage, BatchResult
+from src.query import parse_criteria
+from src.text_index import WORD_PATTERN, normalize_word
+
+COLUMNS = ('title', 'url', 'salary_from', 'salary_to', 'currency', 'description', 'requirements', 'employer',
+           'vacancy_id')
+TEXT_SEARCH_COLUMNS = ('title', 'description', 'requirements')
+SQL_OPERATORS = {'eq': '=', 'ne': '!=', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    salary_from INTEGER NOT NULL DEFAULT 0,
+    salary_to INTEGER NOT NULL DEFAULT 0,
+    currency TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    requirements TEXT NOT NULL DEFAULT '',
+    employer TEXT NOT NULL DEFAULT '',
+    vacancy_id TEXT NOT NULL DEFAULT ''
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_vacancies_url ON vacancies(url);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_from ON vacancies(salary_from);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_to ON vacancies(salary_to);
+CREATE INDEX IF NOT EXISTS idx_vacancies_employer ON vacancies(employer);
+CREATE TABLE IF NOT EXISTS sync_state (
+    query TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL
+);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+    title, description, requirements, content='vacancies', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT ON vacancies BEGIN
+    INSERT INTO vacancies_fts(rowid, title, description, requirements)
+    VALUES (new.id, new.title, new.description, new.requirements);
+END;
+CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE ON vacancies BEGIN
+    INSERT INTO vacancies_fts(vacancies_fts, rowid, title, description, requirements)
+    VALUES ('delete', old.id, old.title, old.description, old.requirements);
+END;
+CREATE TRIGGER IF NOT EXISTS vacancies_au AFTER UPDATE ON vacancies BEGIN
+    INSERT INTO vacancies_fts(vacancies_fts, rowid, title, description, requirements)
+    VALUES ('delete', old.id, old.title, old.description, old.requirements);
+    INSERT INTO vacancies_fts(rowid, title, description, requirements)
+    VALUES (new.id, new.title, new.description, new.requirements);
+END;
+"""
+
+
+class SQLiteStorage(BaseStorage):
+    """Класс для работы с базой SQLite как хранилищем вакансий"""
+
+    def __init__(self, filename: str = 'vacancies.db'):
+        self._filename = filename
+        self._connection = sqlite3.connect(filename)
+        # Встроенная lower() в SQLite не понимает кириллицу
+        self._connection.create_function('py_lower', 1, lambda value: str(value).lower(), deterministic=True)
+        self._connection.create_function('py_fold', 1, lambda value: str(value).lower().replace('ё', 'е'),
+                                         deterministic=True)
+        self._fts_enabled = self._create_schema()
+
+    def _create_schema(self) -> bool:
+        """Создание таблиц и индексов; возвращает доступность FTS5"""
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+            # Базы, созданные до появления столбца vacancy_id
+            existing = {row[1] for row in self._connection.execute("PRAGMA table_info(vacancies)")}
+            if 'vacancy_id' not in existing:
+                self._connection.execute("ALTER TABLE vacancies ADD COLUMN vacancy_id TEXT NOT NULL DEFAULT ''")
+        try:
+            with self._connection:
+                self._connection.executescript(FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            # Сборка SQLite без FTS5: поиск выполняется поиском подстроки
+            return False
+        return True
+
+    def close(self) -> None:
+        """Закрытие соединения с базой"""
+        self._connection.close()
+
+    @staticmethod
+    def _to_row(vacancy: Vacancy) -> tuple[Any, ...]:
+        """Преобразование вакансии в строку таблицы"""
+        vacancy_dict = vacancy.to_dict()
+        return tuple(vacancy_dict[column] for column in COLUMNS)
+
+    def _iter_select(self, where: str = '', params: Iterable[Any] = ()) -> Iterator[Vacancy]:
+        """Потоковая выборка вакансий с условием"""
+        query = f"SELECT {', '.join(COLUMNS)} FROM vacancies {where} ORDER BY id"
+        for row in self._connection.execute(query, tuple(params)):
+            yield Vacancy.from_trusted(*row)
+
+    def _select(self, where: str = '', params: Iterable[Any] = ()) -> list[Vacancy]:
+        """Выборка вакансий с условием"""
+        return list(self._iter_select(where, params))
+
+    @staticmethod
+    def _criteria_to_sql(criteria: dict[str, Any]) -> tuple[str, list[Any]] | None:
+        """Преобразование критериев в условие WHERE; None, если критерии невыполнимы"""
+        conditions = []
+        params: list[Any] = []
+        for condition in parse_criteria(criteria):
+            if condition.field not in COLUMNS:
+                return None
+            if condition.operator in SQL_OPERATORS:
+                # Сравнения выполняются по индексируемым столбцам напрямую
+                conditions.append(f"{condition.field} {SQL_OPERATORS[condition.operator]} ?")
+                params.append(condition.value)
+            elif condition.operator == 'in':
+                if not condition.value:
+                    return None
+                conditions.append(f"{condition.field} IN ({', '.join('?' * len(condition.value))})")
+                params.extend(condition.value)
+            else:
+                conditions.append(f"instr(py_lower({condition.field}), ?) > 0")
+                params.append(condition.value)
+        if not conditions:
+            return '', params
+        return f"WHERE {' AND '.join(conditions)}", params
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """Добавление вакансии в базу"""
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Пакетное добавление вакансий в одной транзакции"""
+        rows = [self._to_row(vacancy) for vacancy in vacancies]
+        placeholders = ', '.join('?' * len(COLUMNS))
+
+        with self._connection:
+            cursor = self._connection.executemany(
+                f"INSERT OR IGNORE INTO vacancies ({', '.join(COLUMNS)}) VALUES ({placeholders})", rows
+            )
+        inserted = max(cursor.rowcount, 0)
+        return BatchResult(inserted, len(rows) - inserted)
+
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Добавление новых и обновление изменившихся вакансий в одной транзакции"""
+        # При повторе URL во входных данных побеждает последняя версия вакансии
+        rows = list({row[COLUMNS.index('url')]: row for row in map(self._to_row, vacancies)}.values())
+        placeholders = ', '.join('?' * len(COLUMNS))
+        updated_columns = [column for column in COLUMNS if column != 'url']
+        assignments = ', '.join(f"{column} = excluded.{column}" for column in updated_columns)
+        # Строка обновляется только при реальном изменении, иначе rowcount её не учитывает
+        changed = ' OR '.join(f"vacancies.{column} IS NOT excluded.{column}" for column in updated_columns)
+
+        with self._connection:
+            cursor = self._connection.executemany(
+                f"INSERT INTO vacancies ({', '.join(COLUMNS)}) VALUES ({placeholders}) "
+                f"ON CONFLICT(url) DO UPDATE SET {assignments} WHERE {changed}", rows
+            )
+        affected = max(cursor.rowcount, 0)
+        return BatchResult(affected, len(rows) - affected)
+
+    def get_watermark(self, search_query: str) -> str | None:
+        """Отметка последней синхронизации поискового запроса"""
+        row = self._connection.execute("SELECT watermark FROM sync_state WHERE query = ?", (search_query,)).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, search_query: str, watermark: str) -> None:
+        """Сохранение отметки последней синхронизации поискового запроса"""
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO sync_state (query, watermark) VALUES (?, ?) "
+                "ON CONFLICT(query) DO UPDATE SET watermark = excluded.watermark", (search_query, watermark)
+            )
+
+    def get_vacancies(self, criteria: dict[str, Any] = None) -> list[Vacancy]:
+        """Получение вакансий по критериям с фильтрацией на стороне SQL"""
+        return list(self.iter_vacancies(criteria))
+
+    def iter_vacancies(self, criteria: dict[str, Any] = None) -> Iterator[Vacancy]:
+        """Потоковое получение вакансий курсором без загрузки всей выборки"""
+        if not criteria:
+            yield from self._iter_select()
+            return
+
+        query = self._criteria_to_sql(criteria)
+        if query is not None:
+            yield from self._iter_select(*query)
+
+    def search(self, words: list[str], match_all: bool = False) -> list[Vacancy]:
+        """Полнотекстовый поиск по названию, описанию и требованиям
+
+        Слова запроса нормализуются так же, как в InvertedIndex JSON-хранилищ,
+        и ищутся по префиксу, поэтому оба вида хранилищ находят одни и те же вакансии.
+        """
+        prefixes = {(normalize_word(word), word.lower()) for word in WORD_PATTERN.findall(' '.join(words))}
+        if not prefixes:
+            return []
+
+        if self._fts_enabled:
+            # FTS5 хранит слова без замены ё, поэтому префикс с ё из запроса ищется в обоих написаниях
+            terms = []
+            for prefix, word in prefixes:
+                variants = {prefix, word[:len(prefix)]}
+                terms.append('(' + ' OR '.join(f'"{variant}"*' for variant in sorted(variants)) + ')')
+            match = (' AND ' if match_all else ' OR ').join(terms)
+            return self._select("WHERE id IN (SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)", [match])
+
+        # Сборка SQLite без FTS5: префикс ищется как подстрока текста
+        text = " || ' ' || ".join(TEXT_SEARCH_COLUMNS)
+        conditions = [f"instr(py_fold({text}), ?) > 0" for _ in prefixes]
+        where = (' AND ' if match_all else ' OR ').join(conditions)
+        return self._select(f"WHERE {where}", [prefix for prefix, _ in prefixes])
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """Удаление вакансии из базы"""
+        self.delete_vacancies([vacancy])
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> BatchResult:
+        """Пакетное удаление вакансий в одной транзакции"""
+        urls = {vacancy.url for vacancy in vacancies}
+
+        with self._connection:
+            cursor = self._connection.executemany("DELETE FROM vacancies WHERE url = ?", [(url,) for url in urls])
+        deleted = max(cursor.rowcount, 0)
+        return BatchResult(deleted, len(urls) - deleted)
+
+    def clear(self) -> None:
+        """Очистка базы"""
+        with self._connection:
+            self._connection.execute("DELETE FROM vacancies")
+            # После очистки запросы снова загружаются целиком
+            self._connection.execute("DELETE FROM sync_state")
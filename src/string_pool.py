@@ -0,0 +1,49 @@
+from typing import Iterable
+
+
+class StringPool:
+    """Таблица повторяющихся строк (flyweight): каждое различное значение хранится один раз
+
+    intern возвращает общий экземпляр строки, code — её номер в таблице,
+    который можно хранить в массиве вместо ссылки на строку.
+    """
+
+    __slots__ = ('_codes', '_values')
+
+    def __init__(self, values: Iterable[str] = ()):
+        self._codes: dict[str, int] = {}
+        self._values: list[str] = []
+        for value in values:
+            self.code(value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._codes
+
+    def code(self, value: str) -> int:
+        """Номер строки в таблице; новая строка добавляется в конец"""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def intern(self, value: str) -> str:
+        """Общий экземпляр строки, равной value"""
+        return self._values[self.code(value)]
+
+    def value(self, code: int) -> str:
+        """Строка по её номеру в таблице"""
+        return self._values[code]
+
+    @property
+    def values(self) -> list[str]:
+        """Различные строки в порядке добавления"""
+        return list(self._values)
+
+    def clear(self) -> None:
+        """Очистка таблицы; ранее выданные номера становятся недействительными"""
+        self._codes.clear()
+        self._values.clear()
@@ -0,0 +1,102 @@
+from datetime import datetime
+from typing import Any, Callable
+from src.base_storage import BaseStorage, IngestResult
+from src.enrich import enrich_vacancies
+from src.hh_api import HeadHunterAPI, MAX_RESULTS, ORDER_BY_PUBLICATION_TIME
+from src.ingest import vacancy_key
+from src.response_cache import ResponseCache
+from src.vacancy import Vacancy
+
+# Формат published_at в ответах hh.ru, например 2024-05-20T12:30:00+0300
+PUBLISHED_AT_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+# Дата публикации: разобранное значение и исходная строка API
+PublishedAt = tuple[datetime, str]
+
+
+def watermark_key(search_query: str) -> str:
+    """Ключ отметки синхронизации: запрос без учёта регистра и лишних пробелов"""
+    return ' '.join(search_query.lower().split())
+
+
+def parse_published_at(value: Any) -> datetime | None:
+    """Разбор даты публикации вакансии; None для отсутствующей или некорректной даты"""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.strptime(value, PUBLISHED_AT_FORMAT)
+    except ValueError:
+        return None
+
+
+def _published_bounds(vacancies_data: list[dict[str, Any]]) -> tuple[PublishedAt, PublishedAt] | None:
+    """Самая ранняя и самая поздняя даты публикации среди вакансий в исходном формате API"""
+    oldest: PublishedAt | None = None
+    latest: PublishedAt | None = None
+    for vacancy_data in vacancies_data:
+        value = vacancy_data.get('published_at')
+        published_at = parse_published_at(value)
+        if published_at is None or not isinstance(value, str):
+            continue
+        if oldest is None or published_at < oldest[0]:
+            oldest = published_at, value
+        if latest is None or published_at > latest[0]:
+            latest = published_at, value
+    return (oldest, latest) if oldest is not None and latest is not None else None
+
+
+def latest_published_at(vacancies_data: list[dict[str, Any]]) -> str | None:
+    """Самая поздняя дата публикации среди вакансий в исходном формате API"""
+    bounds = _published_bounds(vacancies_data)
+    return bounds[1][1] if bounds else None
+
+
+def sync_vacancies(api: HeadHunterAPI, storage: BaseStorage, search_query: str,
+                   per_page: int = MAX_RESULTS, enrich_details: bool = False,
+                   detail_cache: ResponseCache | None = None,
+                   on_batch: Callable[[list[Vacancy]], None] | None = None) -> IngestResult:
+    """Инкрементальная синхронизация: загрузка вакансий, опубликованных после прошлого запуска
+
+    Отметка — самая поздняя дата публикации из прошлой выгрузки, она
+    передаётся в API как date_from, выдача сортируется от новых к старым.
+    Если новых вакансий больше per_page, более ранние дозагружаются окнами
+    date_to, пока дельта не будет выбрана целиком; отметка сдвигается только
+    после этого. Вакансии на границе отметки и окон приходят повторно, но
+    пропускаются хранилищем как не изменившиеся. При первом запуске
+    загружаются per_page последних вакансий. С enrich_details вакансии
+    дополняются полными описаниями, on_batch получает загруженные вакансии,
+    некорректные записи API учитываются в поле invalid результата.
+    """
+    key = watermark_key(search_query)
+    watermark = storage.get_watermark(key)
+    limit = min(per_page, MAX_RESULTS)
+
+    batch = api.get_vacancies(search_query, per_page, date_from=watermark, order_by=ORDER_BY_PUBLICATION_TIME)
+    vacancies_data = list(batch)
+    drained = True
+    if watermark is not None:
+        window_end: datetime | None = None
+        while len(batch) >= limit:
+            bounds = _published_bounds(batch)
+            # Окно не сдвинулось: в одну секунду опубликовано больше per_page вакансий
+            if bounds is None or (window_end is not None and bounds[0][0] >= window_end):
+                drained = False
+                break
+            window_end, date_to = bounds[0]
+            batch = api.get_vacancies(search_query, per_page, date_from=watermark, date_to=date_to,
+                                      order_by=ORDER_BY_PUBLICATION_TIME)
+            vacancies_data.extend(batch)
+
+    # Вакансии на границах окон приходят по нескольку раз
+    vacancies_data = list({vacancy_key(vacancy_data): vacancy_data for vacancy_data in vacancies_data}.values())
+    if enrich_details:
+        vacancies_data = enrich_vacancies(api, vacancies_data, detail_cache)
+    report = Vacancy.cast_with_report(vacancies_data)
+    result = storage.upsert_vacancies(report.vacancies)
+    if on_batch is not None:
+        on_batch(report.vacancies)
+
+    bounds = _published_bounds(vacancies_data)
+    previous = parse_published_at(watermark)
+    if drained and bounds is not None and (previous is None or bounds[1][0] > previous):
+        storage.set_watermark(key, bounds[1][1])
+    return IngestResult(result.affected, result.skipped, len(report.errors))
@@ -0,0 +1,136 @@
+from __future__ import annotations
+import json
+import re
+from bisect import bisect_left
+from typing import Iterable
+from src.file_utils import FileStamp, atomic_write
+
+WORD_PATTERN = re.compile(r'\w+')
+CYRILLIC_PATTERN = re.compile(r'[а-я]')
+MIN_STEM_LENGTH = 3
+
+# Окончания отсекаются от длинных к коротким, чтобы "ами" не превращалось в "ам" + "и"
+RUSSIAN_ENDINGS = tuple(sorted((
+    'ами', 'ями', 'ого', 'его', 'ому', 'ему', 'ыми', 'ими', 'ых', 'их', 'ой', 'ей', 'ий', 'ый', 'ая', 'яя',
+    'ое', 'ее', 'ые', 'ие', 'ов', 'ев', 'ах', 'ях', 'ам', 'ям', 'ом', 'ем', 'ую', 'юю', 'ть',
+    'а', 'я', 'о', 'е', 'ы', 'и', 'у', 'ю', 'ь', 'й',
+), key=len, reverse=True))
+ENGLISH_ENDINGS = ('ing', 'ers', 'er', 'ed', 'es', 's', 'e')
+
+
+def normalize_word(word: str) -> str:
+    """Нормализация слова: нижний регистр, замена ё и отсечение окончания"""
+    word = word.lower().replace('ё', 'е')
+    endings = RUSSIAN_ENDINGS if CYRILLIC_PATTERN.search(word) else ENGLISH_ENDINGS
+    for ending in endings:
+        if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM_LENGTH:
+            return word[:-len(ending)]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """Разбиение текста на нормализованные слова"""
+    return [normalize_word(word) for word in WORD_PATTERN.findall(text)]
+
+
+class InvertedIndex:
+    """Инвертированный индекс: нормализованное слово -> ключи вакансий, в тексте которых оно встречается"""
+
+    def __init__(self, postings: dict[str, set[str]] | None = None):
+        self._postings: dict[str, set[str]] = postings or {}
+        self._documents: dict[str, set[str]] = {}
+        # Отсортированный словарь слов для поиска по префиксу; строится при первом поиске после изменения
+        self._vocabulary: list[str] | None = None
+        for token, keys in self._postings.items():
+            for key in keys:
+                self._documents.setdefault(key, set()).add(token)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, key: str, text: str) -> None:
+        """Добавление текста вакансии в индекс"""
+        self.remove(key)
+        tokens = set(tokenize(text))
+        self._documents[key] = tokens
+        for token in tokens:
+            if token not in self._postings:
+                self._postings[token] = set()
+                self._vocabulary = None
+            self._postings[token].add(key)
+
+    def remove(self, key: str) -> None:
+        """Удаление вакансии из индекса"""
+        for token in self._documents.pop(key, ()):
+            keys = self._postings[token]
+            keys.discard(key)
+            if not keys:
+                del self._postings[token]
+                self._vocabulary = None
+
+    def clear(self) -> None:
+        """Очистка индекса"""
+        self._postings.clear()
+        self._documents.clear()
+        self._vocabulary = None
+
+    def _prefix_keys(self, prefix: str) -> set[str]:
+        """Ключи вакансий со словами, начинающимися с prefix"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        keys: set[str] = set()
+        for position in range(bisect_left(self._vocabulary, prefix), len(self._vocabulary)):
+            token = self._vocabulary[position]
+            if not token.startswith(prefix):
+                break
+            keys |= self._postings[token]
+        return keys
+
+    def search(self, words: Iterable[str], match_all: bool = False) -> set[str]:
+        """Поиск ключей вакансий, содержащих любое (или каждое) из слов
+
+        Слово запроса нормализуется так же, как текст вакансий, и ищется
+        по префиксу: "разработ" находит "разработчик", "java" — "javascript".
+        """
+        prefixes = {token for word in words for token in tokenize(word)}
+        if not prefixes:
+            return set()
+
+        postings = [self._prefix_keys(prefix) for prefix in prefixes]
+        if not match_all:
+            return set().union(*postings)
+
+        # Пересечение начинается с самого короткого списка
+        postings.sort(key=len)
+        result = set(postings[0])
+        for keys in postings[1:]:
+            if not result:
+                break
+            result &= keys
+        return result
+
+    def to_dict(self) -> dict[str, list[str]]:
+        """Преобразование индекса в словарь для сохранения"""
+        return {token: sorted(keys) for token, keys in self._postings.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, list[str]]) -> InvertedIndex:
+        """Создание индекса из словаря"""
+        return cls({token: set(keys) for token, keys in data.items()})
+
+    def save(self, filename: str, stamp: FileStamp) -> None:
+        """Сохранение индекса в файл вместе с отметкой файла данных"""
+        with atomic_write(filename) as f:
+            json.dump({'stamp': list(stamp), 'postings': self.to_dict()}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, filename: str, stamp: FileStamp) -> InvertedIndex | None:
+        """Загрузка индекса из файла, если он соответствует файлу данных"""
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None
+        if not isinstance(data, dict) or data.get('stamp') != list(stamp):
+            return None
+        return cls.from_dict(data.get('postings', {}))
@@ -1,22 +1,33 @@
+import heapq
+from itertools import islice
+from typing import Any, Callable, Iterable, Sequence
+from src.keyword_matcher import KeywordMatcher
 from src.vacancy import Vacancy
 
-def filter_vacancies(vacancies: list[Vacancy], filter_words: list[str]) -> list[Vacancy]:
+# Поля сортировки: числовые упорядочиваются по убыванию, текстовые — по алфавиту
+SORT_FIELDS: dict[str, Callable[[Vacancy], Any]] = {
+    'avg_salary': lambda vacancy: -vacancy.get_avg_salary(),
+    'salary_from': lambda vacancy: -vacancy.salary_from,
+    'salary_to': lambda vacancy: -vacancy.salary_to,
+    'employer': lambda vacancy: vacancy.employer.lower(),
+    'title': lambda vacancy: vacancy.title.lower(),
+}
+
+
+def filter_vacancies(vacancies: list[Vacancy], filter_words: list[str], match_all: bool = False,
+                     whole_word: bool = False, stem: bool = False) -> list[Vacancy]:
     """Фильтрация вакансий по ключевым словам"""
-    if not filter_words:
+    matcher = KeywordMatcher(filter_words, match_all, whole_word, stem)
+    if not matcher:
         return vacancies
 
-    filtered = []
-    for vacancy in vacancies:
-        vacancy_text = f"{vacancy.title} {vacancy.description} {vacancy.requirements}".lower()
-        if any(word.lower() in vacancy_text for word in filter_words):
-            filtered.append(vacancy)
+    return matcher.filter(vacancies)
 
-    return filtered
 
-def get_vacancies_by_salary(vacancies: list[Vacancy], salary_range: str) -> list[Vacancy]:
-    """Фильтрация вакансий по диапазону зарплат"""
+def parse_salary_range(salary_range: str) -> tuple[float, float] | None:
+    """Разбор диапазона зарплат «от-до» или «от»; None, если диапазон не задан или некорректен"""
     if not salary_range:
-        return vacancies
+        return None
 
     try:
         if '-' in salary_range:
@@ -25,7 +36,16 @@ def get_vacancies_by_salary(vacancies: list[Vacancy], salary_range: str) -> list
             salary_from = int(salary_range)
             salary_to = float('inf')
     except ValueError:
+        return None
+    return salary_from, salary_to
+
+
+def get_vacancies_by_salary(vacancies: list[Vacancy], salary_range: str) -> list[Vacancy]:
+    """Фильтрация вакансий по диапазону зарплат"""
+    bounds = parse_salary_range(salary_range)
+    if bounds is None:
         return vacancies
+    salary_from, salary_to = bounds
 
     filtered = []
     for vacancy in vacancies:
@@ -35,13 +55,36 @@ def get_vacancies_by_salary(vacancies: list[Vacancy], salary_range: str) -> list
 
     return filtered
 
-def sort_vacancies(vacancies: list[Vacancy]) -> list[Vacancy]:
-    """Сортировка вакансий по убыванию зарплаты"""
-    return sorted(vacancies, reverse=True)
 
-def get_top_vacancies(vacancies: list[Vacancy], top_n: int) -> list[Vacancy]:
-    """Получение топ N вакансий"""
-    return vacancies[:top_n]
+def make_sort_key(by: Sequence[str] = ('avg_salary',)) -> Callable[[Vacancy], tuple[Any, ...]]:
+    """Ключ сортировки по нескольким полям из SORT_FIELDS, вычисляемый один раз на вакансию"""
+    try:
+        getters = [SORT_FIELDS[field] for field in by]
+    except KeyError as e:
+        raise ValueError(f"Неизвестное поле сортировки: {e.args[0]}")
+    return lambda vacancy: tuple(getter(vacancy) for getter in getters)
+
+
+def sort_vacancies(vacancies: Iterable[Vacancy], by: Sequence[str] = ('avg_salary',)) -> list[Vacancy]:
+    """Сортировка вакансий по убыванию зарплаты; при равенстве ключей сохраняется исходный порядок"""
+    return sorted(vacancies, key=make_sort_key(by))
+
+
+def top_vacancies(vacancies: Iterable[Vacancy], top_n: int, by: Sequence[str] = ('avg_salary',)) -> list[Vacancy]:
+    """Топ N вакансий без полной сортировки: выбор через кучу размера N за O(n log N)
+
+    Результат совпадает с sort_vacancies(vacancies, by)[:top_n], вакансии
+    можно передавать итератором.
+    """
+    if top_n <= 0:
+        return []
+    return heapq.nsmallest(top_n, vacancies, key=make_sort_key(by))
+
+
+def get_top_vacancies(vacancies: Iterable[Vacancy], top_n: int) -> list[Vacancy]:
+    """Получение топ N вакансий; итератор читается только до N-го элемента"""
+    return list(islice(vacancies, max(top_n, 0)))
+
 
 def print_vacancies(vacancies: list[Vacancy]) -> None:
     """Вывод вакансий в читаемом формате"""
@@ -53,4 +96,4 @@ def print_vacancies(vacancies: list[Vacancy]) -> None:
         print(f"\n{'='*50}")
         print(f"вакансия #{i}")
         print(f"{'=' * 50}")
-        print(vacancy)
\ No newline at end of file
+        print(vacancy)
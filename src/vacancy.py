@@ -1,16 +1,23 @@
 from __future__ import annotations
-from typing import Dict, Any, Optional
+import math
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, NamedTuple, Optional
+from src.text_index import WORD_PATTERN
+
+# Меньшие выгрузки быстрее разобрать в текущем процессе, чем передавать в пул
+PARALLEL_MIN_RECORDS = 20000
 
 
 class Vacancy:
     """Класс для представления вакансии"""
 
     __slots__ = ('_title', '_url', '_salary_from', '_salary_to', '_currency',
-                 '_description', '_requirements', '_employer')
+                 '_description', '_requirements', '_employer', '_vacancy_id', '_search_text', '_search_tokens')
 
     def __init__(self, title: str, url: str, salary_from: Optional[int] = None,
                  salary_to: Optional[int] = None, currency: str = "",
-                 description: str = "", requirements: str = "", employer: str = ""):
+                 description: str = "", requirements: str = "", employer: str = "", vacancy_id: str = ""):
         self._title = self._validate_title(title)
         self._url = self._validate_url(url)
         self._salary_from = self._validate_salary(salary_from)
@@ -19,23 +26,28 @@ class Vacancy:
         self._description = description
         self._requirements = requirements
         self._employer = employer
+        self._vacancy_id = vacancy_id
+        # Нормализованный текст для поиска по ключевым словам вычисляется при первом обращении
+        self._search_text: str | None = None
+        self._search_tokens: frozenset[str] | None = None
 
-    def _validate_title(self, title: str) -> str:
+    @staticmethod
+    def _validate_title(title: Any) -> str:
         """Валидация названия вакансии"""
         if not title or not isinstance(title, str):
             raise ValueError("Название вакансии должно быть непустой строкой")
         return title.strip()
 
-    def _validate_url(self, url: str) -> str:
+    @staticmethod
+    def _validate_url(url: Any) -> str:
         """Валидация URL вакансии"""
-        if not url.startswith(('http://', 'https://')):
+        if not isinstance(url, str) or not url.startswith(('http://', 'https://')):
             raise ValueError("URL вакансии должен начинаться с http:// или https://")
         return url
 
-    def _validate_salary(self, salary: Optional[int]) -> int:
-        """Валидация зарплаты"""
-        if salary is None:
-            return 0
+    @staticmethod
+    def _validate_salary(salary: Any) -> int:
+        """Валидация зарплаты: отсутствующая или некорректная считается нулевой"""
         if not isinstance(salary, (int, float)) or salary < 0:
             return 0
         return int(salary)
@@ -72,6 +84,24 @@ class Vacancy:
     def employer(self) -> str:
         return self._employer
 
+    @property
+    def vacancy_id(self) -> str:
+        return self._vacancy_id
+
+    @property
+    def search_text(self) -> str:
+        """Название, описание и требования в нижнем регистре с заменой ё на е"""
+        if self._search_text is None:
+            self._search_text = f"{self._title} {self._description} {self._requirements}".lower().replace('ё', 'е')
+        return self._search_text
+
+    @property
+    def search_tokens(self) -> frozenset[str]:
+        """Различные слова текста для поиска"""
+        if self._search_tokens is None:
+            self._search_tokens = frozenset(WORD_PATTERN.findall(self.search_text))
+        return self._search_tokens
+
     def get_avg_salary(self) -> float:
         """Получение средней зарплаты"""
         if self._salary_from and self._salary_to:
@@ -133,12 +163,43 @@ class Vacancy:
             'currency': self._currency,
             'description': self._description,
             'requirements': self._requirements,
-            'employer': self._employer
+            'employer': self._employer,
+            'vacancy_id': self._vacancy_id
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> Vacancy:
-        """Создание вакансии из словаря"""
+    def from_trusted(cls, title: str, url: str, salary_from: int = 0, salary_to: int = 0, currency: str = "",
+                     description: str = "", requirements: str = "", employer: str = "",
+                     vacancy_id: str = "") -> Vacancy:
+        """Создание вакансии из уже проверенных значений без валидации (данные собственного хранилища)
+
+        Работодатель и валюта интернируются (sys.intern), поэтому одинаковые
+        значения загруженных вакансий хранятся один раз и освобождаются вместе
+        с последней ссылающейся на них вакансией.
+        """
+        vacancy = cls.__new__(cls)
+        vacancy._title = title
+        vacancy._url = url
+        vacancy._salary_from = salary_from
+        vacancy._salary_to = salary_to
+        vacancy._currency = sys.intern(currency or '')
+        vacancy._description = description
+        vacancy._requirements = requirements
+        vacancy._employer = sys.intern(employer or '')
+        vacancy._vacancy_id = vacancy_id
+        vacancy._search_text = None
+        vacancy._search_tokens = None
+        return vacancy
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> Vacancy:
+        """Создание вакансии из словаря; trusted=True пропускает валидацию для данных, сохранённых to_dict"""
+        if trusted:
+            return cls.from_trusted(
+                data['title'], data['url'], data.get('salary_from') or 0, data.get('salary_to') or 0,
+                data.get('currency', ''), data.get('description', ''), data.get('requirements', ''),
+                data.get('employer', ''), data.get('vacancy_id', '')
+            )
         return cls(
             title=data.get('title', ''),
             url=data.get('url', ''),
@@ -147,34 +208,85 @@ class Vacancy:
             currency=data.get('currency', ''),
             description=data.get('description', ''),
             requirements=data.get('requirements', ''),
-            employer=data.get('employer', '')
+            employer=data.get('employer', ''),
+            vacancy_id=data.get('vacancy_id', '')
         )
 
+    @classmethod
+    def from_dicts(cls, records: Iterable[Dict[str, Any]]) -> list[Vacancy]:
+        """Пакетное создание вакансий из словарей собственного хранилища без валидации"""
+        return [cls.from_dict(record, trusted=True) for record in records]
+
     @staticmethod
     def cast_to_object_list(vacancies_data: list[Dict[str, Any]]) -> list[Vacancy]:
-        """Преобразование списка словарей в список объектов Vacancy"""
-        vacancies = []
-        for vacancy_data in vacancies_data:
-            try:
-                # Парсинг данных из API HH.ru
-                salary_data = vacancy_data.get('salary')
-                salary_from = salary_data.get('from') if salary_data else None
-                salary_to = salary_data.get('to') if salary_data else None
-                currency = salary_data.get('currency', '') if salary_data else ''
-
-                vacancy = Vacancy(
-                    title=vacancy_data.get('name', ''),
-                    url=vacancy_data.get('alternate_url', ''),
-                    salary_from=salary_from,
-                    salary_to=salary_to,
-                    currency=currency,
-                    description=vacancy_data.get('snippet', {}).get('responsibility', ''),
-                    requirements=vacancy_data.get('snippet', {}).get('requirement', ''),
-                    employer=vacancy_data.get('employer', {}).get('name', '')
-                )
-                vacancies.append(vacancy)
-            except (ValueError, KeyError) as e:
-                print(f"Ошибка при создании вакансии: {e}")
-                continue
-
-        return vacancies
\ No newline at end of file
+        """Преобразование списка словарей в список объектов Vacancy; некорректные записи пропускаются"""
+        return Vacancy.cast_with_report(vacancies_data).vacancies
+
+    @staticmethod
+    def cast_with_report(vacancies_data: list[Dict[str, Any]], processes: int = 0) -> CastReport:
+        """Преобразование ответа API в вакансии с отчётом об ошибках вместо вывода на экран
+
+        При processes > 1 большие выгрузки разбираются пулом процессов по частям.
+        """
+        if processes > 1 and len(vacancies_data) >= PARALLEL_MIN_RECORDS:
+            chunk_size = math.ceil(len(vacancies_data) / processes)
+            chunks = [(vacancies_data[start:start + chunk_size], start)
+                      for start in range(0, len(vacancies_data), chunk_size)]
+            vacancies: list[Vacancy] = []
+            errors: list[CastError] = []
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                for report in executor.map(_cast_chunk, chunks):
+                    # Строки из других процессов приходят копиями и заменяются общими экземплярами
+                    for vacancy in report.vacancies:
+                        vacancy._currency = sys.intern(vacancy._currency)
+                        vacancy._employer = sys.intern(vacancy._employer)
+                    vacancies.extend(report.vacancies)
+                    errors.extend(report.errors)
+            return CastReport(vacancies, errors)
+        return _cast_chunk((vacancies_data, 0))
+
+
+class CastError(NamedTuple):
+    """Ошибка разбора записи API: позиция записи во входных данных и описание"""
+    position: int
+    message: str
+
+
+class CastReport(NamedTuple):
+    """Результат разбора ответа API: созданные вакансии и ошибки пропущенных записей"""
+    vacancies: list[Vacancy]
+    errors: list[CastError]
+
+
+def _parse_api_item(vacancy_data: Dict[str, Any]) -> Vacancy:
+    """Разбор одной вакансии из ответа API HH.ru теми же проверками, что и в конструкторе Vacancy"""
+    title = Vacancy._validate_title(vacancy_data.get('name'))
+    url = Vacancy._validate_url(vacancy_data.get('alternate_url'))
+
+    salary_data = vacancy_data.get('salary') or {}
+    snippet = vacancy_data.get('snippet') or {}
+    return Vacancy.from_trusted(
+        title,
+        url,
+        Vacancy._validate_salary(salary_data.get('from')),
+        Vacancy._validate_salary(salary_data.get('to')),
+        salary_data.get('currency') or '',
+        # Полное описание есть только у вакансий, дополненных данными из /vacancies/{id}
+        vacancy_data.get('description') or snippet.get('responsibility') or '',
+        snippet.get('requirement') or '',
+        (vacancy_data.get('employer') or {}).get('name') or '',
+        str(vacancy_data.get('id') or '')
+    )
+
+
+def _cast_chunk(chunk: tuple[list[Dict[str, Any]], int]) -> CastReport:
+    """Разбор части ответа API; позиции ошибок отсчитываются от начала всей выгрузки"""
+    vacancies_data, offset = chunk
+    vacancies = []
+    errors = []
+    for position, vacancy_data in enumerate(vacancies_data, offset):
+        try:
+            vacancies.append(_parse_api_item(vacancy_data))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            errors.append(CastError(position, f"Ошибка при создании вакансии: {e}"))
+    return CastReport(vacancies, errors)
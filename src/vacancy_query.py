@@ -0,0 +1,122 @@
+from __future__ import annotations
+import copy
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Sequence
+from src.keyword_matcher import KeywordMatcher
+from src.query import compile_criteria
+from src.utils import parse_salary_range, sort_vacancies, top_vacancies
+from src.vacancy import Vacancy
+
+# Относительная стоимость проверки одной вакансии: сравнение чисел дешевле поиска подстрок в тексте
+SALARY_COST = 1.0
+CRITERIA_COST = 2.0
+KEYWORDS_COST = 5.0
+# Вакансии проверяются порциями, размер порции растёт, чтобы запрос с limit не читал источник далеко вперёд
+FIRST_CHUNK_SIZE = 64
+MAX_CHUNK_SIZE = 4096
+
+
+class _Filter:
+    """Условие запроса со статистикой отсева для выбора порядка проверок"""
+
+    __slots__ = ('cost', 'predicate', 'seen', 'passed')
+
+    def __init__(self, cost: float, predicate: Callable[[Vacancy], bool]):
+        self.cost = cost
+        self.predicate = predicate
+        self.seen = 0
+        self.passed = 0
+
+    def rank(self) -> float:
+        """Стоимость проверки на одну отсеянную вакансию; условия проверяются по возрастанию"""
+        pass_rate = (self.passed + 1) / (self.seen + 2)
+        return self.cost / (1 - pass_rate)
+
+
+class VacancyQuery:
+    """Ленивый запрос к любому набору вакансий: все условия проверяются за один проход
+
+    Методы-условия возвращают новый запрос и ничего не вычисляют. При
+    выполнении условия упорядочиваются по стоимости и доле отсеянных
+    вакансий, промежуточные списки не создаются, а limit прекращает
+    чтение источника, как только набрано нужное количество.
+    """
+
+    def __init__(self, source: Iterable[Vacancy]):
+        self._source = source
+        self._filters: tuple[tuple[float, Callable[[Vacancy], bool]], ...] = ()
+        self._limit: int | None = None
+
+    def _with_filter(self, cost: float, predicate: Callable[[Vacancy], bool]) -> VacancyQuery:
+        """Копия запроса с дополнительным условием"""
+        query = copy.copy(self)
+        query._filters = self._filters + ((cost, predicate),)
+        return query
+
+    def keywords(self, words: Iterable[str], match_all: bool = False, whole_word: bool = False,
+                 stem: bool = False) -> VacancyQuery:
+        """Вакансии, в названии, описании или требованиях которых есть хотя бы одно (или каждое) из слов"""
+        matcher = KeywordMatcher(words, match_all, whole_word, stem)
+        if not matcher:
+            return self
+        return self._with_filter(KEYWORDS_COST, matcher)
+
+    def salary(self, salary_range: str | tuple[float, float]) -> VacancyQuery:
+        """Вакансии со средней зарплатой в диапазоне: строка «от-до», «от» или пара чисел"""
+        bounds = parse_salary_range(salary_range) if isinstance(salary_range, str) else salary_range
+        if bounds is None:
+            return self
+        salary_from, salary_to = bounds
+        return self._with_filter(SALARY_COST, lambda vacancy: salary_from <= vacancy.get_avg_salary() <= salary_to)
+
+    def where(self, criteria: dict[str, Any]) -> VacancyQuery:
+        """Вакансии, удовлетворяющие критериям в формате хранилищ"""
+        if not criteria:
+            return self
+        return self._with_filter(CRITERIA_COST, compile_criteria(criteria))
+
+    def limit(self, count: int) -> VacancyQuery:
+        """Не больше count первых подходящих вакансий"""
+        query = copy.copy(self)
+        query._limit = max(count, 0) if self._limit is None else min(self._limit, max(count, 0))
+        return query
+
+    def _iter_matches(self) -> Iterator[Vacancy]:
+        """Подходящие вакансии в исходном порядке"""
+        if not self._filters:
+            yield from self._source
+            return
+
+        filters = [_Filter(cost, predicate) for cost, predicate in self._filters]
+        source = iter(self._source)
+        chunk_size = FIRST_CHUNK_SIZE
+        while chunk := list(islice(source, chunk_size)):
+            # Порядок пересчитывается по статистике предыдущих порций
+            filters.sort(key=_Filter.rank)
+            for vacancy_filter in filters:
+                vacancy_filter.seen += len(chunk)
+                chunk = list(filter(vacancy_filter.predicate, chunk))
+                vacancy_filter.passed += len(chunk)
+                if not chunk:
+                    break
+            yield from chunk
+            chunk_size = min(chunk_size * 2, MAX_CHUNK_SIZE)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        return islice(self._iter_matches(), self._limit)
+
+    def to_list(self) -> list[Vacancy]:
+        """Выполнение запроса со списком подходящих вакансий в исходном порядке"""
+        return list(self)
+
+    def count(self) -> int:
+        """Количество подходящих вакансий"""
+        return sum(1 for _ in self)
+
+    def sort(self, by: Sequence[str] = ('avg_salary',)) -> list[Vacancy]:
+        """Выполнение запроса с сортировкой результата"""
+        return sort_vacancies(self, by)
+
+    def top(self, top_n: int, by: Sequence[str] = ('avg_salary',)) -> list[Vacancy]:
+        """Выполнение запроса с выбором топ N: в памяти хранится не больше N вакансий"""
+        return top_vacancies(self, top_n, by)
@@ -1,4 +1,5 @@
 from src.vacancy import Vacancy
+import glob
 import os
 
 def create_test_vacancy(title="Test Vacancy", employer="Test Company"):
@@ -15,5 +16,7 @@ def create_test_vacancy(title="Test Vacancy", employer="Test Company"):
     )
 
 def cleanup_file(filename):
-    if os.path.exists(filename):
-        os.remove(filename)
\ No newline at end of file
+    # Вместе с файлом данных удаляются служебные файлы рядом с ним (индексы и т.п.)
+    for path in [filename] + glob.glob(glob.escape(filename) + '.*'):
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import pytest
+from src.async_hh_api import AsyncHeadHunterAPI, TransportResponse, http_transport
+
+
+def make_fake_transport(found=450, delay=0.01):
+    state = {'in_flight': 0, 'max_in_flight': 0, 'calls': 0}
+
+    async def transport(url, params, headers):
+        state['calls'] += 1
+        state['in_flight'] += 1
+        state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        await asyncio.sleep(delay)
+        state['in_flight'] -= 1
+
+        per_page = params['per_page']
+        page = params['page']
+        items = [{'id': f"{params['text']}-{page}-{i}"} for i in range(per_page)]
+        body = {'items': items, 'found': found, 'pages': -(-found // per_page)}
+        return TransportResponse(200, {}, json.dumps(body).encode())
+
+    return transport, state
+
+
+def test_get_vacancies_with_fake_transport():
+    transport, state = make_fake_transport()
+    api = AsyncHeadHunterAPI(max_concurrency=2, transport=transport)
+
+    vacancies = asyncio.run(api.get_vacancies("Python", per_page=450))
+
+    assert len(vacancies) == 450
+    assert vacancies[0]['id'] == "Python-0-0"
+    assert vacancies[-1]['id'] == "Python-4-49"
+    assert state['calls'] == 5
+    assert state['max_in_flight'] <= 2
+
+
+def test_search_many_and_errors():
+    transport, state = make_fake_transport(found=150)
+    api = AsyncHeadHunterAPI(max_concurrency=3, transport=transport)
+
+    results = asyncio.run(api.search_many(["Python", "Java", "Python"], per_page=150))
+    assert list(results) == ["Python", "Java"]
+    assert all(len(items) == 150 for items in results.values())
+    assert state['max_in_flight'] <= 3
+
+    async def failing_transport(url, params, headers):
+        return TransportResponse(503, {}, b'')
+
+    api = AsyncHeadHunterAPI(transport=failing_transport)
+    with pytest.raises(ConnectionError, match='HTTP 503'):
+        asyncio.run(api.get_vacancies("Python"))
+
+
+def test_http_transport_against_local_server():
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            params = parse_qs(urlsplit(self.path).query)
+            body = json.dumps({'items': [{'name': params['text'][0]}], 'found': 1, 'pages': 1}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/vacancies"
+        response = asyncio.run(http_transport(url, {'text': 'Разработчик'}, {'User-Agent': 'test'}))
+        assert response.status == 200
+        assert response.headers['content-type'] == 'application/json'
+
+        api = AsyncHeadHunterAPI(base_url=url)
+        assert asyncio.run(api.get_vacancies("Разработчик")) == [{'name': 'Разработчик'}]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_truncated_response_raises_connection_error():
+
+    async def run(reply):
+        async def handle(reader, writer):
+            await reader.readuntil(b'\r\n\r\n')
+            writer.write(reply)
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        async with server:
+            api = AsyncHeadHunterAPI(base_url=f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/vacancies")
+            return await api.get_vacancies("Python")
+
+    for reply in (b'', b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n1f\r\n{"items"',
+                  b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n[]'):
+        with pytest.raises(ConnectionError, match='некорректный ответ'):
+            asyncio.run(run(reply))
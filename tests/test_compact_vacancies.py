@@ -0,0 +1,47 @@
+import pytest
+from src.compact_vacancies import CompactVacancyList
+from src.memory_benchmark import run_benchmark
+from src.vacancy import Vacancy
+from src.vacancy_query import VacancyQuery
+
+
+def make_vacancies():
+    return [
+        Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, 150000, "RUR", "Описание", "Python",
+                "Яндекс", "1"),
+        Vacancy("Java Developer", "https://hh.ru/vacancy/2", 200000, None, "RUR", employer="Сбер"),
+        Vacancy("Go Developer", "https://hh.ru/vacancy/3", None, 3000, "USD", requirements="Python",
+                employer="Яндекс"),
+    ]
+
+
+def test_round_trip_and_sequence_access():
+    vacancies = make_vacancies()
+    compact = CompactVacancyList(vacancies)
+
+    assert len(compact) == 3
+    assert [vacancy.to_dict() for vacancy in compact] == [vacancy.to_dict() for vacancy in vacancies]
+    assert compact[-1].title == "Go Developer"
+    assert [vacancy.title for vacancy in compact[:2]] == ["Python Developer", "Java Developer"]
+    assert list(compact.salary_from) == [100000, 200000, 0]
+    assert compact.employers == ["Яндекс", "Сбер"]
+    assert compact.currencies == ["RUR", "USD"]
+    with pytest.raises(IndexError):
+        compact[3]
+
+
+def test_query_over_compact_list():
+    compact = CompactVacancyList()
+    compact.extend(make_vacancies())
+    compact.append(Vacancy("QA Engineer", "https://hh.ru/vacancy/4", 50000, None, "RUR"))
+
+    top = VacancyQuery(compact).keywords(["python"]).top(1)
+
+    assert [vacancy.title for vacancy in top] == ["Python Developer"]
+
+
+def test_memory_benchmark_shows_savings():
+    results = run_benchmark(count=2000)
+
+    assert results['интернированные строки'] < results['отдельные строки']
+    assert results['CompactVacancyList'] < results['интернированные строки']
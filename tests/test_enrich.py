@@ -0,0 +1,79 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.enrich import enrich_vacancies, html_to_text
+from src.hh_api import HeadHunterAPI
+from src.response_cache import ResponseCache
+from src.vacancy import Vacancy
+
+
+def make_item(vacancy_id, updated_at):
+    return {'id': vacancy_id, 'name': f"Developer {vacancy_id}",
+            'alternate_url': f"https://hh.ru/vacancy/{vacancy_id}",
+            'snippet': {'responsibility': 'Фрагмент…', 'requirement': 'Python'}, 'updated_at': updated_at}
+
+
+def fake_api():
+    api = Mock()
+    api.get_vacancy.side_effect = lambda vacancy_id: {
+        'id': vacancy_id, 'description': f"<p>Полное описание <strong>{vacancy_id}</strong> &amp; Django</p>"
+    }
+    return api
+
+
+def test_html_to_text():
+
+    assert html_to_text("<p>Опыт&nbsp;работы</p><ul><li>Python</li></ul>") == "Опыт работы Python"
+    assert html_to_text(None) == ""
+
+
+def test_enrich_vacancies_uses_full_description():
+
+    api = fake_api()
+    enriched = enrich_vacancies(api, [make_item('1', '2024-05-20T10:00:00+0300'), {'name': 'Без id'}], max_workers=2)
+
+    assert enriched[0]['description'] == "Полное описание 1 & Django"
+    assert enriched[1] == {'name': 'Без id'}
+    assert Vacancy.cast_to_object_list(enriched[:1])[0].description == "Полное описание 1 & Django"
+    assert api.get_vacancy.call_count == 1
+
+
+def test_enrich_vacancies_caches_by_id_and_updated_at(tmp_path):
+
+    cache = ResponseCache(str(tmp_path), ttl=float('inf'))
+    api = fake_api()
+    items = [make_item(str(n), '2024-05-20T10:00:00+0300') for n in range(5)]
+
+    enrich_vacancies(api, items, cache)
+    assert api.get_vacancy.call_count == 5
+
+    # Повторный запуск загружает только изменившуюся вакансию
+    items[2] = make_item('2', '2024-05-21T09:00:00+0300')
+    enriched = enrich_vacancies(api, items, cache)
+    assert api.get_vacancy.call_count == 6
+    assert all(item['description'].startswith("Полное описание") for item in enriched)
+
+
+def test_enrich_vacancies_keeps_snippet_on_error():
+
+    api = Mock()
+    api.get_vacancy.side_effect = ConnectionError("Ошибка при запросе к API")
+
+    enriched = enrich_vacancies(api, [make_item('1', '')])
+    assert Vacancy.cast_to_object_list(enriched)[0].description == "Фрагмент…"
+
+
+def test_get_vacancy_requests_detail_url():
+
+    api = HeadHunterAPI()
+
+    with patch.object(api._session, 'get') as mock_get:
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {'id': '42', 'description': '<p>Описание</p>'}
+        mock_get.return_value = mock_response
+
+        assert api.get_vacancy('42')['description'] == '<p>Описание</p>'
+        assert mock_get.call_args.args[0] == "https://api.hh.ru/vacancies/42"
+
+        mock_response.json.return_value = None
+        with pytest.raises(ConnectionError, match="некорректный ответ"):
+            api.get_vacancy('43')
@@ -1,6 +1,10 @@
+import threading
+import time
 import pytest
 from unittest.mock import patch, Mock
 from src.hh_api import HeadHunterAPI
+from src.ingest import fetch_many
+from src.rate_limiter import RateLimiter
 
 def test_init():
     api = HeadHunterAPI()
@@ -11,7 +15,7 @@ def test_init():
 def test_connect_success():
     api = HeadHunterAPI()
 
-    with patch('requests.get') as mock_get:
+    with patch.object(api._session, 'get') as mock_get:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_get.return_value = mock_response
@@ -24,7 +28,7 @@ def test_connect_success():
 def test_connect_failure():
     api = HeadHunterAPI()
 
-    with patch('requests.get') as mock_get:
+    with patch.object(api._session, 'get') as mock_get:
         mock_response = Mock()
         mock_response.status_code = 404
         mock_get.return_value = mock_response
@@ -37,7 +41,7 @@ def test_get_vacancies_success():
     api = HeadHunterAPI()
 
     with patch.object(api, '_connect', return_value=True):
-        with patch('requests.get') as mock_get:
+        with patch.object(api._session, 'get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -62,3 +66,113 @@ def test_get_vacancies_connection_error():
         with pytest.raises(ConnectionError, match='Не удалось подключиться к API HH.ru'):
             api.get_vacancies('Python')
 
+
+def test_get_vacancies_rejects_non_object_response():
+    api = HeadHunterAPI()
+
+    with patch.object(api, '_connect', return_value=True):
+        with patch.object(api._session, 'get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = ['not', 'a', 'page']
+            mock_response.raise_for_status = Mock()
+            mock_get.return_value = mock_response
+
+            with pytest.raises(ConnectionError, match='некорректный ответ'):
+                api.get_vacancies("Python", per_page=10)
+
+
+def test_get_vacancies_fetches_all_pages_in_order():
+    api = HeadHunterAPI(max_workers=4)
+
+    def fake_get(url, params, headers):
+        page = params['page']
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = {
+            'items': [{'id': f"{page}-{i}"} for i in range(params['per_page'])],
+            'found': 450,
+            'pages': 5,
+        }
+        return response
+
+    with patch.object(api, '_connect', return_value=True):
+        with patch.object(api._session, 'get', side_effect=fake_get) as mock_get:
+            vacancies = api.get_vacancies("Python", per_page=250)
+
+    assert mock_get.call_count == 3
+    assert len(vacancies) == 250
+    assert vacancies[0]['id'] == '0-0'
+    assert vacancies[100]['id'] == '1-0'
+    assert vacancies[-1]['id'] == '2-49'
+
+
+def test_iter_pages_yields_pages_in_order():
+    api = HeadHunterAPI(max_workers=4)
+
+    def fake_get(url, params, headers):
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = {
+            'items': [{'id': f"{params['page']}-{i}"} for i in range(params['per_page'])],
+            'found': 450,
+            'pages': 5,
+        }
+        return response
+
+    with patch.object(api, '_connect', return_value=True):
+        with patch.object(api._session, 'get', side_effect=fake_get):
+            pages = list(api.iter_pages("Python", per_page=250))
+
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert [page[0]['id'] for page in pages] == ['0-0', '1-0', '2-0']
+
+
+def test_health_check_is_cached():
+    api = HeadHunterAPI(health_check_ttl=60)
+
+    with patch.object(api._session, 'get') as mock_get:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'items': [{'id': '1'}]}
+        mock_get.return_value = mock_response
+
+        api.get_vacancies("Python", per_page=10)
+        api.get_vacancies("Java", per_page=10)
+
+        # Одна проверка доступности и два запроса вакансий через одну сессию
+        assert mock_get.call_count == 3
+
+    api._last_success -= 120
+    with patch.object(api, '_connect', return_value=False):
+        with pytest.raises(ConnectionError, match='Не удалось подключиться к API HH.ru'):
+            api.get_vacancies('Python')
+
+
+def test_parallel_searches_share_connection_limit():
+    api = HeadHunterAPI(max_workers=3, rate_limiter=RateLimiter(rate=1000, burst=1000))
+    lock = threading.Lock()
+    state = {'in_flight': 0, 'max_in_flight': 0}
+
+    def fake_get(url, params, headers):
+        with lock:
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        time.sleep(0.01)
+        with lock:
+            state['in_flight'] -= 1
+        response = Mock(status_code=200)
+        response.json.return_value = {
+            'items': [{'id': f"{params['text']}-{params['page']}-{i}"} for i in range(params['per_page'])],
+            'found': 500,
+            'pages': 5,
+        }
+        return response
+
+    with patch.object(api, '_connect', return_value=True):
+        with patch.object(api._session, 'get', side_effect=fake_get):
+            vacancies = fetch_many(api, ["Python", "Java", "Go", "QA"], per_page=500, max_workers=4)
+    api.close()
+
+    assert len(vacancies) == 2000
+    assert state['max_in_flight'] <= 3
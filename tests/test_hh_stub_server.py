@@ -0,0 +1,79 @@
+import asyncio
+import os
+import pytest
+from src.async_hh_api import AsyncHeadHunterAPI
+from src.hh_api import HeadHunterAPI
+from src.hh_stub_server import HHStubServer, generate_vacancies, load_fixtures
+from src.rate_limiter import RateLimiter
+from src.vacancy import Vacancy
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'hh_vacancies.json')
+
+
+def test_generate_vacancies_is_deterministic():
+
+    vacancies = generate_vacancies(50, seed=1)
+
+    assert vacancies == generate_vacancies(50, seed=1)
+    assert len({vacancy['id'] for vacancy in vacancies}) == 50
+    assert len(Vacancy.cast_to_object_list(vacancies)) == 50
+
+
+def test_api_fetches_all_pages_from_stub():
+
+    with HHStubServer(generate_vacancies(250)) as stub:
+        api = HeadHunterAPI(stub.base_url, max_workers=4)
+        vacancies = api.get_vacancies("", per_page=250)
+        api.close()
+
+    assert [item['id'] for item in vacancies] == [item['id'] for item in stub.vacancies]
+    # Проверка доступности и три страницы
+    assert stub.request_count == 4
+
+
+def test_api_retries_throttled_requests():
+
+    with HHStubServer(generate_vacancies(500), throttle_every=3) as stub:
+        api = HeadHunterAPI(stub.base_url, rate_limiter=RateLimiter(rate=100, burst=100, base_delay=0.01))
+        vacancies = api.get_vacancies("", per_page=500)
+        api.close()
+
+    assert len(vacancies) == 500
+    assert stub.throttled_count > 0
+
+
+def test_stub_filters_and_serves_details():
+
+    with HHStubServer(load_fixtures(FIXTURES)) as stub:
+        api = HeadHunterAPI(stub.base_url)
+
+        assert [item['id'] for item in api.get_vacancies("python")] == ['93000001', '93000002']
+        assert [item['id'] for item in api.get_vacancies("", date_from="2024-05-19T00:00:00+0300")] == \
+            ['93000001', '93000002']
+        assert "Django" in api.get_vacancy('93000001')['description']
+
+        status, body = stub.search({'per_page': '100', 'page': '20'})
+        assert status == 400
+        assert stub.detail('0')[0] == 404
+        api.close()
+
+
+def test_load_fixtures_rejects_non_vacancy_payload(tmp_path):
+
+    fixture = tmp_path / 'page.json'
+    fixture.write_text('{"items": [{"id": "1"}]}', encoding='utf-8')
+    assert load_fixtures(str(fixture)) == [{'id': '1'}]
+
+    fixture.write_text('{"items": "нет"}', encoding='utf-8')
+    with pytest.raises(ValueError, match="не содержит списка вакансий"):
+        load_fixtures(str(fixture))
+
+
+def test_async_api_against_stub():
+
+    with HHStubServer(generate_vacancies(300), latency=0.01) as stub:
+        api = AsyncHeadHunterAPI(stub.base_url, max_concurrency=3)
+        results = asyncio.run(api.search_many(["python", "java"], per_page=300))
+
+    assert set(results) == {"python", "java"}
+    assert all('python' in (item['name'] + str(item['snippet'])).lower() for item in results["python"])
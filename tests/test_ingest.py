@@ -0,0 +1,66 @@
+from unittest.mock import Mock, patch
+from src.hh_api import HeadHunterAPI
+from src.ingest import fetch_many, ingest_vacancies
+from src.json_storage import JSONStorage
+from tests.conftest import cleanup_file
+
+
+def make_item(vacancy_id, name):
+    return {'id': vacancy_id, 'name': name, 'alternate_url': f"https://hh.ru/vacancy/{vacancy_id}",
+            'salary': None, 'snippet': {}, 'employer': {'name': 'Tech Company'}}
+
+
+RESULTS = {
+    ("Python", 1): [make_item('1', "Python Developer"), make_item('2', "Fullstack Developer")],
+    ("Python", 2): [make_item('3', "Python Engineer")],
+    ("Django", 1): [make_item('2', "Fullstack Developer"), make_item('4', "Django Developer")],
+    ("Django", 2): [make_item('3', "Python Engineer")],
+}
+
+
+def fake_api():
+    api = Mock()
+    api.get_vacancies.side_effect = lambda query, per_page, area: RESULTS[(query, area)]
+    return api
+
+
+def test_fetch_many_deduplicates_by_id():
+
+    api = fake_api()
+    vacancies_data = fetch_many(api, ["Python", "Django", "Python"], areas=[1, 2], per_page=50)
+
+    assert [item['id'] for item in vacancies_data] == ['1', '2', '3', '4']
+    # Повторный запрос не загружается второй раз
+    assert api.get_vacancies.call_count == 4
+    assert fetch_many(api, [], areas=[1]) == []
+
+
+def test_ingest_vacancies_single_bulk_write():
+
+    test_file = "test_ingest.json"
+    cleanup_file(test_file)
+
+    storage = JSONStorage(test_file)
+    with patch.object(storage, 'add_vacancies', wraps=storage.add_vacancies) as add_vacancies:
+        result = ingest_vacancies(fake_api(), storage, ["Python", "Django"], areas=[1, 2])
+
+    assert add_vacancies.call_count == 1
+    assert result == (4, 0, 0)
+    assert sorted(v.vacancy_id for v in storage.get_vacancies()) == ['1', '2', '3', '4']
+
+    cleanup_file(test_file)
+
+
+def test_get_vacancies_passes_area():
+
+    api = HeadHunterAPI()
+
+    with patch.object(api, '_connect', return_value=True):
+        with patch.object(api._session, 'get') as mock_get:
+            mock_response = Mock(status_code=200)
+            mock_response.json.return_value = {'items': [], 'found': 0, 'pages': 0}
+            mock_get.return_value = mock_response
+
+            api.get_vacancies("Python", per_page=10, area=2)
+
+            assert mock_get.call_args.kwargs['params']['area'] == 2
@@ -1,6 +1,10 @@
 from src.json_storage import JSONStorage
+from src.jsonl_storage import JSONLinesStorage
+from multiprocessing import Process
+from unittest.mock import patch
 import json
 import os
+import pytest
 from tests.conftest import cleanup_file, create_test_vacancy
 
 def test_init_default_file():
@@ -84,4 +88,230 @@ def test_delete_vacancy():
     assert len(vacancies) == 1
     assert vacancies[0].title == "Java Developer"
 
-    cleanup_file(test_file)
\ No newline at end of file
+    cleanup_file(test_file)
+
+def test_add_vacancies_batch():
+
+    test_file = "test_batch_add.json"
+    cleanup_file(test_file)
+
+    storage = JSONStorage(test_file)
+    storage.add_vacancy(create_test_vacancy("Python Developer"))
+
+    batch = [create_test_vacancy(f"Developer {i}") for i in range(3)]
+    batch += [create_test_vacancy("Python Developer"), create_test_vacancy("Developer 0")]
+
+    result = storage.add_vacancies(batch)
+    assert result.affected == 3
+    assert result.skipped == 2
+    assert len(storage.get_vacancies()) == 4
+
+    cleanup_file(test_file)
+
+
+def test_delete_vacancies_batch():
+
+    test_file = "test_batch_delete.json"
+    cleanup_file(test_file)
+
+    storage = JSONStorage(test_file)
+    vacancies = [create_test_vacancy(f"Developer {i}") for i in range(3)]
+    storage.add_vacancies(vacancies)
+
+    result = storage.delete_vacancies([vacancies[0], vacancies[2], create_test_vacancy("Missing")])
+    assert result.affected == 2
+    assert result.skipped == 1
+    assert [v.title for v in storage.get_vacancies()] == ["Developer 1"]
+
+    cleanup_file(test_file)
+
+
+def test_key_index_rebuilt_when_out_of_sync():
+
+    test_file = "test_index.json"
+    cleanup_file(test_file)
+
+    storage = JSONStorage(test_file)
+    storage.add_vacancy(create_test_vacancy("Python Developer"))
+    assert os.path.exists(test_file + ".idx")
+
+    # Файл данных изменён в обход хранилища — индекс должен перестроиться
+    other = JSONStorage("test_index_other.json")
+    other.add_vacancy(create_test_vacancy("Java Developer"))
+    os.replace("test_index_other.json", test_file)
+
+    storage.add_vacancy(create_test_vacancy("Java Developer"))
+    storage.add_vacancy(create_test_vacancy("Python Developer"))
+    assert [v.title for v in storage.get_vacancies()] == ["Java Developer", "Python Developer"]
+
+    storage.delete_vacancy(create_test_vacancy("Java Developer"))
+    assert [v.title for v in JSONStorage(test_file).get_vacancies()] == ["Python Developer"]
+
+    cleanup_file(test_file)
+    cleanup_file("test_index_other.json")
+
+
+def test_same_size_replacement_is_not_served_from_cache():
+
+    test_file = "test_same_size.json"
+    cleanup_file(test_file)
+
+    storage = JSONStorage(test_file)
+    storage.add_vacancy(create_test_vacancy("Python Developer"))
+    assert [v.title for v in storage.search(["python"])] == ["Python Developer"]
+    stat = os.stat(test_file)
+
+    # Другой процесс атомарно заменяет файл содержимым того же размера с тем же временем изменения
+    other = JSONStorage("test_same_size_other.json")
+    other.add_vacancy(create_test_vacancy("Golang Developer"))
+    assert os.path.getsize("test_same_size_other.json") == stat.st_size
+    os.utime("test_same_size_other.json", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace("test_same_size_other.json", test_file)
+
+    assert [v.title for v in storage.get_vacancies()] == ["Golang Developer"]
+    assert [v.title for v in storage.search(["golang"])] == ["Golang Developer"]
+
+    cleanup_file(test_file)
+    cleanup_file("test_same_size_other.json")
+
+
+def test_damaged_file_is_not_overwritten():
+
+    test_file = "test_damaged.json"
+    cleanup_file(test_file)
+
+    storage = JSONStorage(test_file)
+    storage.add_vacancy(create_test_vacancy("Python Developer"))
+    with open(test_file, 'r+', encoding='utf-8') as f:
+        f.truncate(os.path.getsize(test_file) // 2)
+    with open(test_file, 'r', encoding='utf-8') as f:
+        damaged = f.read()
+
+    assert storage.get_vacancies() == []
+    with pytest.raises(ValueError, match="повреждён"):
+        storage.add_vacancy(create_test_vacancy("Java Developer"))
+    with pytest.raises(ValueError):
+        storage.delete_vacancy(create_test_vacancy("Python Developer"))
+    with open(test_file, 'r', encoding='utf-8') as f:
+        assert f.read() == damaged
+
+    cleanup_file(test_file)
+
+
+def test_read_cache():
+
+    test_file = "test_read_cache.json"
+    cleanup_file(test_file)
+
+    storage = JSONStorage(test_file)
+    storage.add_vacancy(create_test_vacancy("Python Developer"))
+
+    first = storage.get_vacancies()
+    with patch('json.load') as mock_load:
+        second = storage.get_vacancies({'title': 'python'})
+        mock_load.assert_not_called()
+    assert first[0] is second[0]
+
+    # Запись через хранилище и изменение файла извне сбрасывают кэш
+    storage.add_vacancy(create_test_vacancy("Java Developer"))
+    assert len(storage.get_vacancies()) == 2
+
+    with open(test_file, 'w', encoding='utf-8') as f:
+        json.dump([create_test_vacancy("Go Developer").to_dict()], f)
+    assert [v.title for v in storage.get_vacancies()] == ["Go Developer"]
+
+    cleanup_file(test_file)
+
+
+def test_iter_vacancies_streams_records():
+
+    test_file = "test_iter.json"
+    cleanup_file(test_file)
+
+    JSONStorage(test_file).add_vacancies([create_test_vacancy(f"Developer {i}") for i in range(5)])
+
+    storage = JSONStorage(test_file)
+    iterator = storage.iter_vacancies({'title': 'developer 3'})
+    assert [v.title for v in iterator] == ["Developer 3"]
+
+    with patch('json.load') as mock_load:
+        assert len(list(storage.iter_vacancies())) == 5
+        mock_load.assert_not_called()
+
+    cleanup_file(test_file)
+
+
+def test_search_uses_text_index():
+
+    test_file = "test_search.json"
+    cleanup_file(test_file)
+
+    storage = JSONStorage(test_file)
+    python_vacancy = create_test_vacancy("Python Разработчик")
+    storage.add_vacancies([python_vacancy, create_test_vacancy("Java Developer")])
+
+    assert [v.title for v in storage.search(["разработчики"])] == ["Python Разработчик"]
+    assert os.path.exists(test_file + ".fts")
+
+    # Индекс обновляется при добавлении и удалении и переиспользуется новым экземпляром
+    storage.add_vacancy(create_test_vacancy("Go Разработчик"))
+    storage.delete_vacancy(python_vacancy)
+    with patch.object(JSONStorage, '_iter_records') as mock_iter:
+        assert [v.title for v in JSONStorage(test_file).search(["разработчик"])] == ["Go Разработчик"]
+        mock_iter.assert_not_called()
+
+    assert [v.title for v in storage.search(["java", "developer"], match_all=True)] == ["Java Developer"]
+    storage.clear()
+    assert storage.search(["java"]) == []
+
+    cleanup_file(test_file)
+
+
+def test_search_reads_positions_and_vacancies_from_one_snapshot():
+
+    test_file = "test_search_snapshot.json"
+    cleanup_file(test_file)
+
+    JSONStorage(test_file).add_vacancies([create_test_vacancy(f"Разработчик {n}") for n in range(3)])
+    storage = JSONStorage(test_file)
+    os.remove(test_file + ".idx")
+    read_vacancies = storage._read_vacancies
+
+    def read_then_replace():
+        # Другой процесс заменяет файл сразу после того, как он прочитан
+        records = read_vacancies()
+        writer = JSONStorage(test_file)
+        writer.clear()
+        writer.add_vacancy(create_test_vacancy("Разработчик 2"))
+        return records
+
+    with patch.object(storage, '_read_vacancies', side_effect=read_then_replace):
+        titles = [v.title for v in storage.search(["разработчик"])]
+
+    assert titles == ["Разработчик 0", "Разработчик 1", "Разработчик 2"]
+
+    cleanup_file(test_file)
+
+
+def add_vacancies_worker(storage_class, filename, worker):
+    storage = storage_class(filename)
+    for i in range(10):
+        storage.add_vacancy(create_test_vacancy(f"Developer {worker}-{i}"))
+
+
+def test_parallel_writers_do_not_lose_data():
+
+    for storage_class, test_file in ((JSONStorage, "test_parallel.json"), (JSONLinesStorage, "test_parallel.jsonl")):
+        cleanup_file(test_file)
+        storage_class(test_file)
+
+        workers = [Process(target=add_vacancies_worker, args=(storage_class, test_file, n)) for n in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert len(storage_class(test_file).get_vacancies()) == 40
+        assert not [name for name in os.listdir('.') if name.startswith(test_file) and name.endswith('.tmp')]
+
+        cleanup_file(test_file)
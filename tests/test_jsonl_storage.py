@@ -0,0 +1,163 @@
+import os
+from src.file_utils import stat_stamp
+from src.jsonl_storage import JSONLinesStorage
+from src.text_index import InvertedIndex
+from tests.conftest import cleanup_file, create_test_vacancy
+
+
+def count_lines(filename):
+    with open(filename, 'r', encoding='utf-8') as f:
+        return len(f.readlines())
+
+
+def test_add_appends_single_line():
+
+    test_file = "test_log_add.jsonl"
+    cleanup_file(test_file)
+
+    storage = JSONLinesStorage(test_file)
+
+    storage.add_vacancy(create_test_vacancy("Python Developer", "Tech Company"))
+    storage.add_vacancy(create_test_vacancy("Java Developer", "Bank Corp"))
+    storage.add_vacancy(create_test_vacancy("Python Developer", "Tech Company"))
+
+    assert count_lines(test_file) == 2
+    vacancies = storage.get_vacancies()
+    assert [v.title for v in vacancies] == ["Python Developer", "Java Developer"]
+
+    cleanup_file(test_file)
+
+
+def test_delete_and_clear_write_tombstones():
+
+    test_file = "test_log_delete.jsonl"
+    cleanup_file(test_file)
+
+    storage = JSONLinesStorage(test_file)
+
+    vacancy1 = create_test_vacancy("Python Developer", "Company A")
+    vacancy2 = create_test_vacancy("Java Developer", "Company B")
+    storage.add_vacancy(vacancy1)
+    storage.add_vacancy(vacancy2)
+
+    storage.delete_vacancy(vacancy1)
+    assert count_lines(test_file) == 3
+    assert [v.title for v in storage.get_vacancies()] == ["Java Developer"]
+
+    storage.clear()
+    assert count_lines(test_file) == 4
+    assert storage.get_vacancies() == []
+
+    # После очистки вакансию можно добавить снова
+    storage.add_vacancy(vacancy1)
+    assert [v.title for v in JSONLinesStorage(test_file).get_vacancies()] == ["Python Developer"]
+
+    cleanup_file(test_file)
+
+
+def test_compaction():
+
+    test_file = "test_log_compact.jsonl"
+    cleanup_file(test_file)
+
+    storage = JSONLinesStorage(test_file, compact_threshold=4)
+
+    vacancies = [create_test_vacancy(f"Developer {i}") for i in range(3)]
+    for vacancy in vacancies:
+        storage.add_vacancy(vacancy)
+
+    storage.delete_vacancy(vacancies[0])
+    assert count_lines(test_file) == 4
+
+    # Второе удаление превышает порог и запускает уплотнение
+    storage.delete_vacancy(vacancies[1])
+    assert count_lines(test_file) == 1
+    assert [v.title for v in storage.get_vacancies()] == ["Developer 2"]
+
+    storage.add_vacancy(vacancies[0])
+    storage.delete_vacancy(vacancies[0])
+    storage.compact()
+    assert count_lines(test_file) == 1
+
+    cleanup_file(test_file)
+
+
+def test_batch_operations():
+
+    test_file = "test_log_batch.jsonl"
+    cleanup_file(test_file)
+
+    storage = JSONLinesStorage(test_file)
+    vacancies = [create_test_vacancy(f"Developer {i}") for i in range(3)]
+
+    result = storage.add_vacancies(vacancies + [vacancies[0]])
+    assert result == (3, 1)
+    assert count_lines(test_file) == 3
+
+    result = storage.delete_vacancies([vacancies[1], create_test_vacancy("Missing")])
+    assert result == (1, 1)
+    assert [v.title for v in storage.get_vacancies()] == ["Developer 0", "Developer 2"]
+
+    cleanup_file(test_file)
+
+
+def test_iter_vacancies_skips_deleted_records():
+
+    test_file = "test_log_iter.jsonl"
+    cleanup_file(test_file)
+
+    storage = JSONLinesStorage(test_file)
+    vacancies = [create_test_vacancy(f"Developer {i}") for i in range(3)]
+    storage.add_vacancies(vacancies)
+    storage.delete_vacancy(vacancies[0])
+    storage.add_vacancy(vacancies[0])
+    storage.delete_vacancy(vacancies[1])
+
+    titles = [v.title for v in JSONLinesStorage(test_file).iter_vacancies()]
+    assert titles == ["Developer 2", "Developer 0"]
+    assert [v.title for v in storage.iter_vacancies({'title': '0'})] == ["Developer 0"]
+
+    cleanup_file(test_file)
+
+
+def test_append_after_torn_line():
+
+    test_file = "test_log_torn.jsonl"
+    cleanup_file(test_file)
+
+    storage = JSONLinesStorage(test_file)
+    storage.add_vacancy(create_test_vacancy("Python Developer"))
+    # Запись, прерванная на середине строки
+    with open(test_file, 'a', encoding='utf-8') as f:
+        f.write('{"title": "Java Devel')
+
+    storage.add_vacancy(create_test_vacancy("Go Developer"))
+
+    assert [v.title for v in storage.get_vacancies()] == ["Python Developer", "Go Developer"]
+    assert [v.title for v in JSONLinesStorage(test_file).get_vacancies()] == ["Python Developer", "Go Developer"]
+    assert count_lines(test_file) == 2
+
+    cleanup_file(test_file)
+
+
+def test_text_index_is_saved_on_close_not_on_append():
+
+    test_file = "test_log_fts.jsonl"
+    cleanup_file(test_file)
+
+    storage = JSONLinesStorage(test_file)
+    storage.add_vacancy(create_test_vacancy("Python Developer"))
+    assert [v.title for v in storage.search(["python"])] == ["Python Developer"]
+    index_mtime = os.stat(test_file + '.fts').st_mtime_ns
+
+    storage.add_vacancy(create_test_vacancy("Senior Python"))
+    storage.delete_vacancy(create_test_vacancy("Python Developer"))
+
+    assert os.stat(test_file + '.fts').st_mtime_ns == index_mtime
+    assert [v.title for v in storage.search(["python"])] == ["Senior Python"]
+
+    storage.close()
+    stamp = stat_stamp(os.stat(test_file))
+    assert InvertedIndex.load(test_file + '.fts', stamp).search(["python"]) == {"https://hh.ru/vacancy/Senior_Python"}
+
+    cleanup_file(test_file)
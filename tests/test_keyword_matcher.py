@@ -0,0 +1,71 @@
+from src.keyword_matcher import KeywordMatcher
+from src.vacancy import Vacancy
+
+
+def make_vacancy(title, description="", requirements=""):
+    return Vacancy(title, f"https://hh.ru/vacancy/{title.replace(' ', '_')}", description=description,
+                   requirements=requirements)
+
+
+VACANCIES = [
+    make_vacancy("Python разработчик", "Разработка сервисов на Django", "Опыт работы с PostgreSQL"),
+    make_vacancy("Java Developer", "Spring Boot, микросервисы", "Знание Kafka"),
+    make_vacancy("Ведущий аналитик", "Машинное обучение и ёмкие отчёты", "SQL, Python"),
+    make_vacancy("C++ программист", "Разработчики встраиваемых систем", ""),
+]
+
+
+def titles(vacancies):
+    return [vacancy.title for vacancy in vacancies]
+
+
+def test_substring_any_matches_previous_semantics():
+
+    matcher = KeywordMatcher(["python", "KAFKA"])
+    assert titles(matcher.filter(VACANCIES)) == ["Python разработчик", "Java Developer", "Ведущий аналитик"]
+    # Подстрока внутри слова тоже подходит
+    assert titles(KeywordMatcher(["postgres"]).filter(VACANCIES)) == ["Python разработчик"]
+
+
+def test_match_all():
+
+    assert titles(KeywordMatcher(["python", "sql"], match_all=True).filter(VACANCIES)) == \
+        ["Python разработчик", "Ведущий аналитик"]
+    assert KeywordMatcher(["python", "kafka"], match_all=True).filter(VACANCIES) == []
+    # Ключевые слова, входящие одно в другое, засчитываются по одному слову текста
+    assert titles(KeywordMatcher(["разработ", "разработчик"], match_all=True).filter(VACANCIES)) == \
+        ["Python разработчик", "C++ программист"]
+
+
+def test_whole_word_and_stem():
+
+    assert titles(KeywordMatcher(["разработ"], whole_word=True).filter(VACANCIES)) == []
+    assert titles(KeywordMatcher(["сервисов"], whole_word=True).filter(VACANCIES)) == ["Python разработчик"]
+    # Основа слова совпадает с другими формами, ё и е не различаются
+    assert titles(KeywordMatcher(["разработчики"], stem=True).filter(VACANCIES)) == \
+        ["Python разработчик", "C++ программист"]
+    assert titles(KeywordMatcher(["емкий"], stem=True).filter(VACANCIES)) == ["Ведущий аналитик"]
+
+
+def test_phrases():
+
+    assert titles(KeywordMatcher(["c++"]).filter(VACANCIES)) == ["C++ программист"]
+    assert titles(KeywordMatcher(["spring  boot"], whole_word=True).filter(VACANCIES)) == ["Java Developer"]
+    assert titles(KeywordMatcher(["машинное обуч"], stem=True, match_all=True).filter(VACANCIES)) == \
+        ["Ведущий аналитик"]
+    assert KeywordMatcher(["ring boo"], whole_word=True).filter(VACANCIES) == []
+
+
+def test_empty_matcher_accepts_everything():
+
+    matcher = KeywordMatcher(["", "  "])
+    assert not matcher
+    assert matcher.filter(VACANCIES) == VACANCIES
+
+
+def test_search_text_is_cached():
+
+    vacancy = make_vacancy("Python Developer", "Ёлка")
+    assert vacancy.search_text == "python developer елка "
+    assert vacancy.search_text is vacancy.search_text
+    assert vacancy.search_tokens == {"python", "developer", "елка"}
@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.jsonl_storage import JSONLinesStorage
+from src.pipeline import ingest_pipeline
+from tests.conftest import cleanup_file
+
+
+def make_page(page, size=10):
+    return [{'id': f"{page}-{i}", 'name': f"Developer {page}-{i}",
+             'alternate_url': f"https://hh.ru/vacancy/{page}-{i}",
+             'salary': None, 'snippet': {}, 'employer': {'name': 'Tech Company'}} for i in range(size)]
+
+
+def fake_api(page_count, error=None):
+    def iter_pages(search_query, per_page, area):
+        for page in range(page_count):
+            yield make_page(page)
+        if error is not None:
+            raise error
+
+    api = Mock()
+    api.iter_pages.side_effect = iter_pages
+    return api
+
+
+def test_pipeline_stores_in_batches():
+
+    test_file = "test_pipeline.jsonl"
+    cleanup_file(test_file)
+
+    storage = JSONLinesStorage(test_file)
+    batches = []
+    with patch.object(storage, 'add_vacancies', wraps=storage.add_vacancies) as add_vacancies:
+        result = ingest_pipeline(fake_api(5), storage, "Python", per_page=50, batch_size=20, queue_size=1,
+                                 on_batch=batches.append)
+
+    assert result == (50, 0, 0)
+    assert add_vacancies.call_count == 3
+    assert [len(batch) for batch in batches] == [20, 20, 10]
+    # Порядок вакансий совпадает с порядком страниц
+    assert [v.vacancy_id for v in storage.get_vacancies()][:3] == ['0-0', '0-1', '0-2']
+
+    cleanup_file(test_file)
+
+
+def test_pipeline_reraises_fetch_error_after_storing_received_pages():
+
+    test_file = "test_pipeline_error.jsonl"
+    cleanup_file(test_file)
+
+    storage = JSONLinesStorage(test_file)
+    with pytest.raises(ConnectionError):
+        ingest_pipeline(fake_api(2, ConnectionError("Ошибка при запросе к API")), storage, "Python", batch_size=5)
+
+    assert len(storage.get_vacancies()) == 20
+
+    cleanup_file(test_file)
+
+
+def test_pipeline_stops_stages_when_storage_fails():
+
+    storage = Mock()
+    storage.add_vacancies.side_effect = OSError("Нет места на диске")
+
+    with pytest.raises(OSError):
+        ingest_pipeline(fake_api(100), storage, "Python", batch_size=10, queue_size=1)
+    assert storage.add_vacancies.call_count == 1
+
+
+def test_pipeline_counts_invalid_items():
+
+    test_file = "test_pipeline_invalid.jsonl"
+    cleanup_file(test_file)
+
+    api = Mock()
+    page = make_page(0, size=3)
+    page[1]['name'] = ''
+    api.iter_pages.side_effect = lambda search_query, per_page, area: iter([page])
+
+    result = ingest_pipeline(api, JSONLinesStorage(test_file), "Python")
+
+    assert result == (2, 0, 1)
+    assert result.invalid == 1
+
+    cleanup_file(test_file)
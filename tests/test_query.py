@@ -0,0 +1,41 @@
+import pytest
+from src.query import Condition, compile_criteria, parse_criteria
+from src.vacancy import Vacancy
+
+
+def make_vacancies():
+    return [
+        Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, 150000, "RUR", employer="Яндекс"),
+        Vacancy("Senior Python", "https://hh.ru/vacancy/2", 200000, 250000, "RUR", employer="Bank Corp"),
+        Vacancy("Java Developer", "https://hh.ru/vacancy/3", 3000, 4000, "USD", employer="Bank Corp"),
+    ]
+
+
+def test_parse_criteria():
+    conditions = parse_criteria({'title': 'Python', 'salary_from': {'gte': 150000, 'lt': 300000}})
+
+    assert conditions == [
+        Condition('title', 'contains', 'python'),
+        Condition('salary_from', 'gte', 150000),
+        Condition('salary_from', 'lt', 300000),
+    ]
+
+    with pytest.raises(ValueError, match='Неизвестный оператор запроса'):
+        parse_criteria({'salary_from': {'between': (1, 2)}})
+
+
+def test_compile_criteria_operators():
+    vacancies = make_vacancies()
+
+    def titles(criteria):
+        return [v.title for v in filter(compile_criteria(criteria), vacancies)]
+
+    assert titles({'title': 'python'}) == ["Python Developer", "Senior Python"]
+    assert titles({'salary_from': {'gte': 150000}, 'currency': {'eq': 'RUR'}}) == ["Senior Python"]
+    assert titles({'currency': {'ne': 'RUR'}}) == ["Java Developer"]
+    assert titles({'employer': {'in': ['Яндекс', 'Google']}}) == ["Python Developer"]
+    assert titles({'title': {'contains': 'DEVELOPER'}, 'salary_to': {'lte': 150000}}) == [
+        "Python Developer", "Java Developer"
+    ]
+    assert titles({'unknown': 'value'}) == []
+    assert titles(None) == ["Python Developer", "Senior Python", "Java Developer"]
@@ -0,0 +1,73 @@
+from unittest.mock import Mock, patch
+import pytest
+import requests
+from src.hh_api import HeadHunterAPI
+from src.rate_limiter import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_token_bucket_limits_rate():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2.0, burst=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(6):
+        limiter.acquire()
+
+    # Два запроса из запаса корзины, остальные — по одному в полсекунды
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_adaptive_rate_and_retry_after_pause():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=8.0, burst=1, min_rate=1.0, max_rate=10.0, clock=clock, sleep=clock.sleep)
+
+    limiter.on_throttle(retry_after=3.0)
+    assert limiter.rate == 4.0
+    limiter.acquire()
+    assert clock.now >= 3.0
+
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate == 10.0
+
+
+def test_api_retries_throttled_requests():
+    clock = FakeClock()
+    api = HeadHunterAPI(rate_limiter=RateLimiter(clock=clock, sleep=clock.sleep), max_retries=3)
+
+    throttled = Mock(status_code=429, headers={'Retry-After': '2'})
+    ok = Mock(status_code=200, headers={})
+    ok.json.return_value = {'items': [{'id': '1'}]}
+
+    with patch.object(api, '_connect', return_value=True):
+        with patch.object(api._session, 'get', side_effect=[throttled, throttled, ok]) as mock_get:
+            assert api.get_vacancies("Python", per_page=10) == [{'id': '1'}]
+
+    assert mock_get.call_count == 3
+    assert clock.now >= 4.0
+
+    with patch.object(api, '_connect', return_value=True):
+        with patch.object(api._session, 'get', return_value=Mock(status_code=503, headers={})) as mock_get:
+            mock_get.return_value.raise_for_status.side_effect = requests.HTTPError("503")
+            with pytest.raises(ConnectionError):
+                api.get_vacancies("Python", per_page=10)
+    assert mock_get.call_count == 4
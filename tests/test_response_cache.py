@@ -0,0 +1,109 @@
+import os
+import threading
+import time
+from unittest.mock import Mock, patch
+from src.hh_api import HeadHunterAPI
+from src.response_cache import ResponseCache
+
+
+def make_response(status_code=200, body=None, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = body
+    response.headers = headers or {}
+    response.raise_for_status = Mock()
+    return response
+
+
+def test_make_key_normalizes_params():
+    key = ResponseCache.make_key("https://api.hh.ru/vacancies", {'text': ' Python  Developer', 'page': 0})
+    same = ResponseCache.make_key("https://api.hh.ru/vacancies", {'page': '0', 'text': 'python developer'})
+    other = ResponseCache.make_key("https://api.hh.ru/vacancies", {'text': 'python developer', 'page': 1})
+
+    assert key == same
+    assert key != other
+
+
+def test_hot_query_served_from_cache(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    api = HeadHunterAPI(cache=cache)
+
+    with patch.object(api._session, 'get', return_value=make_response(body={'items': [{'id': '1'}]})) as mock_get:
+        assert api.get_vacancies("Python", per_page=10) == [{'id': '1'}]
+        assert api.get_vacancies("python", per_page=10) == [{'id': '1'}]
+
+    # Проверка доступности и один запрос страницы; повторный поиск не обращается к сети
+    assert mock_get.call_count == 2
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'revalidations': 0, 'hit_rate': 0.5}
+
+
+def test_stale_entry_is_revalidated_with_etag(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=0)
+    api = HeadHunterAPI(cache=cache)
+    api._last_success = time.monotonic()
+
+    first = make_response(body={'items': [{'id': '1'}]}, headers={'ETag': '"v1"'})
+    with patch.object(api._session, 'get', return_value=first):
+        api.get_vacancies("Python", per_page=10)
+
+    with patch.object(api._session, 'get', return_value=make_response(status_code=304)) as mock_get:
+        assert api.get_vacancies("Python", per_page=10) == [{'id': '1'}]
+        assert mock_get.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+
+    assert cache.stats()['revalidations'] == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60, max_bytes=450)
+
+    cache.store('a', 'x' * 100)
+    cache.store('b', 'x' * 100)
+    past = time.time() - 100
+    os.utime(tmp_path / 'a.json', (past, past))
+    os.utime(tmp_path / 'b.json', (past - 10, past - 10))
+    cache.lookup('b')
+
+    cache.store('c', 'x' * 100)
+
+    assert sorted(os.listdir(tmp_path)) == ['b.json', 'c.json']
+
+
+def test_directory_is_scanned_only_when_size_is_exceeded(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path), ttl=60, max_bytes=1000)
+    scans = []
+    scan = cache._scan
+    monkeypatch.setattr(cache, '_scan', lambda: scans.append(1) or scan())
+
+    for key in 'abcde':
+        cache.store(key, 'x' * 100)
+    assert len(scans) == 1
+
+    cache.store('a', 'x' * 100)
+    for key in 'fghij':
+        cache.store(key, 'x' * 100)
+
+    assert len(scans) > 1
+    assert sum(entry.stat().st_size for entry in os.scandir(tmp_path)) <= 1000
+    assert cache._total_bytes == sum(entry.stat().st_size for entry in os.scandir(tmp_path))
+
+
+def test_concurrent_stores_keep_stats_and_size(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60, max_bytes=10 ** 9)
+    cache.store('warmup', 'x')
+
+    def worker(n):
+        for i in range(50):
+            key = f'{n}-{i % 10}'
+            cache.store(key, 'x' * (n * 10 + i))
+            cache.lookup(key)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats['misses'] == 401
+    assert stats['hits'] == 400
+    assert cache._total_bytes == sum(entry.stat().st_size for entry in os.scandir(tmp_path))
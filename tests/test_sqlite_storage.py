@@ -0,0 +1,126 @@
+import sqlite3
+from src.sqlite_storage import SQLiteStorage
+from src.vacancy import Vacancy
+from tests.conftest import cleanup_file, create_test_vacancy
+
+
+def test_add_and_get_vacancies():
+
+    test_file = "test_sqlite_add.db"
+    cleanup_file(test_file)
+
+    storage = SQLiteStorage(test_file)
+
+    result = storage.add_vacancies([
+        create_test_vacancy("Python Developer", "Tech Company"),
+        create_test_vacancy("Java Developer", "Bank Corp"),
+        create_test_vacancy("Python Developer", "Tech Company"),
+    ])
+    assert result == (2, 1)
+
+    storage.add_vacancy(create_test_vacancy("Java Developer", "Bank Corp"))
+
+    vacancies = storage.get_vacancies()
+    assert [v.title for v in vacancies] == ["Python Developer", "Java Developer"]
+    assert vacancies[0].salary_from == 100000
+    assert vacancies[0].employer == "Tech Company"
+
+    storage.close()
+    cleanup_file(test_file)
+
+
+def test_get_vacancies_by_criteria():
+
+    test_file = "test_sqlite_criteria.db"
+    cleanup_file(test_file)
+
+    storage = SQLiteStorage(test_file)
+    storage.add_vacancies([
+        create_test_vacancy("Python Разработчик", "Яндекс"),
+        create_test_vacancy("Java Developer", "Bank Corp"),
+    ])
+
+    assert [v.title for v in storage.get_vacancies({'title': 'разработчик'})] == ["Python Разработчик"]
+    assert [v.title for v in storage.get_vacancies({'employer': 'bank'})] == ["Java Developer"]
+    assert storage.get_vacancies({'title': 'python', 'employer': 'bank'}) == []
+    assert storage.get_vacancies({'unknown': 'value'}) == []
+
+    storage.close()
+    cleanup_file(test_file)
+
+
+def test_search_and_delete():
+
+    test_file = "test_sqlite_search.db"
+    cleanup_file(test_file)
+
+    storage = SQLiteStorage(test_file)
+    python_vacancy = Vacancy("Python Developer", "https://hh.ru/vacancy/1",
+                             description="Разработка сервисов", requirements="Django")
+    java_vacancy = Vacancy("Java Developer", "https://hh.ru/vacancy/2", requirements="Spring")
+    storage.add_vacancies([python_vacancy, java_vacancy])
+
+    assert [v.title for v in storage.search(["django"])] == ["Python Developer"]
+    assert [v.title for v in storage.search(["разработ"])] == ["Python Developer"]
+    assert len(storage.search(["django", "spring"])) == 2
+    assert storage.search(["django", "spring"], match_all=True) == []
+
+    result = storage.delete_vacancies([python_vacancy, python_vacancy])
+    assert result == (1, 0)
+    assert storage.search(["django"]) == []
+
+    storage.clear()
+    assert storage.get_vacancies() == []
+
+    storage.close()
+    cleanup_file(test_file)
+
+
+def test_get_vacancies_with_operators():
+
+    test_file = "test_sqlite_operators.db"
+    cleanup_file(test_file)
+
+    storage = SQLiteStorage(test_file)
+    storage.add_vacancies([
+        Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, 150000, "RUR", employer="Яндекс"),
+        Vacancy("Senior Python", "https://hh.ru/vacancy/2", 200000, 250000, "RUR", employer="Bank Corp"),
+        Vacancy("Java Developer", "https://hh.ru/vacancy/3", 3000, 4000, "USD", employer="Bank Corp"),
+    ])
+
+    def titles(criteria):
+        return [v.title for v in storage.get_vacancies(criteria)]
+
+    assert titles({'salary_from': {'gte': 150000}, 'currency': {'eq': 'RUR'}}) == ["Senior Python"]
+    assert titles({'employer': {'in': ['Bank Corp']}, 'title': 'java'}) == ["Java Developer"]
+    assert titles({'salary_to': {'gt': 4000, 'lt': 250000}}) == ["Python Developer"]
+    assert titles({'employer': {'in': []}}) == []
+    assert titles({'title': {}}) == ["Python Developer", "Senior Python", "Java Developer"]
+    assert [v.title for v in storage.iter_vacancies({'title': {}})] == titles({})
+
+    storage.close()
+    cleanup_file(test_file)
+
+
+def test_adds_vacancy_id_column_to_existing_database():
+
+    test_file = "test_sqlite_migrate.db"
+    cleanup_file(test_file)
+
+    connection = sqlite3.connect(test_file)
+    connection.execute("CREATE TABLE vacancies (id INTEGER PRIMARY KEY, title TEXT NOT NULL, url TEXT NOT NULL, "
+                       "salary_from INTEGER NOT NULL DEFAULT 0, salary_to INTEGER NOT NULL DEFAULT 0, "
+                       "currency TEXT NOT NULL DEFAULT '', description TEXT NOT NULL DEFAULT '', "
+                       "requirements TEXT NOT NULL DEFAULT '', employer TEXT NOT NULL DEFAULT '')")
+    connection.execute("INSERT INTO vacancies (title, url) VALUES ('Old Developer', 'https://hh.ru/vacancy/1')")
+    connection.commit()
+    connection.close()
+
+    storage = SQLiteStorage(test_file)
+    storage.add_vacancy(Vacancy("New Developer", "https://hh.ru/vacancy/2", vacancy_id="2"))
+
+    vacancies = storage.get_vacancies()
+    assert [(v.title, v.vacancy_id) for v in vacancies] == [("Old Developer", ""), ("New Developer", "2")]
+
+    storage.close()
+    cleanup_file(test_file)
@@ -0,0 +1,36 @@
+import json
+from src.string_pool import StringPool
+from src.vacancy import Vacancy
+
+
+def test_pool_codes_and_shared_values():
+    pool = StringPool(["RUR", "USD"])
+    first, second = json.loads('["Яндекс", "Яндекс"]')
+
+    assert first is not second
+    assert pool.intern(first) is pool.intern(second)
+    assert pool.code("RUR") == 0
+    assert pool.code("Яндекс") == 2
+    assert pool.value(2) == "Яндекс"
+    assert "USD" in pool
+    assert len(pool) == 3
+
+    pool.clear()
+    assert len(pool) == 0
+    assert "RUR" not in pool
+
+
+def test_loaded_vacancies_share_strings():
+    records = json.loads(json.dumps([
+        {'title': "Python Developer", 'url': "https://hh.ru/vacancy/1", 'currency': "RUR",
+         'requirements': "Опыт работы с Python", 'employer': "Яндекс"},
+        {'title': "Go Developer", 'url': "https://hh.ru/vacancy/2", 'currency': "RUR",
+         'requirements': "Опыт работы с Python", 'employer': "Яндекс"},
+    ], ensure_ascii=False))
+
+    first, second = Vacancy.from_dicts(records)
+
+    assert first.employer is second.employer
+    assert first.currency is second.currency
+    # Требования почти у каждой вакансии свои, поэтому не интернируются и не удерживаются после удаления вакансий
+    assert first.requirements is not second.requirements
@@ -0,0 +1,161 @@
+from unittest.mock import Mock
+from src.hh_api import HeadHunterAPI
+from src.hh_stub_server import HHStubServer, generate_vacancies
+from src.json_storage import JSONStorage
+from src.jsonl_storage import JSONLinesStorage
+from src.sqlite_storage import SQLiteStorage
+from src.sync import latest_published_at, sync_vacancies, watermark_key
+from src.vacancy import Vacancy
+from tests.conftest import cleanup_file, create_test_vacancy
+
+STORAGES = ((JSONStorage, "test_sync.json"), (JSONLinesStorage, "test_sync.jsonl"), (SQLiteStorage, "test_sync.db"))
+
+
+def make_item(number, published_at, salary_from=100000):
+    return {
+        'name': f"Python Developer {number}",
+        'alternate_url': f"https://hh.ru/vacancy/{number}",
+        'salary': {'from': salary_from, 'to': None, 'currency': 'RUR'},
+        'snippet': {'responsibility': 'Разработка', 'requirement': 'Python'},
+        'employer': {'name': 'Tech Company'},
+        'published_at': published_at
+    }
+
+
+def close(storage):
+    if isinstance(storage, SQLiteStorage):
+        storage.close()
+
+
+def test_upsert_vacancies():
+
+    for storage_class, test_file in STORAGES:
+        cleanup_file(test_file)
+        storage = storage_class(test_file)
+
+        python_dev = create_test_vacancy("Python Developer")
+        java_dev = create_test_vacancy("Java Developer")
+        assert storage.upsert_vacancies([python_dev, java_dev]) == (2, 0)
+
+        raised = Vacancy.from_dict({**python_dev.to_dict(), 'salary_from': 200000, 'description': 'Новое описание'})
+        go_dev = create_test_vacancy("Go Developer")
+        assert storage.upsert_vacancies([raised, java_dev, go_dev]) == (2, 1)
+
+        vacancies = {v.title: v for v in storage.get_vacancies()}
+        assert len(vacancies) == 3
+        assert vacancies["Python Developer"].salary_from == 200000
+        # Обновлённый текст попадает в полнотекстовый поиск, прежний — нет
+        assert [v.title for v in storage.search(["описание"])] == ["Python Developer"]
+        assert {v.title for v in storage.search(["description"])} == {"Java Developer", "Go Developer"}
+
+        close(storage)
+        cleanup_file(test_file)
+
+
+def test_watermark_persists_and_resets_on_clear():
+
+    for storage_class, test_file in STORAGES:
+        cleanup_file(test_file)
+        storage = storage_class(test_file)
+
+        assert storage.get_watermark("python") is None
+        storage.set_watermark("python", "2024-05-20T12:00:00+0300")
+        close(storage)
+
+        storage = storage_class(test_file)
+        assert storage.get_watermark("python") == "2024-05-20T12:00:00+0300"
+        storage.clear()
+        assert storage.get_watermark("python") is None
+
+        close(storage)
+        cleanup_file(test_file)
+
+
+def test_latest_published_at():
+
+    items = [make_item(1, "2024-05-20T12:00:00+0300"), make_item(2, "2024-05-20T10:00:00+0000"),
+             make_item(3, None), make_item(4, "не дата")]
+    # 10:00 UTC позже, чем 12:00 по Москве
+    assert latest_published_at(items) == "2024-05-20T10:00:00+0000"
+    assert latest_published_at([]) is None
+    assert watermark_key("  Python   Разработчик ") == "python разработчик"
+
+
+def test_sync_vacancies_fetches_only_delta():
+
+    for storage_class, test_file in STORAGES:
+        cleanup_file(test_file)
+        storage = storage_class(test_file)
+        api = Mock()
+
+        api.get_vacancies.return_value = [make_item(1, "2024-05-20T10:00:00+0300"),
+                                          make_item(2, "2024-05-20T12:00:00+0300")]
+        assert sync_vacancies(api, storage, "Python", 100) == (2, 0, 0)
+        api.get_vacancies.assert_called_with("Python", 100, date_from=None, order_by='publication_time')
+        assert storage.get_watermark("python") == "2024-05-20T12:00:00+0300"
+
+        # Вакансия на границе отметки приходит повторно и не считается изменённой
+        api.get_vacancies.return_value = [make_item(2, "2024-05-20T12:00:00+0300"),
+                                          make_item(1, "2024-05-21T09:00:00+0300", salary_from=150000),
+                                          make_item(3, "2024-05-21T08:00:00+0300")]
+        assert sync_vacancies(api, storage, "python ", 100) == (2, 1, 0)
+        api.get_vacancies.assert_called_with("python ", 100, date_from="2024-05-20T12:00:00+0300",
+                                             order_by='publication_time')
+        assert storage.get_watermark("python") == "2024-05-21T09:00:00+0300"
+
+        vacancies = {v.url: v for v in storage.get_vacancies()}
+        assert len(vacancies) == 3
+        assert vacancies["https://hh.ru/vacancy/1"].salary_from == 150000
+
+        # Некорректная запись API не сохраняется, но учитывается в результате
+        api.get_vacancies.return_value = [{**make_item(4, "2024-05-21T09:00:00+0300"), 'alternate_url': ''}]
+        assert sync_vacancies(api, storage, "Python", 100) == (0, 0, 1)
+
+        # Пустая дельта не сдвигает отметку
+        api.get_vacancies.return_value = []
+        assert sync_vacancies(api, storage, "Python", 100) == (0, 0, 0)
+        assert storage.get_watermark("python") == "2024-05-21T09:00:00+0300"
+
+        close(storage)
+        cleanup_file(test_file)
+
+
+def test_sync_drains_delta_larger_than_per_page():
+
+    for storage_class, test_file in STORAGES:
+        cleanup_file(test_file)
+        storage = storage_class(test_file)
+        # Выдача заглушки идёт от новых к старым: первые 150 вакансий — новые
+        vacancies_data = generate_vacancies(250)
+
+        with HHStubServer(vacancies_data[150:]) as stub:
+            api = HeadHunterAPI(base_url=stub.base_url)
+            assert sync_vacancies(api, storage, "", 100) == (100, 0, 0)
+            stub.vacancies[:0] = vacancies_data[:150]
+
+            synced = []
+            result = sync_vacancies(api, storage, "", 100, on_batch=synced.extend)
+            assert result.affected == 150
+            assert len(synced) == result.affected + result.skipped
+            assert storage.get_watermark("") == vacancies_data[0]['published_at']
+            assert sync_vacancies(api, storage, "", 100) == (0, 1, 0)
+            api.close()
+
+        assert len(storage.get_vacancies()) == 250
+        close(storage)
+        cleanup_file(test_file)
+
+
+def test_sync_keeps_watermark_when_window_does_not_move():
+
+    storage = JSONStorage("test_sync_stuck.json")
+    storage.clear()
+    storage.set_watermark("python", "2024-05-20T12:00:00+0300")
+    api = Mock()
+    # Больше per_page вакансий с одной и той же датой публикации
+    api.get_vacancies.return_value = [make_item(number, "2024-05-21T09:00:00+0300") for number in range(2)]
+
+    assert sync_vacancies(api, storage, "Python", 2) == (2, 0, 0)
+    assert storage.get_watermark("python") == "2024-05-20T12:00:00+0300"
+
+    cleanup_file("test_sync_stuck.json")
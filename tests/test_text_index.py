@@ -0,0 +1,67 @@
+import pytest
+from src.json_storage import JSONStorage
+from src.jsonl_storage import JSONLinesStorage
+from src.sqlite_storage import SQLiteStorage
+from src.text_index import InvertedIndex, normalize_word, tokenize
+from src.vacancy import Vacancy
+
+
+def test_normalize_word():
+    assert normalize_word("Разработчика") == normalize_word("разработчики") == "разработчик"
+    assert normalize_word("Developers") == normalize_word("developer") == "develop"
+    assert normalize_word("Ёлка") == "елк"
+    assert normalize_word("SQL") == "sql"
+
+
+def test_tokenize():
+    assert tokenize("Python-разработчик, опыт с Django!") == ["python", "разработчик", "опыт", "с", "django"]
+
+
+def test_inverted_index_search():
+    index = InvertedIndex()
+    index.add("1", "Python разработчик Django")
+    index.add("2", "Java разработчики Spring")
+    index.add("3", "Python аналитик")
+
+    assert index.search(["разработчик"]) == {"1", "2"}
+    assert index.search(["python", "spring"]) == {"1", "2", "3"}
+    assert index.search(["python", "разработчика"], match_all=True) == {"1"}
+    assert index.search(["golang"]) == set()
+
+    index.remove("1")
+    assert index.search(["django"]) == set()
+    assert len(index) == 2
+
+    restored = InvertedIndex.from_dict(index.to_dict())
+    assert restored.search(["python"]) == {"3"}
+
+
+SEARCH_VACANCIES = [
+    Vacancy("Python Разработчик", "https://hh.ru/vacancy/1", requirements="Django"),
+    Vacancy("JavaScript Developer", "https://hh.ru/vacancy/2", description="Фронтенд"),
+    Vacancy("Java разработчики", "https://hh.ru/vacancy/3", requirements="Spring"),
+    Vacancy("Аналитик", "https://hh.ru/vacancy/4", description="Ёлка отчётов"),
+]
+
+
+@pytest.mark.parametrize("words, match_all, expected", [
+    (["Разработ"], False, ["Python Разработчик", "Java разработчики"]),
+    (["Java"], False, ["JavaScript Developer", "Java разработчики"]),
+    (["разработчики"], False, ["Python Разработчик", "Java разработчики"]),
+    (["developers"], False, ["JavaScript Developer"]),
+    (["java", "разработчик"], True, ["Java разработчики"]),
+    (["django", "spring"], False, ["Python Разработчик", "Java разработчики"]),
+    (["ёлка"], False, ["Аналитик"]),
+    ([], False, []),
+    (["  ", "!!!"], False, []),
+])
+def test_storages_search_alike(tmp_path, words, match_all, expected):
+    storages = [JSONStorage(str(tmp_path / "vacancies.json")), JSONLinesStorage(str(tmp_path / "vacancies.jsonl")),
+                SQLiteStorage(str(tmp_path / "vacancies.db"))]
+    for storage in storages:
+        storage.add_vacancies(SEARCH_VACANCIES)
+
+    for storage in storages:
+        assert [v.title for v in storage.search(words, match_all)] == expected, type(storage).__name__
+
+    storages[2].close()
@@ -0,0 +1,42 @@
+import random
+import pytest
+from src.utils import get_top_vacancies, sort_vacancies, top_vacancies
+from src.vacancy import Vacancy
+
+
+def make_vacancy(number, salary_from, salary_to=None, employer="Tech Company"):
+    return Vacancy(f"Developer {number}", f"https://hh.ru/vacancy/{number}", salary_from, salary_to, "RUR",
+                   employer=employer)
+
+
+def test_sort_vacancies_is_stable():
+
+    vacancies = [make_vacancy(1, 100000), make_vacancy(2, 200000), make_vacancy(3, 100000), make_vacancy(4, None)]
+
+    assert [v.url[-1] for v in sort_vacancies(vacancies)] == ['2', '1', '3', '4']
+
+
+def test_secondary_sort_keys():
+
+    vacancies = [make_vacancy(1, 100000, employer="Сбер"), make_vacancy(2, 50000, 150000, employer="Авито"),
+                 make_vacancy(3, 100000, employer="Авито")]
+
+    # Равная средняя зарплата упорядочивается по работодателю, затем по верхней границе
+    assert [v.url[-1] for v in sort_vacancies(vacancies, by=('avg_salary', 'employer'))] == ['2', '3', '1']
+    assert [v.url[-1] for v in sort_vacancies(vacancies, by=('avg_salary', 'salary_to'))] == ['2', '1', '3']
+    with pytest.raises(ValueError, match='Неизвестное поле сортировки'):
+        sort_vacancies(vacancies, by=('salary',))
+
+
+def test_top_vacancies_matches_full_sort():
+
+    rng = random.Random(0)
+    vacancies = [make_vacancy(n, rng.choice([None, rng.randrange(10) * 10000]), employer=rng.choice("ABC"))
+                 for n in range(500)]
+
+    for by in (('avg_salary',), ('avg_salary', 'employer'), ('employer', 'salary_from')):
+        assert [v.url for v in top_vacancies(vacancies, 10, by)] == [v.url for v in sort_vacancies(vacancies, by)[:10]]
+        assert [v.url for v in top_vacancies(iter(vacancies), 10, by)] == \
+            [v.url for v in get_top_vacancies(sort_vacancies(vacancies, by), 10)]
+    assert top_vacancies(vacancies, 0) == []
+    assert len(top_vacancies(vacancies[:3], 10)) == 3
@@ -1,4 +1,6 @@
-from src.vacancy import Vacancy
+import pytest
+import src.vacancy
+from src.vacancy import CastError, Vacancy
 
 
 def test_vacancy_creation():
@@ -403,6 +405,90 @@ def test_properties():
     print("✓ Свойства работают корректно")
 
 
+def test_vacancy_id():
+    """Тест сохранения идентификатора вакансии hh.ru"""
+    print("🧪 Тест идентификатора вакансии...")
+
+    vacancies = Vacancy.cast_to_object_list([
+        {'id': '93512345', 'name': 'Python Developer', 'alternate_url': 'https://hh.ru/vacancy/93512345'},
+        {'name': 'Java Developer', 'alternate_url': 'https://hh.ru/vacancy/2'}
+    ])
+
+    assert vacancies[0].vacancy_id == "93512345"
+    assert vacancies[1].vacancy_id == ""
+    assert Vacancy.from_dict(vacancies[0].to_dict()).vacancy_id == "93512345"
+
+    print("✓ Идентификатор вакансии сохраняется")
+
+
+def test_from_trusted():
+    """Тест создания вакансии из проверенных данных хранилища"""
+    print("🧪 Тест создания вакансии без валидации...")
+
+    vacancy = Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, 150000, "RUR", "Описание",
+                      "Требования", "Компания", "1")
+    trusted = Vacancy.from_dict(vacancy.to_dict(), trusted=True)
+
+    assert trusted.to_dict() == vacancy.to_dict()
+    assert trusted.search_text == vacancy.search_text
+    assert [v.to_dict() for v in Vacancy.from_dicts([vacancy.to_dict()])] == [vacancy.to_dict()]
+
+    print("✓ Вакансия из хранилища совпадает с исходной")
+
+
+def test_cast_with_report():
+    """Тест отчёта об ошибках разбора ответа API"""
+    print("🧪 Тест отчёта об ошибках разбора...")
+
+    report = Vacancy.cast_with_report([
+        {'name': 'Python Developer', 'alternate_url': 'https://hh.ru/vacancy/1',
+         'salary': {'from': -5, 'to': 'много', 'currency': None}, 'snippet': None, 'employer': None},
+        {'name': '', 'alternate_url': 'https://hh.ru/vacancy/2'},
+        {'name': 'Java Developer', 'alternate_url': 'ftp://hh.ru/vacancy/3'},
+        {'name': 'Go Developer', 'alternate_url': 'https://hh.ru/vacancy/4'}
+    ])
+
+    assert [vacancy.title for vacancy in report.vacancies] == ["Python Developer", "Go Developer"]
+    assert (report.vacancies[0].salary_from, report.vacancies[0].salary_to) == (0, 0)
+    assert report.vacancies[0].currency == report.vacancies[0].employer == ""
+    assert [error.position for error in report.errors] == [1, 2]
+    assert all(isinstance(error, CastError) for error in report.errors)
+
+    # Разбор ответа API и конструктор сообщают об ошибках одинаково
+    for error, (title, url) in zip(report.errors, [('', 'https://hh.ru/vacancy/2'),
+                                                   ('Java Developer', 'ftp://hh.ru/vacancy/3')]):
+        with pytest.raises(ValueError) as exc_info:
+            Vacancy(title, url)
+        assert error.message == f"Ошибка при создании вакансии: {exc_info.value}"
+
+    print("✓ Некорректные записи попадают в отчёт")
+
+
+def test_cast_with_report_processes():
+    """Тест разбора большой выгрузки пулом процессов"""
+    print("🧪 Тест разбора пулом процессов...")
+
+    vacancies_data = [
+        {'id': str(number), 'name': f"Вакансия {number}", 'alternate_url': f"https://hh.ru/vacancy/{number}",
+         'salary': {'from': number * 1000, 'to': None, 'currency': 'RUR'}}
+        for number in range(40)
+    ]
+    vacancies_data[25]['alternate_url'] = ''
+    threshold = src.vacancy.PARALLEL_MIN_RECORDS
+    src.vacancy.PARALLEL_MIN_RECORDS = 10
+    try:
+        report = Vacancy.cast_with_report(vacancies_data, processes=2)
+    finally:
+        src.vacancy.PARALLEL_MIN_RECORDS = threshold
+
+    expected = Vacancy.cast_with_report(vacancies_data)
+    assert [vacancy.to_dict() for vacancy in report.vacancies] == [vacancy.to_dict() for vacancy in expected.vacancies]
+    assert report.errors == expected.errors
+    assert [error.position for error in report.errors] == [25]
+
+    print("✓ Результат пула совпадает с разбором в текущем процессе")
+
+
 def run_all_tests():
     """Запуск всех тестов"""
     print("🚀 Запуск тестов для класса Vacancy\n")
@@ -419,6 +505,10 @@ def run_all_tests():
         test_from_dict_minimal,
         test_cast_to_object_list,
         test_properties,
+        test_vacancy_id,
+        test_from_trusted,
+        test_cast_with_report,
+        test_cast_with_report_processes,
     ]
 
     failed_tests = []
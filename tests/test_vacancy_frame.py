@@ -0,0 +1,86 @@
+from src.vacancy import Vacancy
+from src.vacancy_frame import VacancyFrame
+from src.utils import get_vacancies_by_salary, sort_vacancies
+
+
+def make_vacancies():
+    return [
+        Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, 150000, "RUR", employer="Яндекс"),
+        Vacancy("Java Developer", "https://hh.ru/vacancy/2", 200000, None, "RUR", employer="Сбер"),
+        Vacancy("Go Developer", "https://hh.ru/vacancy/3", None, 3000, "USD", employer="Яндекс"),
+        Vacancy("QA Engineer", "https://hh.ru/vacancy/4", None, None, "", employer="Ozon"),
+        Vacancy("Data Scientist", "https://hh.ru/vacancy/5", 125000, None, "RUR", employer="Сбер"),
+    ]
+
+
+def titles(vacancies):
+    return [vacancy.title for vacancy in vacancies]
+
+
+def test_columns_and_round_trip():
+
+    vacancies = make_vacancies()
+    frame = VacancyFrame(vacancies)
+
+    assert len(frame) == 5
+    assert list(frame.salary_from) == [100000, 200000, 0, 0, 125000]
+    assert list(frame.avg_salary) == [125000.0, 200000.0, 3000.0, 0.0, 125000.0]
+    assert frame.currencies == ["RUR", "RUR", "USD", "", "RUR"]
+    assert frame.employers == ["Яндекс", "Сбер", "Яндекс", "Ozon", "Сбер"]
+    assert frame.to_list() == vacancies
+    assert all(a is b for a, b in zip(frame, vacancies))
+
+
+def test_salary_between_matches_utils():
+
+    vacancies = make_vacancies()
+    frame = VacancyFrame(vacancies)
+
+    assert titles(frame.salary_between(100000, 150000)) == titles(get_vacancies_by_salary(vacancies, "100000-150000"))
+    assert titles(frame.salary_between(125000)) == ["Python Developer", "Java Developer", "Data Scientist"]
+    assert len(frame.salary_between(300000)) == 0
+
+
+def test_sort_and_top_are_stable():
+
+    vacancies = make_vacancies()
+    frame = VacancyFrame(vacancies)
+
+    expected = ["Java Developer", "Python Developer", "Data Scientist", "Go Developer", "QA Engineer"]
+    assert titles(frame.sort_by_salary()) == expected
+    salaries = [v.get_avg_salary() for v in sort_vacancies(vacancies)]
+    assert [v.get_avg_salary() for v in frame.sort_by_salary()] == salaries
+    assert titles(frame.sort_by_salary(reverse=False))[:2] == ["QA Engineer", "Go Developer"]
+    # Топ без готового порядка и с ним даёт одинаковый результат
+    assert titles(VacancyFrame(vacancies).top(3)) == expected[:3]
+    assert titles(frame.top(3)) == expected[:3]
+    assert len(frame.top(-1)) == 0
+
+
+def test_dictionary_encoded_filters():
+
+    frame = VacancyFrame(make_vacancies())
+
+    assert titles(frame.with_employer("Сбер")) == ["Java Developer", "Data Scientist"]
+    assert titles(frame.with_currency("USD")) == ["Go Developer"]
+    assert len(frame.with_employer("Неизвестный")) == 0
+    # Выборка из выборки использует общие словари значений
+    assert titles(frame.with_currency("RUR").salary_between(120000).top(1)) == ["Java Developer"]
+
+
+def test_views_share_columns_and_keep_order():
+
+    vacancies = make_vacancies()
+    frame = VacancyFrame(vacancies)
+    cold = frame.salary_between(100000, 200000)
+    frame.sort_by_salary()
+    # С построенным порядком диапазон ищется двоичным поиском, результат тот же
+    warm = frame.salary_between(100000, 200000)
+
+    assert titles(cold) == titles(warm) == ["Python Developer", "Java Developer", "Data Scientist"]
+    assert all(a is b for a, b in zip(warm, [vacancies[0], vacancies[1], vacancies[4]]))
+    assert list(warm.salary_from) == [100000, 200000, 125000]
+    assert warm.employers == ["Яндекс", "Сбер", "Сбер"]
+    # Фильтр выборки, отсортированной по зарплате, сохраняет её порядок
+    assert titles(frame.sort_by_salary().salary_between(100000)) == ["Java Developer", "Python Developer",
+                                                                     "Data Scientist"]
@@ -0,0 +1,88 @@
+import random
+from src.utils import filter_vacancies, get_vacancies_by_salary, sort_vacancies
+from src.vacancy import Vacancy
+from src.vacancy_query import CRITERIA_COST, FIRST_CHUNK_SIZE, KEYWORDS_COST, VacancyQuery
+
+
+def make_vacancies(count=300):
+    rng = random.Random(0)
+    return [
+        Vacancy(rng.choice(["Python Developer", "Java Developer", "Data Scientist"]), f"https://hh.ru/vacancy/{n}",
+                rng.choice([None, rng.randrange(20) * 10000]), rng.choice([None, rng.randrange(20) * 10000]), "RUR",
+                description=rng.choice(["Django", "Spring", "ML"]), employer=rng.choice(["Яндекс", "Сбер"]))
+        for n in range(count)
+    ]
+
+
+def urls(vacancies):
+    return [vacancy.url for vacancy in vacancies]
+
+
+def test_query_matches_chained_utils():
+
+    vacancies = make_vacancies()
+    expected = get_vacancies_by_salary(filter_vacancies(vacancies, ["python", "ml"]), "50000-150000")
+
+    query = VacancyQuery(vacancies).keywords(["python", "ml"]).salary("50000-150000")
+    assert urls(query.to_list()) == urls(expected)
+    assert query.count() == len(expected)
+    assert urls(query.top(5)) == urls(sort_vacancies(expected)[:5])
+    assert urls(query.sort(('employer', 'avg_salary'))) == urls(sort_vacancies(expected, ('employer', 'avg_salary')))
+
+
+def test_empty_conditions_are_ignored():
+
+    vacancies = make_vacancies(10)
+
+    assert urls(VacancyQuery(vacancies).keywords([]).salary("").where({}).to_list()) == urls(vacancies)
+    assert urls(VacancyQuery(vacancies).salary("неверно").to_list()) == urls(vacancies)
+
+
+def test_where_and_immutable_builders():
+
+    vacancies = make_vacancies()
+    base = VacancyQuery(vacancies).where({'employer': {'eq': 'Сбер'}})
+    narrowed = base.salary((100000, float('inf')))
+
+    assert all(v.employer == 'Сбер' for v in base)
+    assert all(v.get_avg_salary() >= 100000 for v in narrowed)
+    assert base.count() > narrowed.count()
+
+
+def test_limit_stops_reading_source():
+
+    consumed = []
+
+    def source():
+        for vacancy in make_vacancies(10000):
+            consumed.append(vacancy)
+            yield vacancy
+
+    result = VacancyQuery(source()).keywords(["python"]).limit(3).to_list()
+
+    assert len(result) == 3
+    assert len(consumed) < 200
+    assert VacancyQuery(make_vacancies(10)).limit(5).limit(2).count() == 2
+
+
+def test_cheap_and_selective_filters_are_checked_first():
+
+    calls = {'keywords': 0, 'broad': 0}
+    vacancies = make_vacancies(5000)
+
+    def counting(name, result):
+        def predicate(vacancy):
+            calls[name] += 1
+            return result
+        return predicate
+
+    # Дорогой поиск по словам не выполняется: дешёвый фильтр по зарплате отсеивает всё раньше
+    query = VacancyQuery(vacancies)._with_filter(KEYWORDS_COST, counting('keywords', True)).salary((10**9, 10**10))
+    assert query.to_list() == []
+    assert calls['keywords'] == 0
+
+    # При равной стоимости после первой порции вперёд выходит условие, отсеивающее больше вакансий
+    query = VacancyQuery(vacancies)._with_filter(CRITERIA_COST, counting('broad', True))
+    query = query._with_filter(CRITERIA_COST, lambda vacancy: False)
+    assert query.to_list() == []
+    assert calls['broad'] == FIRST_CHUNK_SIZE